@@ -28,16 +28,34 @@ if __name__ == "__main__":
     max_UAC_attibutes = settings_loader.get_value('primarykeys.max_UAC_attibutes')
     pk_max_value_length = settings_loader.get_value('primarykeys.max_value_length')
     pk_name_suffix = settings_loader.get_value('primarykeys.name_suffix')
-    ind_speed_mode = settings_loader.get_value('inclusion_dependencies.speed_mode')
     find_max_ind = settings_loader.get_value('inclusion_dependencies.find_max_ind')
     pk_metric = settings_loader.get_value('metrics.pk_metric')
     fk_metric = settings_loader.get_value('metrics.fk_metric')
+    ind_arguments = settings_loader.get_arguments({
+        "speed_mode": 'inclusion_dependencies.speed_mode',
+        "unary_engine": 'inclusion_dependencies.unary_engine',
+        "value_cache_size": 'inclusion_dependencies.value_cache_size',
+        "unary_workers": 'inclusion_dependencies.unary_workers',
+        "approximate_epsilon": 'inclusion_dependencies.approximate_epsilon',
+        "approximate_delta": 'inclusion_dependencies.approximate_delta',
+        "max_ind_time_budget": 'inclusion_dependencies.max_ind_time_budget',
+        "max_ind_datastorage_time_budget": 'inclusion_dependencies.max_ind_datastorage_time_budget',
+        "posting_list_cache_size": 'inclusion_dependencies.posting_list_cache_size',
+        "nary_workers": 'inclusion_dependencies.nary_workers'
+    })
+    fk_arguments = settings_loader.get_arguments({
+        "similarity_cache_path": 'similarity_cache.filepath',
+        "similarity_cache_size": 'similarity_cache.max_entries',
+        "fk_metric": 'metrics.fk_metric',
+        "compute_all_fk_metrics": 'metrics.compute_all_fk_metrics'
+    })
     export_file_path = settings_loader.get_value('dataexport.filepath')
 
     print("Connect to DB:")
     with Timer():
         DBConnector = DBConnector(sql_type, sql_host, sql_port, sql_user, sql_password, sql_database_name)
     DBConnector.connect()    
+    DBConnector.create_schema()
     DBConnector.delete_everything()  
 
     # print("Import MongoDB:")
@@ -78,11 +96,11 @@ if __name__ == "__main__":
 
     print("Find INDs:")
     with Timer():
-        INDFinder(DBConnector, find_max_ind, ind_speed_mode)
+        INDFinder(DBConnector, find_max_ind, **ind_arguments)
 
     print("Find Foreignkey:")
     with Timer():
-        ForeignkeyFinder(DBConnector)
+        ForeignkeyFinder(DBConnector, **fk_arguments)
         
     print("Calculate Results:")
     with Timer():
@@ -221,14 +221,32 @@ def start_analysing(databases_to_import, results_dir_path):
     max_UAC_attibutes = settings_loader.get_value('primarykeys.max_UAC_attibutes')
     pk_max_value_length = settings_loader.get_value('primarykeys.max_value_length')
     pk_name_suffix = settings_loader.get_value('primarykeys.name_suffix')
-    ind_speed_mode = settings_loader.get_value('inclusion_dependencies.speed_mode')
     find_max_ind = settings_loader.get_value('inclusion_dependencies.find_max_ind')
     pk_metric = settings_loader.get_value('metrics.pk_metric')
     fk_metric = settings_loader.get_value('metrics.fk_metric')
+    ind_arguments = settings_loader.get_arguments({
+        "speed_mode": 'inclusion_dependencies.speed_mode',
+        "unary_engine": 'inclusion_dependencies.unary_engine',
+        "value_cache_size": 'inclusion_dependencies.value_cache_size',
+        "unary_workers": 'inclusion_dependencies.unary_workers',
+        "approximate_epsilon": 'inclusion_dependencies.approximate_epsilon',
+        "approximate_delta": 'inclusion_dependencies.approximate_delta',
+        "max_ind_time_budget": 'inclusion_dependencies.max_ind_time_budget',
+        "max_ind_datastorage_time_budget": 'inclusion_dependencies.max_ind_datastorage_time_budget',
+        "posting_list_cache_size": 'inclusion_dependencies.posting_list_cache_size',
+        "nary_workers": 'inclusion_dependencies.nary_workers'
+    })
+    fk_arguments = settings_loader.get_arguments({
+        "similarity_cache_path": 'similarity_cache.filepath',
+        "similarity_cache_size": 'similarity_cache.max_entries',
+        "fk_metric": 'metrics.fk_metric',
+        "compute_all_fk_metrics": 'metrics.compute_all_fk_metrics'
+    })
 
     # Connect to database
     dbConnector = DBConnector(sql_type, sql_host, sql_port, sql_user, sql_password, sql_database_name)
     dbConnector.connect()
+    dbConnector.create_schema()
     dbConnector.delete_everything()
 
     runtime_metrics["time_load_settings"] = time.time() - start_time
@@ -265,6 +283,7 @@ def start_analysing(databases_to_import, results_dir_path):
         else:
             continue
     
+    dbConnector.save_bloom_filters()
     runtime_metrics["time_data_import"] = time.time() - start_time_import
     
 
@@ -287,7 +306,7 @@ def start_analysing(databases_to_import, results_dir_path):
 
 
     # NOTE: comment out if only max INDs are needed
-    ind_finder = INDFinder(dbConnector, find_max_ind, ind_speed_mode)
+    ind_finder = INDFinder(dbConnector, find_max_ind, **ind_arguments)
     ind_finder_time_metrics = ind_finder.find_inds()
     runtime_metrics["time_INDFinder"] = ind_finder_time_metrics
 
@@ -297,8 +316,9 @@ def start_analysing(databases_to_import, results_dir_path):
 
 
     start_time_FKFinder = time.time()
-    ForeignkeyFinder(dbConnector)
+    fk_finder = ForeignkeyFinder(dbConnector, **fk_arguments)
     runtime_metrics["time_FKFinder"] = time.time() - start_time_FKFinder
+    runtime_metrics["similarity_cache_metrics"] = fk_finder.similarity_cache_metrics
 
     start_time_ResultCalculator = time.time()
     ResultCalculator(dbConnector, pk_metric, fk_metric)
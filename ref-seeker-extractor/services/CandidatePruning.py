@@ -0,0 +1,123 @@
+import numpy as np
+
+class CandidatePruner:
+    """
+    Prunes the candidates for unary Inclusion Dependencies (INDs) with the features of the attributes. All pairs of
+    child and parent attributes are checked at once with a boolean matrix.
+    """
+
+    # Type families as bitmask of the string forms, that the values of a type have after the import with str():
+    # 1 numbers, 2 "True" and "False", 4 dates and times, 8 hexadecimal strings with 24 digits (ObjectId). A child and
+    # a parent must share at least one family, because all values are compared as strings. Integers and decimals
+    # with 24 digits are also hexadecimal strings. Strings, DBRefs (the ID can have any type) and unknown types are
+    # compatible with every family.
+    TYPE_FAMILIES = {
+        "int": 9, "Int64": 9, "long": 9, "Decimal": 9, "Decimal128": 9,
+        "float": 1,
+        "bool": 2,
+        "datetime": 4, "date": 4, "time": 4, "Timestamp": 4,
+        "ObjectId": 8
+    }
+    ALL_TYPE_FAMILIES = 15
+
+    def __init__(self, connector):
+        """
+        Initializes the pruner and loads the features of all attributes.
+
+        Args:
+            connector (DBConnector): An instance of DBConnector used for database connections.
+        """
+        self.connector = connector
+        self.metrics = {}
+        self._load_features()
+
+    def _load_features(self):
+        """
+        Loads the features of all attributes into arrays. The position of an attribute is stored in self.positions.
+        """
+        features = self.connector.get_attribute_pruning_features()
+        self.positions = {feature["attribute_id"]: i for i, feature in enumerate(features)}
+        self.distinct_counts = np.array([feature["number_of_distinct_values"] for feature in features], dtype=np.int64)
+        self.min_lengths = np.array([feature["min_value_length"] for feature in features], dtype=np.int64)
+        self.max_lengths = np.array([feature["max_value_length"] for feature in features], dtype=np.int64)
+        # Integer ranges only for attributes with integers only
+        self.only_integers = np.array([feature["number_of_integer_values"] == feature["number_of_values"]
+                                       for feature in features], dtype=bool)
+        self.min_integers = np.array([feature["min_integer_value"] if feature["min_integer_value"] is not None else 0
+                                      for feature in features], dtype=np.float64)
+        self.max_integers = np.array([feature["max_integer_value"] if feature["max_integer_value"] is not None else 0
+                                      for feature in features], dtype=np.float64)
+        self.type_families = np.array([self._get_type_families(feature["attribute_types"]) for feature in features],
+                                      dtype=np.int64)
+
+    def _get_type_families(self, attribute_types):
+        """
+        Calculates the bitmask of the type families of an attribute.
+
+        Args:
+            attribute_types (list[str]): The types of the values of the attribute.
+
+        Returns:
+            int: The bitmask of the type families.
+        """
+        type_families = 0
+        for attribute_type in attribute_types:
+            type_families |= self.TYPE_FAMILIES.get(attribute_type, self.ALL_TYPE_FAMILIES)
+        return type_families
+
+    def get_candidates(self, list_child_ids, list_child_datastorage_ids, list_parent_ids, list_parent_datastorage_ids,
+                       approximate=False):
+        """
+        Calculates the plausible pairs of children and parents. The number of pairs, that are eliminated by every
+        rule, is saved in self.metrics. A pair is only counted for the first rule, that eliminates it.
+
+        Args:
+            list_child_ids (list[int]): The IDs of the possible child attributes.
+            list_child_datastorage_ids (list[int]): The datastorage IDs of the children.
+            list_parent_ids (list[int]): The IDs of the possible parent attributes.
+            list_parent_datastorage_ids (list[int]): The datastorage IDs of the parents.
+            approximate (bool): If true only the rules, that are valid for approximate INDs, are used. The rules
+                                with counts and bounds can eliminate children with few violating values.
+
+        Returns:
+            numpy.ndarray: Boolean matrix with one row per child and one column per parent. True if the pair is a
+                           candidate.
+        """
+        # Attributes without values have no features and are never children or parents
+        child_known = np.array([child_id in self.positions for child_id in list_child_ids], dtype=bool)
+        parent_known = np.array([parent_id in self.positions for parent_id in list_parent_ids], dtype=bool)
+        child_positions = np.array([self.positions.get(child_id, 0) for child_id in list_child_ids], dtype=np.int64)
+        parent_positions = np.array([self.positions.get(parent_id, 0) for parent_id in list_parent_ids],
+                                    dtype=np.int64)
+        child_datastorages = np.array(list_child_datastorage_ids, dtype=np.int64)
+        parent_datastorages = np.array(list_parent_datastorage_ids, dtype=np.int64)
+
+        def column(array, positions):
+            return array[positions][:, np.newaxis]
+
+        def row(array, positions):
+            return array[positions][np.newaxis, :]
+
+        rules = [
+            ("no_values", ~(child_known[:, np.newaxis] & parent_known[np.newaxis, :])),
+            ("same_datastorage", child_datastorages[:, np.newaxis] == parent_datastorages[np.newaxis, :]),
+            ("type", (column(self.type_families, child_positions) & row(self.type_families, parent_positions)) == 0),
+            ("distinct_count", column(self.distinct_counts, child_positions)
+                               > row(self.distinct_counts, parent_positions)),
+            ("value_length", (column(self.min_lengths, child_positions) < row(self.min_lengths, parent_positions))
+                             | (column(self.max_lengths, child_positions) > row(self.max_lengths, parent_positions))),
+            ("integer_range", column(self.only_integers, child_positions) & row(self.only_integers, parent_positions)
+                              & ((column(self.min_integers, child_positions)
+                                  < row(self.min_integers, parent_positions))
+                                 | (column(self.max_integers, child_positions)
+                                    > row(self.max_integers, parent_positions))))
+        ]
+        if approximate:
+            rules = rules[:3]
+        candidates = np.ones((len(list_child_ids), len(list_parent_ids)), dtype=bool)
+        self.metrics = {"number_of_pairs": int(candidates.size)}
+        for rule_name, eliminated in rules:
+            self.metrics[rule_name] = int(np.count_nonzero(candidates & eliminated))
+            candidates &= ~eliminated
+        self.metrics["number_of_candidates"] = int(np.count_nonzero(candidates))
+        return candidates
@@ -13,6 +13,8 @@ class ContainerUACs:
         """
         self.containerPartUACs = containerPartUACs
         self.items = []
+        # Index for the lookup by ID
+        self.items_by_id = {}
 
     def add_UAC(self, UAC_id, server_id, database_id, datastorage_id, list_attributes, hopf_score=None, iris_score=None):
         """
@@ -29,11 +31,24 @@ class ContainerUACs:
         """
         UAC = UniqueAttributeCombination(UAC_id, server_id, database_id, datastorage_id, list_attributes, hopf_score, iris_score)
         self.items.append(UAC)
+        self.items_by_id[UAC_id] = UAC
         # Adds attributes from UACs
         if self.containerPartUACs is not None:
             for attribute_id in list_attributes:
                 self.containerPartUACs.add_partUAC(server_id, database_id, datastorage_id, attribute_id)
 
+    def get_UAC(self, UAC_id):
+        """
+        Returns the UAC with the given ID.
+
+        Args:
+            UAC_id (int): Unique identifier for the UAC.
+
+        Returns:
+            UniqueAttributeCombination: The UAC. None if there is no UAC with the ID.
+        """
+        return self.items_by_id.get(UAC_id)
+
     def __iter__(self):
         """
         Yields each UAC stored in the container.
@@ -57,6 +72,8 @@ class UniqueAttributeCombination:
     """
     Represents a single Unique Attribute Combination (UAC) with optional scoring metrics.
     """
+    __slots__ = ("UAC_id", "server_id", "database_id", "datastorage_id", "list_attributes", "hopf_score", "iris_score")
+
     def __init__(self, UAC_id, server_id, database_id, datastorage_id, list_attributes, hopf_score, iris_score):
         """
         Initializes a UAC with identifiers and scores.
@@ -150,7 +167,9 @@ class ContainerSingleAttributeFromUAC:
         Initializes the container for storing single attributes.
         """
         self.items = []
-    
+        # Index for the lookup by ID
+        self.items_by_id = {}
+
     def add_partUAC(self, server_id, database_id, datastorage_id, attribute_id):
         """
         Adds a single attribute extracted from a UAC to the container if not already present.
@@ -161,15 +180,23 @@ class ContainerSingleAttributeFromUAC:
             datastorage_id (int): Data storage identifier.
             attribute_id (int): Attribute identifier.
         """     
-        if len(self.items) == 0:
+        # Check if attribute is already in the list
+        if attribute_id not in self.items_by_id:
             new_partUAC = SingleAttributeFromUAC(server_id, database_id, datastorage_id, attribute_id)
             self.items.append(new_partUAC)
-        else:
-            # Check if attribute is already in the list
-            already_in_list = any(attribute_id == partUAC.get_attribute_id() for partUAC in self.items)
-            if not already_in_list:
-                new_partUAC = SingleAttributeFromUAC(server_id, database_id, datastorage_id, attribute_id)
-                self.items.append(new_partUAC)
+            self.items_by_id[attribute_id] = new_partUAC
+
+    def get_partUAC(self, attribute_id):
+        """
+        Returns the single attribute with the given attribute ID.
+
+        Args:
+            attribute_id (int): Attribute identifier.
+
+        Returns:
+            SingleAttributeFromUAC: The single attribute. None if there is no attribute with the ID.
+        """
+        return self.items_by_id.get(attribute_id)
 
     def __iter__(self):
         """
@@ -270,6 +297,9 @@ class ContainerAttributes:
         Initializes an empty list to store attributes.
         """
         self.items = []
+        # Indexes for the lookup by ID and datastorage
+        self.items_by_id = {}
+        self.items_by_datastorage = {}
 
     def add_attribute(self, server_id, database_id, datastorage_id, attribute_id, min = None, max = None, name = None):
         """
@@ -286,6 +316,32 @@ class ContainerAttributes:
         """
         attribute = Attribute(server_id, database_id, datastorage_id, attribute_id, min, max, name)
         self.items.append(attribute)
+        self.items_by_id[attribute_id] = attribute
+        self.items_by_datastorage.setdefault(datastorage_id, []).append(attribute)
+
+    def get_attribute(self, attribute_id):
+        """
+        Returns the attribute with the given ID.
+
+        Args:
+            attribute_id (int): Unique identifier for the attribute.
+
+        Returns:
+            Attribute: The attribute. None if there is no attribute with the ID.
+        """
+        return self.items_by_id.get(attribute_id)
+
+    def get_attributes_of_datastorage(self, datastorage_id):
+        """
+        Returns the attributes of the given datastorage in the order they were added.
+
+        Args:
+            datastorage_id (int): Identifier for the data storage.
+
+        Returns:
+            list: The attributes of the datastorage.
+        """
+        return self.items_by_datastorage.get(datastorage_id, [])
 
     def __iter__(self):
         """
@@ -310,6 +366,9 @@ class Attribute:
     """
     Represents a single attribute, encapsulating details like identifier, server, database, and data storage location.
     """
+    __slots__ = ("server_id", "database_id", "datastorage_id", "attribute_id", "min", "max", "name", "is_array",
+                 "list_INDs")
+
     def __init__(self, server_id, database_id, datastorage_id, attribute_id, min = None, max = None, name = None):
         """
         Initializes the Attribute instance with the provided details.
@@ -501,6 +560,9 @@ class InclusionDenpendcy:
     """
     Represents an Inclusion Dependency (IND) linking child attributes to a parent attribute set known as a Unique Attribute Combination (UAC).
     """
+    __slots__ = ("IND_id", "UAC_id", "child_server_id", "child_db_id", "child_datastorage_id", "child_attributes",
+                 "hopf_probability", "iris_probability", "hybrid_only_name_probability", "hybrid_probability", "UAC")
+
     def __init__(self, IND_id, UAC_id, child_server_id, child_db_id, child_datastorage_id, child_attributes, 
                  hopf_probability=None, iris_probability=None, hybrid_only_name_probability=None, hybrid_probability=None):
         """
@@ -1,8 +1,14 @@
 import mariadb
 import psycopg2
+from services.Sketches import HyperLogLog
+from services.Sketches import BloomFilter
+from services.EntryBitmaps import EntryBitmap
 
 class DBConnector:
 
+    # Version of the schema, every migration increments the version
+    SCHEMA_VERSION = 2
+
     def __init__(self, DBType, host, port, user, password, database):
         """
         Initializes the DBConnector object with connection parameters.
@@ -23,12 +29,20 @@ class DBConnector:
         self.database = database
         self.connection = None
         self.list_values_batchimport = []
+        # HyperLogLog sketches for every attribute, build during the import
+        self.distinct_sketches = {}
+        # Bloom filters for every attribute, build during the import and saved in the table "bloom_filters"
+        self.bloom_filters = {}
+        # Bitmaps of the entry numbers for every attribute, loaded on the first use after the import
+        self.entry_bitmaps = None
+        # Counter for the names of the server-side cursors of query_stream
+        self.number_of_stream_cursors = 0
 
     # Basic functions
 
     def connect(self):
         """
-        Establishes a connection to the MariaDB database.
+        Establishes a connection to the MariaDB database. The tables aren't created, see create_schema.
 
         Returns:
             bool: True if the connection is successful, False otherwise.
@@ -43,21 +57,6 @@ class DBConnector:
                     database=self.database
                 )
                 self.connection.auto_reconnect= True
-                self._create_table_servers()
-                self._create_table_loadeddatabases()
-                self._create_table_datastorage()
-                self._create_table_attributes()
-                self._create_table_values()
-                self._create_table_uniqueattributecombinations()
-                self._create_table_inclusiondependencies()
-                self._create_table_max_inclusiondependencies()
-                self._create_table_implicitly_references()
-                self._create_table_explicit_references()
-                self._create_table_primarykeys()
-                self._create_view_inclusionsdependencies()
-                self._create_view_explicite_references()
-                self._create_view_implicitly_references()
-                self._create_view_primarykeys()
                 return True
             except mariadb.Error as err:
                 print(f"Error: {err}")
@@ -72,21 +71,6 @@ class DBConnector:
                     database=self.database
                 )
                 self.connection.autocommit = True
-                self._create_table_servers()
-                self._create_table_loadeddatabases()
-                self._create_table_datastorage()
-                self._create_table_attributes()
-                self._create_table_values()
-                self._create_table_uniqueattributecombinations()
-                self._create_table_inclusiondependencies()
-                self._create_table_max_inclusiondependencies()
-                self._create_table_implicitly_references()
-                self._create_table_explicit_references()
-                self._create_table_primarykeys()
-                self._create_view_inclusionsdependencies()
-                self._create_view_explicite_references()
-                self._create_view_implicitly_references()
-                self._create_view_primarykeys()
                 return True
             except psycopg2.Error as err:
                 print(f"Error: {err}")
@@ -134,6 +118,52 @@ class DBConnector:
                 if cursor:
                     cursor.close()                
 
+    def query_stream(self, query, parameters=None, batch_size=10000):
+        """
+        Returns the results of the query row by row. The rows are fetched in batches. PostgreSQL uses a server-side
+        cursor, because the default cursor of psycopg2 loads the whole result into the memory.
+
+        Args:
+            query (str): The query to execute.
+            parameters (list): List with the optinal parameters.
+            batch_size (int): Number of rows per batch.
+
+        Yields:
+            tuple: The next row.
+        """
+        if not self.connection:
+            print("Not connected to DB.")
+            return
+
+        if self.DBType == "MariaDB":
+            error_type = mariadb.Error
+        elif self.DBType == "PostgreSQL":
+            error_type = psycopg2.Error
+        cursor = None
+        try:
+            if self.DBType == "PostgreSQL":
+                # Named cursors are server-side, WITH HOLD allows them in autocommit mode
+                self.number_of_stream_cursors += 1
+                cursor = self.connection.cursor(name=f"stream_{self.number_of_stream_cursors}", withhold=True)
+                cursor.itersize = batch_size
+            else:
+                cursor = self.connection.cursor()
+            if parameters:
+                cursor.execute(query, parameters)
+            else:
+                cursor.execute(query)
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+        except error_type as err:
+            print(f"Error executing query: {err}")
+        finally:
+            if cursor:
+                cursor.close()
+
     def query_wo_return(self, query):
         """
         Makes a query, without anything to retrun.
@@ -166,12 +196,13 @@ class DBConnector:
                 if cursor:
                     cursor.close()     
 
-    def query_update(self, query):
+    def query_update(self, query, parameters=None):
         """
         Returns results of query.
 
         Args:
             query (str): The query to execute.
+            parameters (list): List with the optinal parameters.
 
         Returns:
             list: Query result.
@@ -183,7 +214,10 @@ class DBConnector:
         if self.DBType == "MariaDB":
             try:
                 cursor = self.connection.cursor()
-                cursor.execute(query)
+                if parameters:
+                    cursor.execute(query, parameters)
+                else:
+                    cursor.execute(query)
                 self.connection.commit() 
             except mariadb.Error as err:
                 print(f"Error creating table: {err}")
@@ -193,7 +227,10 @@ class DBConnector:
         elif self.DBType == "PostgreSQL":
             try:
                 cursor = self.connection.cursor()
-                cursor.execute(query)
+                if parameters:
+                    cursor.execute(query, parameters)
+                else:
+                    cursor.execute(query)
                 self.connection.commit() 
             except psycopg2.Error as err:
                 print(f"Error creating table: {err}")
@@ -248,6 +285,9 @@ class DBConnector:
             DELETE FROM servers;
         """
         self.query_wo_return(query)
+        self.distinct_sketches = {}
+        self.bloom_filters = {}
+        self.entry_bitmaps = None
 
     def close(self):
         """
@@ -257,6 +297,83 @@ class DBConnector:
         if self.connection:
             self.connection.close()
 
+    def create_schema(self):
+        """
+        Creates the missing tables and migrates the tables of older versions. Must be called once after the first
+        connect of a job, the connections of the worker processes don't change the schema. The migrations and the
+        views only run, if the schema version of the database is older than SCHEMA_VERSION.
+        """
+        self._create_table_schema_version()
+        self._create_table_servers()
+        self._create_table_loadeddatabases()
+        self._create_table_datastorage()
+        self._create_table_attributes()
+        self._create_table_values()
+        self._create_table_uniqueattributecombinations()
+        self._create_table_inclusiondependencies()
+        self._create_table_max_inclusiondependencies()
+        self._create_table_implicitly_references()
+        self._create_table_explicit_references()
+        self._create_table_primarykeys()
+        self._create_table_bloom_filters()
+        self._create_table_unary_inclusiondependencies()
+        schema_version = self._get_schema_version()
+        if schema_version >= self.SCHEMA_VERSION:
+            return
+        migrations = [self._migrate_to_version_1, self._migrate_to_version_2]
+        for migration in migrations[schema_version:]:
+            migration()
+        # The views use the columns of the migrations
+        self._create_view_inclusionsdependencies()
+        self._create_view_explicite_references()
+        self._create_view_implicitly_references()
+        self._create_view_primarykeys()
+        self._set_schema_version(self.SCHEMA_VERSION)
+
+    def _get_schema_version(self):
+        """
+        Returns the schema version of the database.
+
+        Returns:
+            int: The version, 0 for a database without version.
+        """
+        query_result = self.query("SELECT MAX(version) FROM schema_version;")
+        if not query_result or query_result[0][0] is None:
+            return 0
+        return int(query_result[0][0])
+
+    def _set_schema_version(self, schema_version):
+        """
+        Stores the schema version of the database.
+
+        Args:
+            schema_version (int): The version.
+        """
+        self.query_wo_return("DELETE FROM schema_version;")
+        self.query_wo_return(f"INSERT INTO schema_version (version) VALUES ({schema_version});")
+
+    def _migrate_to_version_1(self):
+        """
+        Adds the coverage of approximate INDs to the tables of older versions.
+        """
+        query = """
+            ALTER TABLE inclusion_dependencies ADD COLUMN IF NOT EXISTS coverage FLOAT;
+        """
+        self.query_wo_return(query)
+        query = """
+            ALTER TABLE max_inclusion_dependencies ADD COLUMN IF NOT EXISTS coverage FLOAT;
+        """
+        self.query_wo_return(query)
+
+    def _migrate_to_version_2(self):
+        """
+        Adds the flag of the exhaustive maximal IND search to the datastorages of older versions.
+        """
+        query = """
+            ALTER TABLE datastorage ADD COLUMN IF NOT EXISTS max_ind_exhaustive BOOLEAN;
+        """
+        self.query_wo_return(query)
+
     # Functions to create tables
 
     def _table_exists(self, table_name):
@@ -452,7 +569,9 @@ class DBConnector:
             INSERT INTO {table_name} (attribute_id, entry_no, value, value_type, length, position)
             VALUES (%s, %s, %s, %s, %s, %s);
         """
-        self.query_insert(insert_query, (attribute_id, entry_no, value, value_type, value_length, position))    
+        self.query_insert(insert_query, (attribute_id, entry_no, value, value_type, value_length, position))
+        self._add_value_to_sketches(attribute_id, value)
+        self.entry_bitmaps = None
 
     def add_UAC(self, server, database, datastorage, attributes):
         """
@@ -505,45 +624,55 @@ class DBConnector:
 
         return new_entry_id 
 
-    def add_UAC_PKscores(self, UAC_id, score_cardinality, score_valuelenght, score_position, score_namesuffix, score_datatype):
+    def add_UAC_PKscores_batch(self, list_scores):
         """
-        Adds a PK scores to the given UAC.
+        Adds the PK scores to many UACs with one update.
 
         Args:
-            UAC_id (int): The ID of the UAC.
-            score_cardinality (float): Score for the cardinality.
-            score_valuelenght (float): Score for the value lenght.
-            score_position (float): Score for the position.
-            score_namesuffix (float): Score for the name suffix.
-            score_datatype (float): Score for the datatype.
+            list_scores (list of tuples): Tuples with (UAC_id, score_cardinality, score_valuelenght, score_position,
+                                          score_namesuffix, score_datatype).
         """
-        query = f"""
-            UPDATE unique_attributecombinations SET 
-            score_cardinality = {score_cardinality},
-            score_valuelenght = {score_valuelenght},
-            score_position = {score_position},
-            score_namesuffix = {score_namesuffix},
-            score_datatype = {score_datatype}
-            WHERE id = {UAC_id};
-        """
-        self.query_update(query)
+        column_names = ["score_cardinality", "score_valuelenght", "score_position", "score_namesuffix", "score_datatype"]
+        self._update_rows_by_id("unique_attributecombinations", column_names, list_scores)
 
-    def add_UAC_possibility(self, UAC_id, hopf_score, iris_score):
+    def _update_rows_by_id(self, table_name, column_names, rows, batch_size=1000):
         """
-        Adds a PK possibilities to the given UAC.
+        Updates the columns of many rows with one query per batch. Uses a CASE expression for every column,
+        which is supported by MariaDB and PostgreSQL.
 
         Args:
-            UAC_id (int): The ID of the UAC.
-            hopf_score (int): Possbility HoPF-Score.
-            iris_score (int): Possbility IRIS-Score.
+            table_name (str): The name of the table.
+            column_names (list of str): The names of the columns to update.
+            rows (list of tuples): Tuples with the ID of the row followed by the values in the order of the columns.
+            batch_size (int): Maximum number of rows per query.
+        """
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            parameters = []
+            list_set_strings = []
+            for i, column_name in enumerate(column_names):
+                cases = " ".join("WHEN %s THEN %s" for _ in batch)
+                list_set_strings.append(f"{column_name} = CASE id {cases} END")
+                for row in batch:
+                    parameters.extend((row[0], row[i + 1]))
+            ids_string = ", ".join("%s" for _ in batch)
+            parameters.extend(row[0] for row in batch)
+            set_string = ",\n".join(list_set_strings)
+            query = f"""
+                UPDATE {table_name} SET
+                {set_string}
+                WHERE id IN ({ids_string});
+            """
+            self.query_update(query, parameters)
+
+    def add_UAC_possibilities_batch(self, list_possibilities):
         """
-        query = f"""
-            UPDATE unique_attributecombinations SET 
-            pk_score_hopf = {hopf_score},
-            pk_score_iris = {iris_score}
-            WHERE id = {UAC_id};
+        Adds the PK possibilities to many UACs with one update.
+
+        Args:
+            list_possibilities (list of tuples): Tuples with (UAC_id, hopf_score, iris_score).
         """
-        self.query_update(query)
+        self._update_rows_by_id("unique_attributecombinations", ["pk_score_hopf", "pk_score_iris"], list_possibilities)
 
     def add_IND_FKscores(self, 
                          IND_id, name_weighted_similarity, bhattacharyya, iris_similarity, hybrid_score, 
@@ -557,22 +686,26 @@ class DBConnector:
             name_similarity (float): Score of the syntactic name similarity.
             bhattacharyya (float): Score of the datadistribution.
             iris_similarity (float): Score of the IRIS score.
+            Scores, that are not calculated, are None and stored as NULL.
         """
+        scores = [name_weighted_similarity, bhattacharyya, iris_similarity, hybrid_score,
+                  hopf_probability, iris_probability, hybrid_only_name_probability, hybrid_probability]
+        scores = ["NULL" if score is None else score for score in scores]
         query = f"""
             UPDATE inclusion_dependencies SET 
-            score_syntactic_name_similarity = {name_weighted_similarity},
-            score_datadistribution = {bhattacharyya},
-            score_IRIS_name_similarity = {iris_similarity},
-            score_hybrid_name_similarity = {hybrid_score},
-            HoPF_probability = {hopf_probability},
-            IRIS_probability = {iris_probability},
-            hybrid_only_name_probability = {hybrid_only_name_probability},
-            hybrid_probability = {hybrid_probability} 
+            score_syntactic_name_similarity = {scores[0]},
+            score_datadistribution = {scores[1]},
+            score_IRIS_name_similarity = {scores[2]},
+            score_hybrid_name_similarity = {scores[3]},
+            HoPF_probability = {scores[4]},
+            IRIS_probability = {scores[5]},
+            hybrid_only_name_probability = {scores[6]},
+            hybrid_probability = {scores[7]} 
             WHERE id = {IND_id};
         """
         self.query_update(query)
 
-    def add_IND(self, UAC_id, child_server, child_database, child_datastorage, child_attributes):
+    def add_IND(self, UAC_id, child_server, child_database, child_datastorage, child_attributes, coverage=1.0):
         """
         Adds a IND to the table.
 
@@ -582,6 +715,7 @@ class DBConnector:
             child_database (int): database_id of the child.
             child_datastorage (int): datastorage_id of the child.
             child_attributes (list): List of attributes IDs of the child.
+            coverage (float): Share of the child values, that are included in the parent. Below 1 for approximate INDs.
 
         Returns:
             int: The ID of the newly added entry.        
@@ -606,9 +740,9 @@ class DBConnector:
                 child_server_id, child_server_host, child_server_port, child_server_type,
                 child_db_id, child_db_name,
                 child_datastorage_id, child_datastorage_name,
-                child_attribute_ids, child_attribute_names
+                child_attribute_ids, child_attribute_names, coverage
             )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
         """
         
         new_entry_id = self.query_insert(
@@ -617,13 +751,64 @@ class DBConnector:
             child_server, child_server_host, child_server_port, child_server_type,
             child_database, child_database_name,
             child_datastorage, child_datastorage_name,
-            child_attribute_ids_string, child_attribute_names_string
+            child_attribute_ids_string, child_attribute_names_string, coverage
         ))
 
         return new_entry_id
 
+    def add_INDs_batch(self, list_INDs, batch_size=1000):
+        """
+        Adds many INDs to the table with one insert per batch.
+
+        Args:
+            list_INDs (list of tuples): Tuples with (UAC_id, child_server, child_database, child_datastorage,
+                                        child_attributes, coverage) like the arguments of add_IND.
+            batch_size (int): Maximum number of rows per query.
+        """
+        # The names are looked up once for every server, database, datastorage and attribute
+        server_infos = {}
+        database_names = {}
+        datastorage_names = {}
+        attribute_names = {}
+        rows = []
+        for UAC_id, child_server, child_database, child_datastorage, child_attributes, coverage in list_INDs:
+            if child_server not in server_infos:
+                server_infos[child_server] = (self.get_server_host(child_server), self.get_server_port(child_server),
+                                              self.get_server_type(child_server))
+            if child_database not in database_names:
+                database_names[child_database] = self.get_database_name(child_database)
+            if child_datastorage not in datastorage_names:
+                datastorage_names[child_datastorage] = self.get_datastorage_name(child_datastorage)
+            for attribute_id in child_attributes:
+                if attribute_id not in attribute_names:
+                    attribute_names[attribute_id] = self.get_attribute_name(attribute_id)
+            child_attribute_names_string = ", ".join(attribute_names[attribute_id] for attribute_id in child_attributes)
+            child_attribute_ids_string = ", ".join(map(str, child_attributes))
+            rows.append((
+                UAC_id,
+                child_server, *server_infos[child_server],
+                child_database, database_names[child_database],
+                child_datastorage, datastorage_names[child_datastorage],
+                child_attribute_ids_string, child_attribute_names_string, coverage
+            ))
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            values_string = ", ".join("(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)" for _ in batch)
+            parameters = [value for row in batch for value in row]
+            query = f"""
+                INSERT INTO inclusion_dependencies (
+                    UAC_id,
+                    child_server_id, child_server_host, child_server_port, child_server_type,
+                    child_db_id, child_db_name,
+                    child_datastorage_id, child_datastorage_name,
+                    child_attribute_ids, child_attribute_names, coverage
+                )
+                VALUES {values_string};
+            """
+            self.query_update(query, parameters)
+
     def add_maxIND(self, parent_server_id, parent_database_id, parent_datastorage_id, parent_attribute_ids,
-                   child_server_id, child_database_id, child_datastorage_id, child_attribute_ids):
+                   child_server_id, child_database_id, child_datastorage_id, child_attribute_ids, coverage=1.0):
         """
         Adds a maximal IND to the table.
 
@@ -636,6 +821,7 @@ class DBConnector:
             child_database_id (int): The database ID of the child.
             child_datastorage_id (int): The data storage ID of the child.
             child_attribute_ids (list[int]): List of attribute IDs of the child.
+            coverage (float): Share of the child values, that are included in the parent. Below 1 for approximate INDs.
 
         Returns:
             int: The ID of the newly added entry.        
@@ -673,9 +859,9 @@ class DBConnector:
                 parent_attribute_ids, parent_attribute_names,           
                 child_server_id, child_server_host, child_server_port, child_server_type,
                 child_db_id, child_db_name, child_datastorage_id, child_datastorage_name,
-                child_attribute_ids, child_attribute_names
+                child_attribute_ids, child_attribute_names, coverage
             )
-            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s);
         """
 
         new_entry_id = self.query_insert(
@@ -683,7 +869,8 @@ class DBConnector:
                 parent_server_id, parent_server_host, parent_server_port, parent_server_type, parent_database_id, parent_database_name,
                 parent_datastorage_id, parent_datastorage_name, parent_attribute_ids_string, parent_attribute_names_string,
                 child_server_id, child_server_host, child_server_port, child_server_type, child_database_id, child_database_name,
-                child_datastorage_id, child_datastorage_name, child_attribute_ids_string, child_attribute_names_string))
+                child_datastorage_id, child_datastorage_name, child_attribute_ids_string, child_attribute_names_string,
+                coverage))
         
         return new_entry_id
 
@@ -701,6 +888,8 @@ class DBConnector:
         """
         parameter_list = [attribute_id, entry_no, value, value_type, value_length, position]
         self.list_values_batchimport.append(parameter_list)
+        self._add_value_to_sketches(attribute_id, value)
+        self.entry_bitmaps = None
         batch_size = 10000
         if len(self.list_values_batchimport) >= batch_size:
             self.add_value_batchimport_end()
@@ -730,6 +919,68 @@ class DBConnector:
             if cursor:
                 cursor.close()   
 
+    def _add_value_to_sketches(self, attribute_id, value):
+        """
+        Adds the value to the HyperLogLog sketch and the Bloom filter of the attribute.
+
+        Args:
+            attribute_id (int): ID of the Attribute.
+            value (string): Value
+        """
+        sketch = self.distinct_sketches.get(attribute_id)
+        if sketch is None:
+            sketch = HyperLogLog()
+            self.distinct_sketches[attribute_id] = sketch
+        sketch.add(value)
+        bloom_filter = self.bloom_filters.get(attribute_id)
+        if bloom_filter is None:
+            bloom_filter = BloomFilter()
+            self.bloom_filters[attribute_id] = bloom_filter
+        bloom_filter.add(value)
+
+    def save_bloom_filters(self):
+        """
+        Saves the Bloom filters of all attributes in the table "bloom_filters". Must be called after the import.
+        """
+        if self.DBType == "MariaDB":
+            query = """
+                REPLACE INTO bloom_filters (attribute_id, number_of_bits, number_of_hashes, bit_array)
+                VALUES (%s, %s, %s, %s);
+            """
+        elif self.DBType == "PostgreSQL":
+            query = """
+                INSERT INTO bloom_filters (attribute_id, number_of_bits, number_of_hashes, bit_array)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (attribute_id) DO UPDATE SET number_of_bits = EXCLUDED.number_of_bits,
+                number_of_hashes = EXCLUDED.number_of_hashes, bit_array = EXCLUDED.bit_array;
+            """
+        for attribute_id, bloom_filter in self.bloom_filters.items():
+            if bloom_filter is None: continue
+            self.query_update(query, (attribute_id, bloom_filter.number_of_bits, bloom_filter.number_of_hashes,
+                                      bloom_filter.to_bytes()))
+
+    def save_unary_INDs(self, list_unary_INDs, batch_size=1000):
+        """
+        Saves the graph of the unary INDs in the table "unary_inclusion_dependencies". The stored graph is replaced.
+
+        Args:
+            list_unary_INDs (list of tuples): Tuples with (parent attribute ID, child attribute ID, coverage).
+            batch_size (int): Maximum number of rows per query.
+        """
+        query = """
+            DELETE FROM unary_inclusion_dependencies;
+        """
+        self.query_wo_return(query)
+        for start in range(0, len(list_unary_INDs), batch_size):
+            batch = list_unary_INDs[start:start + batch_size]
+            values_string = ", ".join("(%s, %s, %s)" for _ in batch)
+            parameters = [value for row in batch for value in row]
+            query = f"""
+                INSERT INTO unary_inclusion_dependencies (parent_attribute_id, child_attribute_id, coverage)
+                VALUES {values_string};
+            """
+            self.query_update(query, parameters)
+
     def add_explicit_reference(self, UAC_id, IND_id):
         """
         Adds a explicit reference.
@@ -771,6 +1022,19 @@ class DBConnector:
         """
         new_entry_id = self.query_insert(insert_query, ([UAC_id]))
 
+    def set_max_ind_exhaustive(self, datastorage_id, is_exhaustive):
+        """
+        Saves if the maximal INDs of the datastorage were searched exhaustively.
+
+        Args:
+            datastorage_id (int): The ID of the datastorage.
+            is_exhaustive (bool): False if the search was stopped at the deadline.
+        """
+        query = """
+            UPDATE datastorage SET max_ind_exhaustive = %s WHERE id = %s;
+        """
+        self.query_update(query, (is_exhaustive, datastorage_id))
+
     # Functions to get entries
 
     def get_number_of_valueentries(self, attribute_id):
@@ -808,6 +1072,129 @@ class DBConnector:
         result = [item[0] for item in query_result]
         return result
   
+    def get_sorted_values_for_attribute(self, attribute_id):
+        """
+        Returns the values of the attribute in the order of their code points. The values are streamed. The order uses
+        a binary collation without padding, so values, that differ in case or trailing spaces, stay different and are
+        sorted like the strings in Python. Duplicates aren't removed, they are adjacent.
+
+        Args:
+            attribute_id (int): The ID of the attribute.
+
+        Yields:
+            str: The next value.
+        """
+        if self.DBType == "MariaDB":
+            query = f"""
+                SELECT value FROM loaded_values WHERE attribute_id = {attribute_id}
+                ORDER BY CONVERT(value USING utf8mb4) COLLATE utf8mb4_nopad_bin;
+            """
+        elif self.DBType == "PostgreSQL":
+            query = f"""
+                SELECT value FROM loaded_values WHERE attribute_id = {attribute_id} ORDER BY value COLLATE "C";
+            """
+        for row in self.query_stream(query):
+            yield row[0]
+
+    def get_hashed_sample_of_values(self, attribute_id, number_of_partitions):
+        """
+        Returns the values of one hash partition of the attribute. The hash is calculated from the bytes of the
+        values, so values, that differ in case or trailing spaces, are selected independently. Every distinct value is
+        selected with a probability of 1 / number_of_partitions.
+
+        Args:
+            attribute_id (int): The ID of the attribute.
+            number_of_partitions (int): Number of hash partitions.
+
+        Returns:
+            list of string: The values of the partition, duplicates aren't removed.
+        """
+        if self.DBType == "MariaDB":
+            query = f"""
+                SELECT value FROM loaded_values
+                WHERE attribute_id = {attribute_id} AND MOD(CRC32(value), {number_of_partitions}) = 0;
+            """
+        elif self.DBType == "PostgreSQL":
+            query = f"""
+                SELECT value FROM loaded_values
+                WHERE attribute_id = {attribute_id}
+                AND MOD(('x' || SUBSTR(MD5(value), 1, 8))::BIT(32)::BIGINT, {number_of_partitions}) = 0;
+            """
+        query_result = self.query(query)
+        result = [item[0] for item in query_result]
+        return result
+
+    def get_attribute_values(self):
+        """
+        Returns the pairs of attribute ID and value for all attributes. The pairs are streamed. Duplicates aren't
+        removed, because the collation of the database can merge values, that differ in case or trailing spaces.
+
+        Yields:
+            tuple: The attribute ID and the value.
+        """
+        query = """
+            SELECT attribute_id, value FROM loaded_values;
+        """
+        for row in self.query_stream(query):
+            yield row[0], row[1]
+
+    def get_bloom_filter(self, attribute_id):
+        """
+        Returns the Bloom filter of the attribute. Filters that are not in memory are loaded from the table
+        "bloom_filters".
+
+        Args:
+            attribute_id (int): The Attribute ID of the Attribute.
+
+        Returns:
+            BloomFilter: The filter. None if there is no filter for the attribute.
+        """
+        if attribute_id in self.bloom_filters:
+            return self.bloom_filters[attribute_id]
+        query = f"""
+            SELECT number_of_bits, number_of_hashes, bit_array FROM bloom_filters WHERE attribute_id = {attribute_id};
+        """
+        query_result = self.query(query)
+        bloom_filter = None
+        if query_result:
+            number_of_bits, number_of_hashes, bit_array = query_result[0]
+            bloom_filter = BloomFilter(number_of_bits, number_of_hashes, bit_array)
+        # Also caches missing filters
+        self.bloom_filters[attribute_id] = bloom_filter
+        return bloom_filter
+
+    def get_approx_distinct_count(self, attribute_id):
+        """
+        Returns the estimated number of distinct values for the selected attribute ID. The estimation uses the
+        HyperLogLog sketch, that is build during the import.
+
+        Args:
+            attribute_id(int): The ID of the attribute.
+
+        Return:
+            float: Estimated number of distinct values. None if there is no sketch for the attribute.
+        """
+        sketch = self.distinct_sketches.get(attribute_id)
+        if sketch is None:
+            return None
+        return sketch.count()
+
+    def get_approx_distinct_bounds(self, attribute_id, num_std_errors=3):
+        """
+        Returns a lower and an upper bound for the number of distinct values for the selected attribute ID.
+
+        Args:
+            attribute_id(int): The ID of the attribute.
+            num_std_errors (int): Width of the interval in standard errors of the sketch.
+
+        Return:
+            tuple: Lower and upper bound (float, float). None if there is no sketch for the attribute.
+        """
+        sketch = self.distinct_sketches.get(attribute_id)
+        if sketch is None:
+            return None
+        return sketch.get_bounds(num_std_errors)
+
     def get_UACs(self):
         """
         Returns all Unique AttributeCombinations as a list with dictionarys.
@@ -1019,6 +1406,76 @@ class DBConnector:
         result = query_result[0][0]
         return result
 
+    def get_attribute_features(self):
+        """
+        Loads the features of all attributes with one query. Used for the calculation of the primarykey scores.
+
+        Returns:
+            list: List of dictionaries with the attribute ID, name, maximal value length, average position and types.
+        """
+        if self.DBType == "MariaDB":
+            types_string = "GROUP_CONCAT(DISTINCT loaded_values.value_type)"
+        elif self.DBType == "PostgreSQL":
+            types_string = "STRING_AGG(DISTINCT loaded_values.value_type, ',')"
+        query = f"""
+            SELECT loaded_attributes.id, loaded_attributes.attribute_name,
+            MAX(loaded_values.length), AVG(loaded_values.position), {types_string}
+            FROM loaded_attributes
+            INNER JOIN loaded_values ON loaded_values.attribute_id = loaded_attributes.id
+            GROUP BY loaded_attributes.id, loaded_attributes.attribute_name;
+        """
+        query_result = self.query(query)
+        result = []
+        for entry in query_result:
+            dic = {
+                "attribute_id": entry[0],
+                "attribute_name": entry[1],
+                "max_value_length": int(entry[2]),
+                "average_position": float(entry[3]),
+                "attribute_types": entry[4].split(',')
+            }
+            result.append(dic)
+        return result
+
+    def get_attribute_pruning_features(self):
+        """
+        Loads the features of all attributes, that are used to prune the IND candidates, with one query.
+
+        Returns:
+            list: List of dictionaries with the attribute ID, number of values, number of distinct values, minimal and
+                  maximal value length, number of integer values, minimal and maximal integer value and types.
+        """
+        if self.DBType == "MariaDB":
+            types_string = "GROUP_CONCAT(DISTINCT value_type)"
+        elif self.DBType == "PostgreSQL":
+            types_string = "STRING_AGG(DISTINCT value_type, ',')"
+        is_integer = "value_type IN ('int', 'Int64', 'long')"
+        query = f"""
+            SELECT attribute_id, COUNT(*), COUNT(DISTINCT value), MIN(CHAR_LENGTH(value)), MAX(CHAR_LENGTH(value)),
+            SUM(CASE WHEN {is_integer} THEN 1 ELSE 0 END),
+            MIN(CASE WHEN {is_integer} THEN CAST(value AS DECIMAL(65, 0)) END),
+            MAX(CASE WHEN {is_integer} THEN CAST(value AS DECIMAL(65, 0)) END),
+            {types_string}
+            FROM loaded_values
+            GROUP BY attribute_id;
+        """
+        query_result = self.query(query)
+        result = []
+        for entry in query_result:
+            dic = {
+                "attribute_id": entry[0],
+                "number_of_values": int(entry[1]),
+                "number_of_distinct_values": int(entry[2]),
+                "min_value_length": int(entry[3]),
+                "max_value_length": int(entry[4]),
+                "number_of_integer_values": int(entry[5]),
+                "min_integer_value": None if entry[6] is None else float(entry[6]),
+                "max_integer_value": None if entry[7] is None else float(entry[7]),
+                "attribute_types": entry[8].split(',')
+            }
+            result.append(dic)
+        return result
+
     def get_max_entry_number(self, attribute_ids):
         """
         Gets the maximal entry number for the given attributes.
@@ -1029,64 +1486,93 @@ class DBConnector:
         Returns:
             int: Maximum entry number,
         """
-        combination_string = ", ".join(map(str, attribute_ids))
-        query = f"""
-          SELECT MAX(entry_no) FROM loaded_values WHERE attribute_id IN ({combination_string});
-        """
-        query_result = self.query(query)
-        number_of_entries = query_result[0][0]   
-        return int(number_of_entries)     
+        list_max_entry_nos = [self.get_entry_bitmap(attribute_id).get_max() for attribute_id in attribute_ids]
+        list_max_entry_nos = [entry_no for entry_no in list_max_entry_nos if entry_no is not None]
+        if not list_max_entry_nos:
+            return 0
+        return max(list_max_entry_nos)
 
-    def get_number_of_entries(self, attribute_id):
+    def get_number_of_entry_nos(self, attribute_id):
         """
-        Gets the number of entries for the given attribute.
+        Gets the number of entries, that have a value for the given attribute. An array counts as one entry.
 
         Args:
             attribute_id: The ID of the attribute.
 
         Returns:
-            int: Number of entries.        
-        """
-        query = f"""
-            SELECT COUNT(*) FROM loaded_values WHERE attribute_id = {attribute_id};
+            int: Number of entries.
         """
-        query_result = self.query(query)
-        entries = query_result[0][0]
-        return int(entries)
+        return len(self.get_entry_bitmap(attribute_id))
 
-    def get_attribute_position(self, attribute_id):
+    def get_entry_bitmap(self, attribute_id):
         """
-        Gets the average position of the attribute in the documents or table for the given attribute.
+        Returns the bitmap of the entry numbers of an attribute. The bitmaps of all attributes are loaded with one
+        query on the first call.
 
         Args:
             attribute_id (int): The ID of the attribute.
 
         Returns:
-            float: The average postion.             
+            EntryBitmap: The entry numbers, empty if the attribute has no values.
         """
-        query = f"""
-          SELECT AVG(position) AS average_position FROM loaded_values  WHERE attribute_id = ({attribute_id})
+        if self.entry_bitmaps is None:
+            self._load_entry_bitmaps()
+        bitmap = self.entry_bitmaps.get(attribute_id)
+        if bitmap is None:
+            return EntryBitmap()
+        return bitmap
+
+    def get_entry_bitmap_metrics(self):
         """
-        query_result = self.query(query)
-        result = query_result[0][0]
-        return float(result)           
+        Returns the metrics of the bitmaps of the entry numbers.
+
+        Returns:
+            dict: Number of bitmaps, number of entries and the estimated memory of the bitmaps.
+        """
+        entry_bitmaps = self.entry_bitmaps or {}
+        return {
+            "number_of_bitmaps": len(entry_bitmaps),
+            "number_of_entries": sum(len(bitmap) for bitmap in entry_bitmaps.values()),
+            "size_bytes": sum(bitmap.get_size_bytes() for bitmap in entry_bitmaps.values())
+        }
 
-    def get_max_value_length_of_attribute(self, attribute_id):
+    def _load_entry_bitmaps(self):
         """
-        Gets the maximal value length of the value from the given attribute ID.
+        Builds the bitmaps of the entry numbers of all attributes. The rows are streamed, only the entry numbers of
+        the current attribute are held in a list.
+        """
+        query = """
+            SELECT attribute_id, entry_no FROM loaded_values ORDER BY attribute_id, entry_no;
+        """
+        self.entry_bitmaps = {}
+        current_attribute_id = None
+        list_entry_nos = []
+        for attribute_id, entry_no in self.query_stream(query):
+            if attribute_id != current_attribute_id:
+                if list_entry_nos:
+                    self.entry_bitmaps[current_attribute_id] = EntryBitmap.from_entry_nos(list_entry_nos)
+                current_attribute_id = attribute_id
+                list_entry_nos = []
+            list_entry_nos.append(entry_no)
+        if list_entry_nos:
+            self.entry_bitmaps[current_attribute_id] = EntryBitmap.from_entry_nos(list_entry_nos)
+
+    def get_number_of_entries(self, attribute_id):
+        """
+        Gets the number of entries for the given attribute.
 
         Args:
-            attribute_id (int): The ID of the attribute.
+            attribute_id: The ID of the attribute.
 
         Returns:
-            int: Length of the longest value.            
+            int: Number of entries.        
         """
         query = f"""
-          SELECT MAX(length) FROM loaded_values WHERE attribute_id = ({attribute_id})
+            SELECT COUNT(*) FROM loaded_values WHERE attribute_id = {attribute_id};
         """
         query_result = self.query(query)
-        result = query_result[0][0]
-        return result
+        entries = query_result[0][0]
+        return int(entries)
 
     def get_number_of_unique_entries_for_attributes(self, list_attribute_ids):
         """
@@ -1122,88 +1608,85 @@ class DBConnector:
         number_of_unique_entries = query_result[0][0]
         return int(number_of_unique_entries)
 
-    def get_value_at_specific_position(self, attribute_id, position):
+    def get_values_ordered_by_entry_no(self, list_attribute_ids):
         """
-        This function sorts the values und selects the value at a specific position.
+        Returns the values of the given attributes ordered by the entry number. The rows are streamed.
 
         Args:
-            attribute_id (int): The ID of the attribute.
-            postion (int): Postion of the value.
+            list_attribute_ids (list): List with Attribute IDs.
 
-        Returns:
-            str: Value at the position.
+        Yields:
+            tuple: The entry number, the Attribute ID and the value.
         """
+        string_attribute_ids = ", ".join(map(str, list_attribute_ids))
         query = f"""
-            SELECT value FROM loaded_values WHERE attribute_id = {attribute_id} ORDER BY value LIMIT 1 OFFSET {position};
+            SELECT entry_no, attribute_id, value FROM loaded_values
+            WHERE attribute_id IN ({string_attribute_ids})
+            ORDER BY entry_no;
         """
-        query_result = self.query(query)
-        value = query_result[0][0]
-        return value
-    
-    def count_values_to_specific_value(self, attribute_id, value):
+        for row in self.query_stream(query):
+            yield row[0], row[1], row[2]
+
+    def get_list_of_entry_nos_for_attribute(self, attribute_id):
         """
-        Counts the number of values until the given value.
+        Returns the list of entry numbers for the given attribute ID.
 
         Args:
             attribute_id (int): The ID of the attribute.
-            value (str): The value.
 
         Returns:
-            int: The count of values until the given value.        
+            list: List of intergers, with the entry numbers.        
         """
         query = f"""
-            SELECT COUNT(*) AS cnt
-            FROM loaded_values WHERE attribute_id = {attribute_id}
-            AND value BETWEEN '' AND '{value}';
+            SELECT entry_no FROM loaded_values WHERE attribute_id = {attribute_id};
         """
         query_result = self.query(query)
-        result = query_result[0][0]
-        return result
+        list = [item[0] for item in query_result]
+        return list
 
-    def get_list_of_entry_nos_for_attribute(self, attribute_id):
+    def get_values_for_entry_nos(self, list_attribute_ids, list_entry_nos):
         """
-        Returns the list of entry numbers for the given attribute ID.
+        Selects the values of the given attributes for the given entry numbers with one query.
 
         Args:
-            attribute_id (int): The ID of the attribute.
+            list_attribute_ids (list): List with Attribute IDs.
+            list_entry_nos (list): List with entry numbers.
 
         Returns:
-            list: List of intergers, with the entry numbers.        
+            list: List of tuples with the entry number, the Attribute ID and the value.
         """
+        if not list_attribute_ids or not list_entry_nos:
+            return []
+        string_attribute_ids = ", ".join(map(str, list_attribute_ids))
+        string_entry_nos = ", ".join(map(str, list_entry_nos))
         query = f"""
-            SELECT entry_no FROM loaded_values WHERE attribute_id = {attribute_id};
+            SELECT entry_no, attribute_id, value FROM loaded_values
+            WHERE attribute_id IN ({string_attribute_ids}) AND entry_no IN ({string_entry_nos});
         """
         query_result = self.query(query)
-        list = [item[0] for item in query_result]
-        return list
-    
-    def get_related_entry_numbers(self, parent_attribute_id, child_attribute_id, child_entry_no):
-        """"
-        Selects the value of a specific entry from the child. Then returns all entry numbers from the
-        parent attribute, that contain the value.
+        return [(item[0], item[1], item[2]) for item in query_result]
+
+    def get_entry_nos_for_values(self, list_attribute_ids, list_values):
+        """
+        Selects the entry numbers of the given attributes, that contain one of the given values, with one query.
 
         Args:
-            parent_attribute_id (int): The ID of the parent attribute.
-            child_attribute_id (int): The ID of the child attribute.
-            child_entry_no (int): The entry number of the child to test.
+            list_attribute_ids (list): List with Attribute IDs.
+            list_values (list): List with the values.
 
         Returns:
-            list: List of intergers, with the entry numbers.            
+            list: List of tuples with the Attribute ID, the value and the entry number.
         """
+        if not list_attribute_ids or not list_values:
+            return []
+        string_attribute_ids = ", ".join(map(str, list_attribute_ids))
+        string_placeholders = ", ".join(["%s"] * len(list_values))
         query = f"""
-            SELECT entry_no
-            FROM loaded_values
-            WHERE attribute_id = {parent_attribute_id}
-            AND value = (
-                SELECT value
-                FROM loaded_values
-                WHERE entry_no = {child_entry_no}
-                AND attribute_id = {child_attribute_id}
-            );
-        """
-        query_result = self.query(query)  
-        result = [item[0] for item in query_result]
-        return result
+            SELECT attribute_id, value, entry_no FROM loaded_values
+            WHERE attribute_id IN ({string_attribute_ids}) AND value IN ({string_placeholders});
+        """
+        query_result = self.query(query, tuple(list_values))
+        return [(item[0], item[1], item[2]) for item in query_result]
 
     def get_maximal_inclusion_dependencies(self):
         """
@@ -1230,7 +1713,8 @@ class DBConnector:
                 "child_server_type": entry[14],
                 "child_db_name": entry[16],
                 "child_datastorage_name": entry[18],
-                "child_attribute_names": entry[20]
+                "child_attribute_names": entry[20],
+                "coverage": entry[21]
             }
             result.append(dic)
         return result
@@ -1261,7 +1745,8 @@ class DBConnector:
                 "foreignkey_database": entry[12],
                 "foreignkey_datastorage": entry[13],
                 "foreignkey_attributes": entry[14],
-                "datatypes": entry[15]
+                "datatypes": entry[15],
+                "coverage": entry[23]
             }
             result.append(dic)
         return result
@@ -1292,7 +1777,8 @@ class DBConnector:
                 "foreignkey_database": entry[12],
                 "foreignkey_datastorage": entry[13],
                 "foreignkey_attributes": entry[14],
-                "datatypes": entry[15]
+                "datatypes": entry[15],
+                "coverage": entry[23]
             }
             result.append(dic)
         return result
@@ -1430,6 +1916,33 @@ class DBConnector:
         else:
             return "not_embedded"
     
+    def get_non_exhaustive_datastorages(self):
+        """
+        Returns the datastorages, whose maximal INDs weren't searched exhaustively because of the time budget.
+
+        Returns:
+            list: List of dictionaries with the server, database and datastorage.
+        """
+        query = """
+            SELECT servers.server_type, servers.host, servers.port, loaded_databases.db_name, datastorage.storage_name
+            FROM datastorage
+            JOIN loaded_databases ON datastorage.db_id = loaded_databases.id
+            JOIN servers ON loaded_databases.server_id = servers.id
+            WHERE datastorage.max_ind_exhaustive = FALSE;
+        """
+        query_result = self.query(query)
+        result = []
+        for entry in query_result:
+            dic = {
+                "server_type": entry[0],
+                "server_host": entry[1],
+                "server_port": entry[2],
+                "db_name": entry[3],
+                "datastorage_name": entry[4]
+            }
+            result.append(dic)
+        return result
+
     # Functions to check something
 
     def check_if_value_exist(self, value, attribute_id):
@@ -1501,79 +2014,9 @@ class DBConnector:
         Returns:
             bool: True if every attribute has a appropriate entry_no.        
         """
-        count_entries = len(list_attribute_ids)
-        string_attribute_ids = ", ".join(map(str, list_attribute_ids))
-        query = f"""
-            SELECT COUNT(*) AS count
-            FROM loaded_values WHERE attribute_id IN ({string_attribute_ids})
-            GROUP BY entry_no
-            HAVING COUNT(DISTINCT attribute_id) < {count_entries}
-            LIMIT 1;
-        """
-        query_result = self.query(query)
-        if not query_result:
-            return True
-        else:
-            return False    
-
-    def Nary_IND_test(self, list_parent_ids, list_child_ids):
-        """
-        Checks for N-ary INDs.
-
-        Args:
-            parent_id (list): The Attribute IDs of the parent Attributes to check.        
-            child_id (list): The Attribute IDs of the child Attributes to check. 
-        Returns:
-            boolean: True if its a N-ary IND.        
-        """
-        string_parent_ids = ", ".join(map(str, list_parent_ids))
-        string_child_ids =  ", ".join(map(str, list_child_ids))
-        if self.DBType == "MariaDB":
-            query = f"""
-                SELECT COUNT(*) AS unmatched
-                FROM (
-                    SELECT GROUP_CONCAT(DISTINCT value) AS child_values
-                    FROM loaded_values
-                    WHERE attribute_id IN ({string_child_ids})
-                    GROUP BY entry_no
-                ) child
-                WHERE NOT EXISTS (
-                    SELECT *
-                    FROM (
-                        SELECT GROUP_CONCAT(DISTINCT value) AS parent_values
-                        FROM loaded_values
-                        WHERE attribute_id IN ({string_parent_ids})
-                        GROUP BY entry_no
-                    ) parent
-                    WHERE child.child_values = parent.parent_values
-                );            
-            """
-        elif self.DBType == "PostgreSQL":
-            query = f"""
-                SELECT COUNT(*) AS unmatched
-                FROM (
-                    SELECT STRING_AGG(DISTINCT value, ',') AS child_values
-                    FROM loaded_values
-                    WHERE attribute_id IN ({string_child_ids})
-                    GROUP BY entry_no
-                ) child
-                WHERE NOT EXISTS (
-                    SELECT *
-                    FROM (
-                        SELECT STRING_AGG(DISTINCT value, ',') AS parent_values
-                        FROM loaded_values
-                        WHERE attribute_id IN ({string_parent_ids})
-                        GROUP BY entry_no
-                    ) parent
-                    WHERE child.child_values = parent.parent_values
-                );            
-            """            
-        query_result = self.query(query)
-        result = query_result[0][0]
-        if result == 0:
-            return True
-        else:
-            return False
+        # Every attribute must have a value in the same entries
+        first_bitmap = self.get_entry_bitmap(list_attribute_ids[0])
+        return all(self.get_entry_bitmap(attribute_id) == first_bitmap for attribute_id in list_attribute_ids[1:])
 
     def unary_IND_test(self, parent_id, child_id):
         """
@@ -1599,46 +2042,24 @@ class DBConnector:
             return False
 
     # Functions to calculate
-
-    def calculate_PKscores_for_datastorage(self, datastorage_id, PKmetrics):
-        """
-        Function to calculate the PKscores for the given metrics.
-
-        Args:
-            datastorage_id (int): The ID of the datastorage.
-            PKmetrics (list of strings): The name of the metrics for the PKscore.
-
-        Returns:
-            list: Sorted list with the calculated PKscores.
-        """
-        metrics_string = ' + '.join(PKmetrics)
-        query = f"""
-            SELECT {metrics_string} AS sum 
-            FROM unique_attributecombinations WHERE datastorage_id = {datastorage_id} 
-            ORDER BY sum DESC;
-        """
-        query_result = self.query(query)
-        result = [item[0] for item in query_result]
-        return result
     
-    def calculate_PKscore_for_id(self, UAC_id, PKmetrics):
+    def calculate_PKscores_for_all_UACs(self, PKmetrics):
         """
-        Function to calculate the PK score for the given metrics.
+        Function to calculate the PKscores of all UACs for the given metrics.
 
         Args:
-            UAC_id (int): The ID of the UAC.
             PKmetrics (list of strings): The name of the metrics for the PKscore.
 
         Returns:
-            float: The calculated PKscore.
+            list: List of tuples with (UAC_id, datastorage_id, PKscore).
         """
         metrics_string = ' + '.join(PKmetrics)
         query = f"""
-            SELECT {metrics_string} AS sum 
-            FROM unique_attributecombinations WHERE id = {UAC_id};
+            SELECT id, datastorage_id, {metrics_string} AS sum 
+            FROM unique_attributecombinations;
         """
         query_result = self.query(query)
-        result = query_result[0][0]
+        result = [(item[0], item[1], item[2]) for item in query_result]
         return result
     
     def calculate_FKscore(self, IND_id, FKmetrics):
@@ -1663,6 +2084,17 @@ class DBConnector:
 
     # Functions to create tables
 
+    def _create_table_schema_version(self):
+        """
+        Creates a new "schema_version" table for the databases.
+        Saves the version of the schema, to run the migrations only once.
+        """
+        table_name = "schema_version"
+        table_query = """
+            version INT NOT NULL
+        """
+        self._create_new_table(table_name, table_query)
+
     def _create_table_servers(self):
         """
         Creates a new "servers" table for the databases.
@@ -1731,6 +2163,7 @@ class DBConnector:
                 storage_name VARCHAR(50) NOT NULL,
                 db_id INT NOT NULL,
                 parent_id INT,
+                max_ind_exhaustive BOOLEAN,
                 FOREIGN KEY(db_id) REFERENCES loaded_databases(id) ON DELETE CASCADE,
                 FOREIGN KEY(parent_id) REFERENCES datastorage(id) ON DELETE CASCADE,
                 PRIMARY KEY (id)
@@ -1741,11 +2174,12 @@ class DBConnector:
                 storage_name VARCHAR(50) NOT NULL,
                 db_id INT NOT NULL,
                 parent_id INT,
+                max_ind_exhaustive BOOLEAN,
                 FOREIGN KEY(db_id) REFERENCES loaded_databases(id) ON DELETE CASCADE,
                 FOREIGN KEY(parent_id) REFERENCES datastorage(id) ON DELETE CASCADE,
                 PRIMARY KEY (id)
             """
-        self._create_new_table(table_name, table_query)    
+        self._create_new_table(table_name, table_query)
 
     def _create_table_attributes(self):
         """
@@ -1900,6 +2334,7 @@ class DBConnector:
                 IRIS_probability FLOAT,
                 hybrid_only_name_probability FLOAT,
                 hybrid_probability FLOAT,
+                coverage FLOAT,
                 FOREIGN KEY(UAC_id) REFERENCES unique_attributecombinations(id) ON DELETE CASCADE,
                 FOREIGN KEY(child_server_id) REFERENCES servers(id) ON DELETE CASCADE,
                 FOREIGN KEY(child_db_id) REFERENCES loaded_databases(id) ON DELETE CASCADE,
@@ -1928,13 +2363,14 @@ class DBConnector:
                 IRIS_probability FLOAT,
                 hybrid_only_name_probability FLOAT,
                 hybrid_probability FLOAT,
+                coverage FLOAT,
                 FOREIGN KEY(UAC_id) REFERENCES unique_attributecombinations(id) ON DELETE CASCADE,
                 FOREIGN KEY(child_server_id) REFERENCES servers(id) ON DELETE CASCADE,
                 FOREIGN KEY(child_db_id) REFERENCES loaded_databases(id) ON DELETE CASCADE,
                 FOREIGN KEY(child_datastorage_id) REFERENCES datastorage(id) ON DELETE CASCADE,
                 PRIMARY KEY (id)
             """
-        self._create_new_table(table_name, table_query)  
+        self._create_new_table(table_name, table_query)
 
     def _create_table_max_inclusiondependencies(self):
         """
@@ -1964,6 +2400,7 @@ class DBConnector:
                 child_datastorage_name VARCHAR(50),
                 child_attribute_ids VARCHAR(50) NOT NULL,
                 child_attribute_names TEXT,
+                coverage FLOAT,
                 FOREIGN KEY(parent_server_id) REFERENCES servers(id) ON DELETE CASCADE,
                 FOREIGN KEY(parent_db_id) REFERENCES loaded_databases(id) ON DELETE CASCADE,
                 FOREIGN KEY(parent_datastorage_id) REFERENCES datastorage(id) ON DELETE CASCADE,
@@ -1995,6 +2432,7 @@ class DBConnector:
                 child_datastorage_name VARCHAR(50),
                 child_attribute_ids VARCHAR(50) NOT NULL,
                 child_attribute_names TEXT,
+                coverage FLOAT,
                 FOREIGN KEY(parent_server_id) REFERENCES servers(id) ON DELETE CASCADE,
                 FOREIGN KEY(parent_db_id) REFERENCES loaded_databases(id) ON DELETE CASCADE,
                 FOREIGN KEY(parent_datastorage_id) REFERENCES datastorage(id) ON DELETE CASCADE,
@@ -2003,7 +2441,7 @@ class DBConnector:
                 FOREIGN KEY(child_datastorage_id) REFERENCES datastorage(id) ON DELETE CASCADE,
                 PRIMARY KEY (id)
             """
-        self._create_new_table(table_name, table_query)  
+        self._create_new_table(table_name, table_query)
 
     def _create_table_implicitly_references(self):
         """
@@ -2076,6 +2514,48 @@ class DBConnector:
             """
         self._create_new_table(table_name, table_query)
 
+    def _create_table_bloom_filters(self):
+        """
+        Creates a new "bloom_filters" table for the databases.
+        Saves the Bloom filter of the values of every attribute.
+        """
+        table_name = "bloom_filters"
+        if self.DBType == "MariaDB":
+            table_query = """
+                attribute_id INT NOT NULL,
+                number_of_bits INT NOT NULL,
+                number_of_hashes SMALLINT NOT NULL,
+                bit_array MEDIUMBLOB NOT NULL,
+                FOREIGN KEY(attribute_id) REFERENCES loaded_attributes(id) ON DELETE CASCADE,
+                PRIMARY KEY (attribute_id)
+            """
+        elif self.DBType == "PostgreSQL":
+            table_query = """
+                attribute_id INT NOT NULL,
+                number_of_bits INT NOT NULL,
+                number_of_hashes SMALLINT NOT NULL,
+                bit_array BYTEA NOT NULL,
+                FOREIGN KEY(attribute_id) REFERENCES loaded_attributes(id) ON DELETE CASCADE,
+                PRIMARY KEY (attribute_id)
+            """
+        self._create_new_table(table_name, table_query)
+
+    def _create_table_unary_inclusiondependencies(self):
+        """
+        Creates a new "unary_inclusion_dependencies" table for the databases.
+        Saves the graph of the unary INDs between all attributes, that is shared by the later stages.
+        """
+        table_name = "unary_inclusion_dependencies"
+        table_query = """
+            parent_attribute_id INT NOT NULL,
+            child_attribute_id INT NOT NULL,
+            coverage FLOAT,
+            FOREIGN KEY(parent_attribute_id) REFERENCES loaded_attributes(id) ON DELETE CASCADE,
+            FOREIGN KEY(child_attribute_id) REFERENCES loaded_attributes(id) ON DELETE CASCADE,
+            PRIMARY KEY (parent_attribute_id, child_attribute_id)
+        """
+        self._create_new_table(table_name, table_query)
+
     # Functions to create views
         
     def _create_view_inclusionsdependencies(self):
@@ -2084,7 +2564,7 @@ class DBConnector:
         """
         if self.DBType == "MariaDB":
             query = f"""
-                CREATE VIEW IF NOT EXISTS view_inclusionsdependencies AS
+                CREATE OR REPLACE VIEW view_inclusionsdependencies AS
                 SELECT 
                     unique_attributecombinations.id AS UAC_id,
                     inclusion_dependencies.id AS IND_id,
@@ -2107,7 +2587,8 @@ class DBConnector:
                     inclusion_dependencies.HoPF_probability  AS HoPF_probability,
                     inclusion_dependencies.IRIS_probability AS IRIS_probability,
                     inclusion_dependencies.hybrid_only_name_probability AS hybrid_only_name_probability,
-                    inclusion_dependencies.hybrid_probability AS hybrid_probability
+                    inclusion_dependencies.hybrid_probability AS hybrid_probability,
+                    inclusion_dependencies.coverage AS coverage
                 FROM inclusion_dependencies
                 INNER JOIN unique_attributecombinations ON inclusion_dependencies.UAC_id = unique_attributecombinations.id;
             """
@@ -2136,7 +2617,8 @@ class DBConnector:
                     inclusion_dependencies.HoPF_probability  AS HoPF_probability,
                     inclusion_dependencies.IRIS_probability AS IRIS_probability,
                     inclusion_dependencies.hybrid_only_name_probability AS hybrid_only_name_probability,
-                    inclusion_dependencies.hybrid_probability AS hybrid_probability
+                    inclusion_dependencies.hybrid_probability AS hybrid_probability,
+                    inclusion_dependencies.coverage AS coverage
                 FROM inclusion_dependencies
                 INNER JOIN unique_attributecombinations ON inclusion_dependencies.UAC_id = unique_attributecombinations.id;
             """
@@ -2148,7 +2630,7 @@ class DBConnector:
         """
         if self.DBType == "MariaDB":
             query = f"""
-                CREATE VIEW IF NOT EXISTS view_explicite_references AS
+                CREATE OR REPLACE VIEW view_explicite_references AS
                 SELECT 
                     explicit_references.id AS reference_id,
                     explicit_references.UAC_id AS UAC_id,
@@ -2176,7 +2658,8 @@ class DBConnector:
                     inclusion_dependencies.HoPF_probability  AS HoPF_probability,
                     inclusion_dependencies.IRIS_probability AS IRIS_probability,
                     inclusion_dependencies.hybrid_only_name_probability AS hybrid_only_name_probability,
-                    inclusion_dependencies.hybrid_probability AS hybrid_probability
+                    inclusion_dependencies.hybrid_probability AS hybrid_probability,
+                    inclusion_dependencies.coverage AS coverage
                 FROM explicit_references
                 INNER JOIN unique_attributecombinations ON explicit_references.UAC_id = unique_attributecombinations.id
                 INNER JOIN inclusion_dependencies  ON explicit_references.IND_id = inclusion_dependencies.id
@@ -2212,7 +2695,8 @@ class DBConnector:
                     inclusion_dependencies.HoPF_probability  AS HoPF_probability,
                     inclusion_dependencies.IRIS_probability AS IRIS_probability,
                     inclusion_dependencies.hybrid_only_name_probability AS hybrid_only_name_probability,
-                    inclusion_dependencies.hybrid_probability AS hybrid_probability
+                    inclusion_dependencies.hybrid_probability AS hybrid_probability,
+                    inclusion_dependencies.coverage AS coverage
                 FROM explicit_references
                 INNER JOIN unique_attributecombinations ON explicit_references.UAC_id = unique_attributecombinations.id
                 INNER JOIN inclusion_dependencies  ON explicit_references.IND_id = inclusion_dependencies.id
@@ -2226,7 +2710,7 @@ class DBConnector:
         """
         if self.DBType == "MariaDB":
             query = f"""
-                CREATE VIEW IF NOT EXISTS view_implicitly_reference AS
+                CREATE OR REPLACE VIEW view_implicitly_reference AS
                 SELECT 
                     implicitly_references.id AS reference_id,
                     implicitly_references.UAC_id AS UAC_id,
@@ -2254,7 +2738,8 @@ class DBConnector:
                     inclusion_dependencies.HoPF_probability  AS HoPF_probability,
                     inclusion_dependencies.IRIS_probability AS IRIS_probability,
                     inclusion_dependencies.hybrid_only_name_probability AS hybrid_only_name_probability,
-                    inclusion_dependencies.hybrid_probability AS hybrid_probability
+                    inclusion_dependencies.hybrid_probability AS hybrid_probability,
+                    inclusion_dependencies.coverage AS coverage
                 FROM implicitly_references
                 INNER JOIN unique_attributecombinations ON implicitly_references.UAC_id = unique_attributecombinations.id
                 INNER JOIN inclusion_dependencies  ON implicitly_references.IND_id = inclusion_dependencies.id
@@ -2290,7 +2775,8 @@ class DBConnector:
                     inclusion_dependencies.HoPF_probability  AS HoPF_probability,
                     inclusion_dependencies.IRIS_probability AS IRIS_probability,
                     inclusion_dependencies.hybrid_only_name_probability AS hybrid_only_name_probability,
-                    inclusion_dependencies.hybrid_probability AS hybrid_probability
+                    inclusion_dependencies.hybrid_probability AS hybrid_probability,
+                    inclusion_dependencies.coverage AS coverage
                 FROM implicitly_references
                 INNER JOIN unique_attributecombinations ON implicitly_references.UAC_id = unique_attributecombinations.id
                 INNER JOIN inclusion_dependencies  ON implicitly_references.IND_id = inclusion_dependencies.id
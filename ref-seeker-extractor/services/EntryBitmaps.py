@@ -0,0 +1,128 @@
+class EntryBitmap:
+    """
+    Compressed bitmap of entry numbers (roaring bitmap). The entry numbers are split into chunks of 2^16 by the high
+    bits. A chunk with few entries is stored as sorted tuple of the low bits, a dense chunk as bitset (int).
+    """
+
+    CHUNK_BITS = 16
+    CHUNK_SIZE = 1 << 16
+    # Up to this number of entries a sorted tuple is smaller than the bitset (8 KB)
+    ARRAY_LIMIT = 4096
+
+    def __init__(self, containers=None):
+        """
+        Initializes a bitmap.
+
+        Args:
+            containers (dict): The containers (tuple or int) for the high bits. Empty bitmap if None.
+        """
+        self.containers = containers if containers is not None else {}
+
+    @classmethod
+    def from_entry_nos(cls, entry_nos):
+        """
+        Builds a bitmap from entry numbers.
+
+        Args:
+            entry_nos (iterable[int]): The entry numbers, duplicates are allowed.
+
+        Returns:
+            EntryBitmap: The bitmap.
+        """
+        chunks = {}
+        for entry_no in entry_nos:
+            chunks.setdefault(entry_no >> cls.CHUNK_BITS, set()).add(entry_no & (cls.CHUNK_SIZE - 1))
+        containers = {}
+        for high, lows in chunks.items():
+            if len(lows) <= cls.ARRAY_LIMIT:
+                containers[high] = tuple(sorted(lows))
+            else:
+                containers[high] = cls._to_bitset(lows)
+        return cls(containers)
+
+    @staticmethod
+    def _to_bitset(lows):
+        """
+        Converts the low bits of a chunk to a bitset.
+
+        Args:
+            lows (iterable[int]): The low bits.
+
+        Returns:
+            int: The bitset.
+        """
+        bit_array = bytearray(EntryBitmap.CHUNK_SIZE // 8)
+        for low in lows:
+            bit_array[low >> 3] |= 1 << (low & 7)
+        return int.from_bytes(bit_array, "little")
+
+    @staticmethod
+    def _get_cardinality(container):
+        """
+        Returns the number of entries in a container.
+
+        Args:
+            container (tuple or int): The container.
+
+        Returns:
+            int: The number of entries.
+        """
+        if isinstance(container, tuple):
+            return len(container)
+        return container.bit_count()
+
+    def __len__(self):
+        """
+        Returns the number of entries in the bitmap.
+
+        Returns:
+            int: The number of entries.
+        """
+        return sum(self._get_cardinality(container) for container in self.containers.values())
+
+    def __eq__(self, other):
+        """
+        Checks if both bitmaps contain the same entries. The containers are always stored in the smaller form, so the
+        containers can be compared directly.
+
+        Args:
+            other (EntryBitmap): The other bitmap.
+
+        Returns:
+            bool: True if the entries are the same.
+        """
+        if not isinstance(other, EntryBitmap):
+            return NotImplemented
+        return self.containers == other.containers
+
+    def get_max(self):
+        """
+        Returns the highest entry number.
+
+        Returns:
+            int: The highest entry number, None if the bitmap is empty.
+        """
+        if not self.containers:
+            return None
+        high = max(self.containers)
+        container = self.containers[high]
+        if isinstance(container, tuple):
+            low = container[-1]
+        else:
+            low = container.bit_length() - 1
+        return (high << self.CHUNK_BITS) | low
+
+    def get_size_bytes(self):
+        """
+        Estimates the memory of the containers.
+
+        Returns:
+            int: The size in bytes, 4 bytes per entry of a tuple and 8 KB per bitset.
+        """
+        size = 0
+        for container in self.containers.values():
+            if isinstance(container, tuple):
+                size += 4 * len(container)
+            else:
+                size += self.CHUNK_SIZE // 8
+        return size
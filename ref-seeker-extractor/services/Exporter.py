@@ -49,6 +49,9 @@ class Exporter:
         """
         max_inds = self.connector.get_maximal_inclusion_dependencies()
         self.results["maximal_inclusion_dependencies"] = max_inds
+        # Datastorages, whose search was stopped by the time budget
+        non_exhaustive_datastorages = self.connector.get_non_exhaustive_datastorages()
+        self.results["max_ind_non_exhaustive_datastorages"] = non_exhaustive_datastorages
 
     def _append_schema(self):
         """
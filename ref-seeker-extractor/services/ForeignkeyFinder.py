@@ -1,33 +1,70 @@
-import os
 import re
 import math
+from bisect import bisect_right
+import numpy as np
 from services.Containers import ContainerUACs
 from services.Containers import ContainerINDs
 from services.Containers import ContainerAttributes
-from rapidfuzz import process, fuzz
-from dictances import bhattacharyya_coefficient
-import nltk
-# Set path for nltk corpus
-path = os.path.join(".", "nltk_data")
-nltk.data.path.append(path)
-from nltk.corpus import wordnet # Need to install cospus: https://www.nltk.org/data.html
+from services.TokenSimilarity import TokenSimilarity
+from services.SimilarityCache import SimilarityCache
 
 class ForeignkeyFinder:
     """
     A class dedicated to evaluating the likelihood that an Inclusion Dependency (IND) represents a foreign key.
     """
 
-    def __init__(self, connector):
+    # The FK metrics with the scores they need and the calculation of the probability from the scores
+    FK_METRICS = {
+        "hopf_probability": (("name_weighted_similarity", "bhattacharyya"),
+                             lambda scores: (scores["bhattacharyya"] + scores["name_weighted_similarity"]) / 2),
+        "iris_probability": (("iris_similarity",),
+                             lambda scores: scores["iris_similarity"]),
+        "hybrid_only_name_probability": (("hybrid_similarity",),
+                                         lambda scores: scores["hybrid_similarity"]),
+        "hybrid_probability": (("bhattacharyya", "hybrid_similarity"),
+                               lambda scores: (scores["bhattacharyya"] + scores["hybrid_similarity"]) / 2)
+    }
+
+    def __init__(self, connector, similarity_cache_path=None, similarity_cache_size=1000000, fk_metric=None,
+                 compute_all_fk_metrics=False):
         """
         Initializes the ForeignKeyFinder with a database connector.
 
         Args:
             connector (DBConnector): An instance used for database connections.
+            similarity_cache_path (str): Path of the persistent cache for the token similarities. None or an empty
+                                         string for no cache.
+            similarity_cache_size (int): Maximum number of token pairs in the persistent cache.
+            fk_metric (str): Name of the FK metric, that is used to find the references. Only this metric and the
+                             scores it needs are calculated. None to calculate all metrics.
+            compute_all_fk_metrics (bool): If True, all metrics are calculated, independent of fk_metric.
         """
         self.connector = connector
+        self.fk_metrics = self._select_fk_metrics(fk_metric, compute_all_fk_metrics)
+        # Functions to calculate the scores of an IND, the functions get the parent and child attribute IDs
+        self.score_functions = {
+            "name_weighted_similarity": self._calculate_name_weighted_similarity,
+            "bhattacharyya": self._calculate_bhattacharyya,
+            "iris_similarity": self._calculate_iris_similarity,
+            "hybrid_similarity": self._calculate_hybrid_similarity
+        }
+        self.scores = []
+        for metric in self.fk_metrics:
+            for score in self.FK_METRICS[metric][0]:
+                if score not in self.scores:
+                    self.scores.append(score)
         self.containerINDs = ContainerINDs()
         self.containerAttributes = ContainerAttributes()
+        self.similarity_cache = None
+        if similarity_cache_path:
+            self.similarity_cache = SimilarityCache(similarity_cache_path, similarity_cache_size)
+        self.similarity_cache_metrics = {}
+        # Histograms of the attributes for the bucket bounds
+        self.histograms = {}
         self.start_calculating()
+        if self.similarity_cache is not None:
+            self.similarity_cache_metrics = self.similarity_cache.get_metrics()
+            self.similarity_cache.close()
 
     def start_calculating(self):
         """
@@ -37,259 +74,368 @@ class ForeignkeyFinder:
         self._load_INDS()
         self._load_UACs()
         self._load_attributes()
-        # Load tokens
+        # Load tokens, every name is tokenized once
         token_count = {}  # Initialize an empty dictionary to store token counts
+        self.name_tokens = {} # Tokens of the attribute names
+        self.datastorage_tokens = {} # Tokens of the datastorage names of the attributes
+        tokens_of_datastorages = {}
         for attribute in self.containerAttributes:
+            attribute_id = attribute.get_attribute_id()
             name = attribute.get_name()
             tokens = self._split_to_token(name)
+            self.name_tokens[attribute_id] = tokens
             for token in tokens:
                 # Increment the count for each token
                 token_count[token] = token_count.get(token, 0) + 1
             # Count datastorage names
             datastorage_id = attribute.get_datastorage_id()
-            datastorage_name = self.connector.get_datastorage_name(datastorage_id)
-            tokens = self._split_to_token(datastorage_name)
+            if datastorage_id not in tokens_of_datastorages:
+                datastorage_name = self.connector.get_datastorage_name(datastorage_id)
+                tokens_of_datastorages[datastorage_id] = self._split_to_token(datastorage_name)
+            tokens = tokens_of_datastorages[datastorage_id]
+            self.datastorage_tokens[attribute_id] = tokens
             for token in tokens:
                 # Increment the count for each token
                 token_count[token] = token_count.get(token, 0) + 1            
         # Calculate token weight
-        token_weights = self._calculate_weights(token_count)
+        self.token_weights = self._calculate_weights(token_count)
+        # Calculate the similarities of all tokens, the semantic similarity only for the compared tokens
+        self.token_similarity = TokenSimilarity(token_count.keys(), self.similarity_cache)
+        self.token_similarity.calculate_semantic_similarities(self._get_semantic_pairs())
         # Calculation
         for IND in self.containerINDs:
             UAC = IND.get_UAC()
             IND_id = IND.get_IND_id()
             child_attribute_ids = IND.get_child_attributes()
             parent_attribute_ids = UAC.get_attributes()
-            count_attributes = len(child_attribute_ids)
-            # Calculate syntactic name similarity
-            name_weighted_similarity = 0.0
-            for i in range(count_attributes):
-                # Load tokens
-                parent_id = parent_attribute_ids[i]
-                parent_name = self.connector.get_attribute_name(parent_id)
-                parent_tokens = self._split_to_token(parent_name)  
-                parent_datastorage_id = self.connector.get_datastorage_id_for_attribute_id(parent_id)
-                parent_datastorage_name = self.connector.get_datastorage_name(parent_datastorage_id)
-                parent_tokens.extend(self._split_to_token(parent_datastorage_name))
-                child_id = child_attribute_ids[i]
-                child_name = self.connector.get_attribute_name(child_id)
-                child_tokens = self._split_to_token(child_name)
-                child_datastorage_id = self.connector.get_datastorage_id_for_attribute_id(child_id)
-                child_datastorage_name = self.connector.get_datastorage_name(child_datastorage_id)
-                child_tokens.extend(self._split_to_token(child_datastorage_name))
-                name_weighted_similarity += self._calculate_similarity(parent_tokens, child_tokens, token_weights)
-            name_weighted_similarity /= count_attributes
-            # Calculate data distribution
-            bhattacharyya = 0.0
-            num_buckets = 20
-            for i in range(count_attributes):
-                parent_id = parent_attribute_ids[i]
-                child_id = child_attribute_ids[i]        
-                # Test types
-                parent_types = self.connector.get_attribute_types(parent_id)
-                if all(item in ("int") for item in parent_types):
-                    # Contains only integer
-                    values_set = set(int(value) for value in self.connector.get_values_for_attribute(parent_id))
-                    minimum = min(values_set)
-                    maximum = max(values_set)
-                    parent_buckets = self._calculate_buckets_for_number(values_set, minimum, maximum, num_buckets)
-                    values_set = set(int(value) for value in self.connector.get_values_for_attribute(child_id))
-                    child_buckets = self._calculate_buckets_for_number(values_set, minimum, maximum, num_buckets)
-                elif all(item in ("int", "float") for item in parent_types):
-                    # Contains only numbers
-                    values_set = set(float(value) for value in self.connector.get_values_for_attribute(parent_id))
-                    minimum = min(values_set)
-                    maximum = max(values_set)
-                    parent_buckets = self._calculate_buckets_for_number(values_set, minimum, maximum, num_buckets)
-                    values_set = set(float(value) for value in self.connector.get_values_for_attribute(child_id))
-                    child_buckets = self._calculate_buckets_for_number(values_set, minimum, maximum, num_buckets)
-                else:
-                    # Contains other types
-                    parent_count_entries = self.connector.get_number_of_valueentries(parent_id)
-                    steps = parent_count_entries / num_buckets
-                    parent_buckets = {"bucket" + str(i): 0.0 for i in range(1, num_buckets + 1)}
-                    child_count_entries = self.connector.get_number_of_valueentries(child_id)
-                    child_buckets = {"bucket" + str(i): 0.0 for i in range(1, num_buckets + 1)}
-                    for i in range(1, num_buckets):
-                        # Counts values for the buckets, skips the last one
-                        offset = round(steps * i)
-                        if offset >= parent_count_entries:
-                            # Its possible that the round function produces a greater value
-                            offset = parent_count_entries - 1
-                        # Selects the value at a specific position
-                        word = self.connector.get_value_at_specific_position(parent_id, offset)
-                        word = self._alter_quotation_marks(word)
-                        # Calculate parent buckets
-                        result = self.connector.count_values_to_specific_value(parent_id, word)
-                        parent_buckets["bucket" + str(i)] = result                        
-                        # Calculate child buckets
-                        result = self.connector.count_values_to_specific_value(child_id, word)
-                        child_buckets["bucket" + str(i)] = result
-                    parent_buckets["bucket" + str(num_buckets)] += parent_count_entries # Builds the last bucket
-                    child_buckets["bucket" + str(num_buckets)] += child_count_entries # Builds the last bucket
-                    for i in range(num_buckets, 1, -1):
-                        # Calculates the values for the buckets, skips the first bucket
-                        parent_buckets["bucket" + str(i)] -= parent_buckets["bucket" + str(i - 1)]
-                        parent_buckets["bucket" + str(i)] /= parent_count_entries
-                        child_buckets["bucket" + str(i)] -= child_buckets["bucket" + str(i - 1)]
-                        child_buckets["bucket" + str(i)] /= child_count_entries
-                    parent_buckets["bucket1"] /= parent_count_entries # Calculates the first bucket    
-                    child_buckets["bucket1"] /= child_count_entries # Calculates the first bucket
-                # Calculate bhattacharyya coefficient
-                bhattacharyya += bhattacharyya_coefficient(parent_buckets, child_buckets)
-            bhattacharyya /= count_attributes
-            # Calculate IRIS similarity
-            iris_similarity = 0.0
-            for i in range(count_attributes):
-                # Load tokens
-                parent_id = parent_attribute_ids[i]
-                parent_name = self.connector.get_attribute_name(parent_id)
-                parent_tokens = self._split_to_token(parent_name)  
-                child_id = child_attribute_ids[i]
-                child_name = self.connector.get_attribute_name(child_id)
-                child_tokens = self._split_to_token(child_name)
-                parent_result = 0.0
-                for parent_token in parent_tokens:
-                    maximum = 0.0
-                    # Calculate syntactic similarity
-                    maximum_syn = 0.0
-                    for child_token in child_tokens:
-                        result = fuzz.ratio(parent_token, child_token)
-                        result /= 100 # Result is in perecentage
-                        if result > maximum_syn:
-                            maximum_syn = result
-                    # Calculate semantic similarity if syntactic similarity is below 0.5
-                    if maximum_syn >= 0.5:
-                        maximum = maximum_syn
-                    else:
-                        # Calculate semantic similarity
-                        maximum_sem = 0.0
-                        for child_token in child_tokens:
-                            # Load tokens to wordnet
-                            syn1 = wordnet.synsets(parent_token)
-                            syn2 = wordnet.synsets(child_token)
-                            if syn1 and syn2: # Test if tokens are in wordnet
-                                syn1 = syn1[0]
-                                syn2 = syn2[0]
-                                result = syn1.wup_similarity(syn2)
-                                result /= 100 # Result is in perecentage
-                            else:
-                                # Set result to 0 if tokens are not in wordnet
-                                result = 0
-                            if result > maximum_sem:
-                                maximum_sem = result
-                        # Use semantic similarity if its 0.7 or higher
-                        if maximum_sem >= 0.7:
-                            maximum = maximum_sem
-                        else:
-                            maximum = maximum_syn
-                    parent_result += maximum
-                parent_result /= len(parent_tokens)
-                iris_similarity += parent_result
-            iris_similarity /= count_attributes
-            # Calculate Hybrid similarity
-            hybrid_similarity = 0.0
-            for i in range(count_attributes):
-                # Load tokens
-                parent_id = parent_attribute_ids[i]
-                parent_name = self.connector.get_attribute_name(parent_id)
-                parent_tokens = self._split_to_token(parent_name)
-                parent_datastorage_id = self.connector.get_datastorage_id_for_attribute_id(parent_id)
-                parent_datastorage_name = self.connector.get_datastorage_name(parent_datastorage_id)
-                parent_tokens.extend(self._split_to_token(parent_datastorage_name))
-                child_id = child_attribute_ids[i]
-                child_name = self.connector.get_attribute_name(child_id)
-                child_tokens = self._split_to_token(child_name)
-                child_datastorage_id = self.connector.get_datastorage_id_for_attribute_id(child_id)
-                child_datastorage_name = self.connector.get_datastorage_name(child_datastorage_id)
-                child_tokens.extend(self._split_to_token(child_datastorage_name))                
-                parent_result = 0.0
-                sum_weight = 0.0
-                for parent_token in parent_tokens:
-                    maximum = 0.0
-                    # Calculate syntactic similarity
-                    maximum_syn = 0.0
-                    for child_token in child_tokens:
-                        result = fuzz.ratio(parent_token, child_token)
-                        result /= 100 # Result is in perecentage
-                        if result > maximum_syn:
-                            maximum_syn = result
-                    # Calculate semantic similarity if syntactic similarity is below 0.5
-                    if maximum_syn >= 0.5:
-                        maximum = maximum_syn
-                    else:
-                        # Calculate semantic similarity
-                        maximum_sem = 0.0
-                        for child_token in child_tokens:
-                            # Load tokens to wordnet
-                            syn1 = wordnet.synsets(parent_token)
-                            syn2 = wordnet.synsets(child_token)
-                            if syn1 and syn2: # Test if tokens are in wordnet
-                                syn1 = syn1[0]
-                                syn2 = syn2[0]
-                                result = syn1.wup_similarity(syn2)
-                                result /= 100 # Result is in perecentage
-                            else:
-                                # Set result to 0 if tokens are not in wordnet
-                                result = 0
-                            if result > maximum_sem:
-                                maximum_sem = result
-                        # Use semantic similarity if its 0.7 or higher
-                        if maximum_sem >= 0.7:
-                            maximum = maximum_sem
-                        else:
-                            maximum = maximum_syn
-                    weight_for_token = token_weights.get(parent_token, None)
-                    parent_result += maximum * weight_for_token
-                    sum_weight += weight_for_token
-                parent_result /= sum_weight
-                hybrid_similarity += parent_result
-            hybrid_similarity /= count_attributes
-
-            # Calculate probabilities
-            # HoPF probability
-            hopf_probability = (bhattacharyya + name_weighted_similarity) / 2
-            # IRIS-DS probability
-            iris_probability = iris_similarity
-            # Hybrid probability
-            hybrid_only_name_probability = hybrid_similarity
-            hybrid_probability = (bhattacharyya + hybrid_similarity) / 2
+            # Calculate the scores, that are needed for the metrics
+            scores = {}
+            for score in self.scores:
+                scores[score] = self.score_functions[score](parent_attribute_ids, child_attribute_ids)
+            # Calculate probabilities, metrics, that are not calculated, are None
+            probabilities = {}
+            for metric in self.fk_metrics:
+                probabilities[metric] = self.FK_METRICS[metric][1](scores)
 
             # Write result to IND
             self.connector.add_IND_FKscores(IND_id, 
-                                            name_weighted_similarity, bhattacharyya, iris_similarity, hybrid_similarity, 
-                                            hopf_probability, iris_probability,hybrid_only_name_probability, hybrid_probability)
+                                            scores.get("name_weighted_similarity"), scores.get("bhattacharyya"),
+                                            scores.get("iris_similarity"), scores.get("hybrid_similarity"),
+                                            probabilities.get("hopf_probability"), probabilities.get("iris_probability"),
+                                            probabilities.get("hybrid_only_name_probability"),
+                                            probabilities.get("hybrid_probability"))
+
+    def _get_semantic_pairs(self):
+        """
+        Collects the token pairs, that are compared by the scores with the semantic similarity. Like in
+        _calculate_token_similarity, the semantic similarity of a parent token is only used, if its best syntactic
+        similarity is below 0.5, so the other parent tokens are skipped.
+
+        Returns:
+            set: The token pairs (token_1, token_2) with token_1 <= token_2.
+        """
+        semantic_pairs = set()
+        for IND in self.containerINDs:
+            parent_attribute_ids = IND.get_UAC().get_attributes()
+            child_attribute_ids = IND.get_child_attributes()
+            for parent_id, child_id in zip(parent_attribute_ids, child_attribute_ids):
+                list_compared_tokens = []
+                if "iris_similarity" in self.scores:
+                    list_compared_tokens.append((self.name_tokens[parent_id], self.name_tokens[child_id]))
+                if "hybrid_similarity" in self.scores:
+                    list_compared_tokens.append((self.name_tokens[parent_id] + self.datastorage_tokens[parent_id],
+                                                 self.name_tokens[child_id] + self.datastorage_tokens[child_id]))
+                for parent_tokens, child_tokens in list_compared_tokens:
+                    for parent_token in parent_tokens:
+                        if self.token_similarity.get_maximum_syntactic_similarity(parent_token, child_tokens) >= 0.5:
+                            continue
+                        for child_token in child_tokens:
+                            semantic_pairs.add((min(parent_token, child_token), max(parent_token, child_token)))
+        return semantic_pairs
+
+    def _select_fk_metrics(self, fk_metric, compute_all_fk_metrics):
+        """
+        Selects the FK metrics to calculate.
+
+        Args:
+            fk_metric (str): Name of the configured FK metric. None for all metrics.
+            compute_all_fk_metrics (bool): If True, all metrics are selected.
+        Returns:
+            list: Names of the metrics to calculate.
+        """
+        if compute_all_fk_metrics or fk_metric is None:
+            return list(self.FK_METRICS)
+        if fk_metric not in self.FK_METRICS:
+            print(f"Unknown FK metric '{fk_metric}', all metrics are calculated.")
+            return list(self.FK_METRICS)
+        return [fk_metric]
+
+    def _calculate_name_weighted_similarity(self, parent_attribute_ids, child_attribute_ids):
+        """
+        Calculates the weighted syntactic name similarity of the HoPF approach. The names of the attributes and of
+        their datastorages are used.
+
+        Args:
+            parent_attribute_ids (list): The Attribute IDs of the parent.
+            child_attribute_ids (list): The Attribute IDs of the child.
+        Returns:
+            float: Similarty, between 0 and 1
+        """
+        count_attributes = len(child_attribute_ids)
+        name_weighted_similarity = 0.0
+        for i in range(count_attributes):
+            # Load tokens
+            parent_id = parent_attribute_ids[i]
+            parent_tokens = self.name_tokens[parent_id] + self.datastorage_tokens[parent_id]
+            child_id = child_attribute_ids[i]
+            child_tokens = self.name_tokens[child_id] + self.datastorage_tokens[child_id]
+            name_weighted_similarity += self._calculate_similarity(parent_tokens, child_tokens, self.token_weights)
+        return name_weighted_similarity / count_attributes
+
+    def _calculate_bhattacharyya(self, parent_attribute_ids, child_attribute_ids):
+        """
+        Calculates the similarity of the data distribution with the bhattacharyya coefficient.
+
+        Args:
+            parent_attribute_ids (list): The Attribute IDs of the parent.
+            child_attribute_ids (list): The Attribute IDs of the child.
+        Returns:
+            float: Similarty, between 0 and 1
+        """
+        count_attributes = len(child_attribute_ids)
+        bhattacharyya = 0.0
+        num_buckets = 20
+        for i in range(count_attributes):
+            parent_id = parent_attribute_ids[i]
+            child_id = child_attribute_ids[i]        
+            # Test types
+            parent_types = self.connector.get_attribute_types(parent_id)
+            if all(item in ("int") for item in parent_types):
+                # Contains only integer
+                parent_buckets, child_buckets = self._get_number_buckets(parent_id, child_id, "int", num_buckets)
+            elif all(item in ("int", "float") for item in parent_types):
+                # Contains only numbers
+                parent_buckets, child_buckets = self._get_number_buckets(parent_id, child_id, "float", num_buckets)
+            else:
+                # Contains other types
+                parent_buckets, child_buckets = self._get_string_buckets(parent_id, child_id, num_buckets)
+            # Calculate bhattacharyya coefficient
+            bhattacharyya += float(np.sqrt(parent_buckets * child_buckets).sum())
+        return bhattacharyya / count_attributes
+
+    def _calculate_iris_similarity(self, parent_attribute_ids, child_attribute_ids):
+        """
+        Calculates the name similarity of the IRIS approach. Only the names of the attributes are used.
+
+        Args:
+            parent_attribute_ids (list): The Attribute IDs of the parent.
+            child_attribute_ids (list): The Attribute IDs of the child.
+        Returns:
+            float: Similarty, between 0 and 1
+        """
+        count_attributes = len(child_attribute_ids)
+        iris_similarity = 0.0
+        for i in range(count_attributes):
+            # Load tokens
+            parent_tokens = self.name_tokens[parent_attribute_ids[i]]
+            child_tokens = self.name_tokens[child_attribute_ids[i]]
+            iris_similarity += self._calculate_token_similarity(parent_tokens, child_tokens)
+        return iris_similarity / count_attributes
+
+    def _calculate_hybrid_similarity(self, parent_attribute_ids, child_attribute_ids):
+        """
+        Calculates the weighted name similarity of the Hybrid approach. The names of the attributes and of their
+        datastorages are used.
+
+        Args:
+            parent_attribute_ids (list): The Attribute IDs of the parent.
+            child_attribute_ids (list): The Attribute IDs of the child.
+        Returns:
+            float: Similarty, between 0 and 1
+        """
+        count_attributes = len(child_attribute_ids)
+        hybrid_similarity = 0.0
+        for i in range(count_attributes):
+            # Load tokens
+            parent_id = parent_attribute_ids[i]
+            parent_tokens = self.name_tokens[parent_id] + self.datastorage_tokens[parent_id]
+            child_id = child_attribute_ids[i]
+            child_tokens = self.name_tokens[child_id] + self.datastorage_tokens[child_id]
+            hybrid_similarity += self._calculate_token_similarity(parent_tokens, child_tokens, self.token_weights)
+        return hybrid_similarity / count_attributes
+
+    def _calculate_token_similarity(self, parent_tokens, child_tokens, token_weights=None):
+        """
+        Calculates the name similarity of the IRIS and the Hybrid approach. Every parent token is compared with the
+        most similar child token. The semantic similarity is only used, if the syntactic similarity is below 0.5 and
+        the semantic similarity is 0.7 or higher.
+
+        Args:
+            parent_tokens (list): List of strings with the parent tokens.
+            child_tokens (list): List of strings with the child tokens.
+            token_weights (Optional[dict]): Dictionary with weights. If None, all tokens have the same weight.
+        Returns:
+            float: Similarty, between 0 and 1
+        """
+        parent_result = 0.0
+        sum_weight = 0.0
+        for parent_token in parent_tokens:
+            maximum_syn, maximum_sem = self.token_similarity.get_maximum_similarities(parent_token, child_tokens)
+            if maximum_syn >= 0.5:
+                maximum = maximum_syn
+            elif maximum_sem >= 0.7:
+                maximum = maximum_sem
+            else:
+                maximum = maximum_syn
+            if token_weights is None:
+                parent_result += maximum
+            else:
+                weight_for_token = token_weights.get(parent_token, None)
+                parent_result += maximum * weight_for_token
+                sum_weight += weight_for_token
+        if token_weights is None:
+            return parent_result / len(parent_tokens)
+        return parent_result / sum_weight
+
+    def _get_number_buckets(self, parent_id, child_id, number_type, num_buckets):
+        """
+        Returns the buckets of a numeric parent and child. The bucket bounds are set by the minimum and maximum of the
+        parent. The buckets are cached per attribute and bucket bounds, so every parent is only calculated once.
+
+        Args:
+            parent_id (int): The Attribute ID of the parent.
+            child_id (int): The Attribute ID of the child.
+            number_type (str): "int" or "float", the type to convert the values.
+            num_buckets (int): The number of buckets.
+        Returns:
+            tuple: The buckets (numpy.ndarray) of the parent and of the child.
+        """
+        parent_key = (parent_id, number_type, num_buckets)
+        if parent_key not in self.histograms:
+            values = self._load_numbers(parent_id, number_type)
+            # Python numbers, so the bounds are calculated without overflow
+            minimum = values[0].item() if isinstance(values[0], np.generic) else values[0]
+            maximum = values[-1].item() if isinstance(values[-1], np.generic) else values[-1]
+            self.histograms[parent_key] = (self._calculate_buckets_for_number(values, minimum, maximum, num_buckets),
+                                           minimum, maximum)
+        parent_buckets, minimum, maximum = self.histograms[parent_key]
+        child_key = (child_id, number_type, num_buckets, minimum, maximum)
+        if child_key not in self.histograms:
+            values = self._load_numbers(child_id, number_type)
+            self.histograms[child_key] = self._calculate_buckets_for_number(values, minimum, maximum, num_buckets)
+        return parent_buckets, self.histograms[child_key]
+
+    def _load_numbers(self, attribute_id, number_type):
+        """
+        Loads the distinct values of an attribute as numbers.
+
+        Args:
+            attribute_id (int): The Attribute ID of the attribute.
+            number_type (str): "int" or "float", the type to convert the values.
+        Returns:
+            numpy.ndarray: The sorted distinct numbers. Integers, that don't fit in 64 bits, are stored as Python int.
+        """
+        values = np.array(self.connector.get_values_for_attribute(attribute_id), dtype=str)
+        try:
+            if number_type == "int":
+                numbers = values.astype(np.int64)
+            else:
+                numbers = values.astype(np.float64)
+        except (ValueError, OverflowError):
+            # Values, that numpy can't convert (e.g. integers with more than 64 bits)
+            if number_type == "int":
+                numbers = np.array([int(value) for value in values], dtype=object)
+            else:
+                numbers = np.array([float(value) for value in values])
+        return np.unique(numbers)
 
-    def _calculate_buckets_for_number(self, value_set, minimum, maximum, num_buckets):
+    def _calculate_buckets_for_number(self, values, minimum, maximum, num_buckets):
         """
         Calculates the buckets for the bhattacharyya coefficient.
 
         Args:
-            value_set (set): The set with the values, values must be int or float.
+            values (numpy.ndarray): The sorted distinct values, values must be int or float.
             minimun (int, float): The minimum value.
             maximum (int, float): The maximum value.
             num_buckets (int): The number of buckets.
         Returns:
-            dictionary: Dictionary for the bhattacharyya coefficient.
+            numpy.ndarray: The share of the values in every bucket.
         """
         steps = (maximum - minimum) / num_buckets
-        count_entries = len(value_set)
-        # Creates dictionary with the buckts.
-        buckets = {"bucket" + str(i): 0.0 for i in range(1, num_buckets + 1)}
+        count_entries = len(values)
+        thresholds = []
         threshold = minimum # To count values <= threshold
         for i in range(1, num_buckets):
-            # Counts values for the buckets, skips the last one
+            # Thresholds of the buckets, skips the last one
             threshold += steps
-            count_smaller_or_equal = sum(1 for entry in value_set if entry <= threshold)
-            buckets["bucket" + str(i)] = count_smaller_or_equal
-        buckets["bucket" + str(num_buckets)] += count_entries # Builds the last bucket
-        for i in range(num_buckets, 1, -1):
-            # Calculates the values for the buckets, skips the first bucket
-            buckets["bucket" + str(i)] -= buckets["bucket" + str(i - 1)]
-            buckets["bucket" + str(i)] /= count_entries
-        buckets["bucket1"] /= count_entries # Calculates the first bucket
+            thresholds.append(threshold)
+        if values.dtype.kind != "f":
+            # For integers value <= threshold is value <= floor(threshold), so the integers are compared exactly
+            thresholds = [math.floor(threshold) for threshold in thresholds]
+            if values.dtype == np.int64:
+                # Thresholds outside of the range of the values don't change the counts
+                info = np.iinfo(np.int64)
+                thresholds = np.array([min(max(threshold, info.min), info.max) for threshold in thresholds],
+                                      dtype=np.int64)
+        # Counts the values <= threshold, the last bucket contains all values
+        count_smaller_or_equal = np.searchsorted(values, thresholds, side="right")
+        count_smaller_or_equal = np.append(count_smaller_or_equal, count_entries)
+        # Calculates the values for the buckets
+        buckets = np.diff(count_smaller_or_equal, prepend=0)
+        return buckets / count_entries
+
+    def _get_string_buckets(self, parent_id, child_id, num_buckets):
+        """
+        Returns the buckets of a parent and child with other types. The bucket bounds are the values at the quantiles
+        of the sorted parent values. The values are sorted in memory and counted with a binary search, the parent
+        buckets are cached.
+
+        Args:
+            parent_id (int): The Attribute ID of the parent.
+            child_id (int): The Attribute ID of the child.
+            num_buckets (int): The number of buckets.
+        Returns:
+            tuple: The buckets (numpy.ndarray) of the parent and of the child.
+        """
+        parent_key = (parent_id, "str", num_buckets)
+        if parent_key not in self.histograms:
+            values = sorted(self.connector.get_values_for_attribute(parent_id))
+            parent_count_entries = len(values)
+            steps = parent_count_entries / num_buckets
+            bounds = []
+            for i in range(1, num_buckets):
+                # Bounds of the buckets, skips the last one
+                offset = round(steps * i)
+                if offset >= parent_count_entries:
+                    # Its possible that the round function produces a greater value
+                    offset = parent_count_entries - 1
+                # Selects the value at a specific position
+                bounds.append(values[offset])
+            self.histograms[parent_key] = (self._calculate_buckets_for_string(values, bounds), bounds)
+        parent_buckets, bounds = self.histograms[parent_key]
+        child_key = (child_id, "str", num_buckets, parent_id)
+        if child_key not in self.histograms:
+            values = sorted(self.connector.get_values_for_attribute(child_id))
+            self.histograms[child_key] = self._calculate_buckets_for_string(values, bounds)
+        return parent_buckets, self.histograms[child_key]
+
+    def _calculate_buckets_for_string(self, values, bounds):
+        """
+        Calculates the buckets for the bhattacharyya coefficient.
 
-        return buckets
+        Args:
+            values (list): The sorted values.
+            bounds (list): The upper bounds of the buckets, without the last bucket.
+        Returns:
+            numpy.ndarray: The share of the values in every bucket.
+        """
+        count_entries = len(values)
+        # Counts the values <= bound, the last bucket contains all values
+        count_smaller_or_equal = [bisect_right(values, bound) for bound in bounds]
+        count_smaller_or_equal.append(count_entries)
+        # Calculates the values for the buckets
+        buckets = np.diff(count_smaller_or_equal, prepend=0)
+        return buckets / count_entries
 
     def _split_to_token(self, string):
         """
@@ -365,13 +511,11 @@ class ForeignkeyFinder:
                         selected_parent_token = token
                         selected_child_token = None
                         break
-                    # Calculates the fuzzy matching score for the best match
-                    token_result = process.extract(token, child_tokens, scorer=fuzz.ratio, limit=1)   
-                    score_result = token_result[0][1] # Selects the similarity
-                    score_result = score_result / 100 # Normalizes between 0 and 1
+                    # Selects the fuzzy matching score for the best match
+                    child_token, score_result = self.token_similarity.get_best_syntactic_match(token, child_tokens)
                     if max_score <= score_result:
                         max_score = score_result
-                        selected_child_token = token_result[0][0]
+                        selected_child_token = child_token
                         selected_parent_token = token
                 # Calculates score
                 count_tokens += 1
@@ -397,13 +541,11 @@ class ForeignkeyFinder:
                         selected_parent_token = token
                         selected_child_token = None
                         break
-                    # Calculates the fuzzy matching score for the best match
-                    token_result = process.extract(token, child_tokens, scorer=fuzz.ratio, limit=1)   
-                    score_result = token_result[0][1] # Selects the similarity
-                    score_result = score_result / 100 # Normalizes between 0 and 1
+                    # Selects the fuzzy matching score for the best match
+                    child_token, score_result = self.token_similarity.get_best_syntactic_match(token, child_tokens)
                     if max_score <= score_result:
                         max_score = score_result
-                        selected_child_token = token_result[0][0]
+                        selected_child_token = child_token
                         selected_parent_token = token
                 # Calculates score with token weight
                 weight_for_token = token_weights.get(selected_parent_token, None)
@@ -461,19 +603,4 @@ class ForeignkeyFinder:
                         min = None
                         max = None
                         name = self.connector.get_attribute_name(attribute)       
-                        self.containerAttributes.add_attribute(server, database, datastorage, attribute, min, max, name)   
-
-    def _alter_quotation_marks(self, input_string):
-        """
-        Alters single quotation marks in the input string by adding a backslash before them. It's needed for SQL queries.
-
-        Args:
-            input_string (str): The input string containing single quotation marks.
-
-        Returns:
-            str: The output string with single quotation marks altered by adding a backslash before them.
-        """
-        if "'" in input_string:
-            idx = input_string.index("'")
-            input_string = input_string[:idx] + "\\" + input_string[idx:]
-        return input_string
+                        self.containerAttributes.add_attribute(server, database, datastorage, attribute, min, max, name)
@@ -3,7 +3,20 @@ import itertools
 from services.Containers import ContainerAttributes
 from services.Containers import ContainerSingleAttributeFromUAC
 from services.Containers import ContainerUACs
+from services.UnaryINDEngines import SpiderEngine
+from services.UnaryINDEngines import InvertedIndexEngine
+from services.UnaryINDEngines import ParallelEngine
+from services.UnaryINDEngines import check_unary_IND
+from services.ValueSetCache import ValueSetCache
+from services.CandidatePruning import CandidatePruner
+from services.NaryINDVerification import TupleHashVerifier
+from services.SubsumptionIndex import SubsumptionIndex
+from services.PostingListIndex import PostingListIndex
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import os
 import random
+import math
 import time
 
 class INDFinder:
@@ -11,7 +24,9 @@ class INDFinder:
     INDFinder class for searching and handling Inclusion Dependencies (INDs) in a SQL-database.
     """
 
-    def __init__(self, connector, find_max_ind, speed_mode=0):
+    def __init__(self, connector, find_max_ind, speed_mode=0, unary_engine="pairwise", value_cache_size=256,
+                 unary_workers=0, approximate_epsilon=0.0, approximate_delta=0.05, max_ind_time_budget=0,
+                 max_ind_datastorage_time_budget=0, posting_list_cache_size=256, nary_workers=1):
         """
         Initializes a new instance of the INDFinder class.
 
@@ -19,10 +34,49 @@ class INDFinder:
           connector (DBConnector): An instance of DBConnector used for database connections.
           find_max_ind (bool): If true the prototyp will search for all maximal inlusion dependencies.
           speed_mode (int): Must be between 0 and 10. If greeter than 0 it uses heuristic methode to find N-ary INDs.
+          unary_engine (str): Methode to find the unary INDs. Possible: pairwise, spider, inverted_index, parallel
+          value_cache_size (int): Memory budget in MB for the cached value sets of the attributes. The cached parent
+                                  tuple sets of the N-ary IND verification use a budget of the same size.
+          unary_workers (int): Number of worker processes for the parallel engine. 0 uses one worker per CPU core.
+          approximate_epsilon (float): Maximum share of child values, that may be missing in the parent. If greater
+                                       than 0 approximate (partial) INDs are searched.
+          approximate_delta (float): Error probability of the confidence bound of the approximate unary INDs.
+          max_ind_time_budget (int): Time budget in seconds for the search of the maximal INDs. 0 for no limit.
+          max_ind_datastorage_time_budget (int): Time budget in seconds for the maximal INDs of one datastorage. 0 for
+                                                 no limit.
+          posting_list_cache_size (int): Memory budget in MB for the posting lists of the fast N-ary IND test.
+          nary_workers (int): Number of worker processes, that verify the N-ary IND candidates of the UACs. 1 verifies
+                              them in this process, 0 uses one worker per CPU core.
         """
         self.connector = connector
         self.find_max_ind = find_max_ind
         self.speed_mode = speed_mode
+        self.unary_engine = unary_engine
+        self.unary_engine_metrics = {}
+        self.value_cache = ValueSetCache(connector, value_cache_size)
+        self.value_cache_size = value_cache_size
+        self.unary_workers = unary_workers
+        self.candidate_pruner = None
+        self.pruning_metrics = {}
+        self.nary_verifier = TupleHashVerifier(connector, value_cache_size)
+        self.max_ind_metrics = {"number_of_candidates": 0, "max_level": 1, "non_exhaustive_datastorages": []}
+        self.max_ind_time_budget = max_ind_time_budget
+        self.max_ind_datastorage_time_budget = max_ind_datastorage_time_budget
+        self.posting_lists = PostingListIndex(connector, posting_list_cache_size)
+        self.posting_list_cache_size = posting_list_cache_size
+        if nary_workers <= 0:
+            nary_workers = os.cpu_count() or 1
+        self.nary_workers = nary_workers
+        self.nary_candidate_metrics = {"number_of_candidates": 0, "number_of_INDs": 0, "number_of_tasks": 0}
+        # Metrics of the worker processes, that verify the N-ary IND candidates
+        self.nary_worker_metrics = {"nary_verification_metrics": {}, "posting_list_metrics": {}}
+        self.subsumption_index = SubsumptionIndex()
+        self.approximate_epsilon = approximate_epsilon
+        self.approximate_delta = approximate_delta
+        self.approximate_verdicts = {}
+        # Unary INDs as adjacency lists, the IDs of the children for every parent ID
+        self.unary_IND_graph = {}
+        self.unary_IND_graph_metrics = {"number_of_reused_parents": 0}
 
 
     def find_inds(self):
@@ -68,36 +122,35 @@ class INDFinder:
             start_time = time.time()
             self.search_max_inds()
             time_metrics["time_find_max_inds"] = time.time() - start_time
+        time_metrics["unary_engine_metrics"] = self.unary_engine_metrics
+        time_metrics["value_cache_metrics"] = self.value_cache.get_metrics()
+        time_metrics["posting_list_metrics"] = self._sum_metrics(
+            self.posting_lists.get_metrics(), self.nary_worker_metrics["posting_list_metrics"])
+        time_metrics["nary_candidate_metrics"] = self.nary_candidate_metrics
+        time_metrics["pruning_metrics"] = self.pruning_metrics
+        time_metrics["nary_verification_metrics"] = self._sum_metrics(
+            self.nary_verifier.metrics, self.nary_worker_metrics["nary_verification_metrics"])
+        time_metrics["max_ind_metrics"] = self.max_ind_metrics
+        time_metrics["subsumption_index_metrics"] = self.subsumption_index.get_metrics()
+        time_metrics["approximate_metrics"] = self._get_approximate_metrics()
+        time_metrics["entry_bitmap_metrics"] = self.connector.get_entry_bitmap_metrics()
+        self._save_unary_IND_graph()
+        time_metrics["unary_IND_graph_metrics"] = self.unary_IND_graph_metrics
         return time_metrics
 
 
     def search_max_inds(self):
         """
-        Initiates the search for maximal Inclusion Dependencies (INDs) in the connected SQL-database.
+        Initiates the search for maximal Inclusion Dependencies (INDs) in the connected SQL-database. If a time budget
+        is set, the search stops at the deadline and the INDs found so far are saved. The datastorages, that weren't
+        searched exhaustively, are marked in the database.
         """
+        job_deadline = None
+        if self.max_ind_time_budget > 0:
+            job_deadline = time.time() + self.max_ind_time_budget
+
         # Check for unary Inclusiondependencies
-        for parent in self.containerAttributes:
-            parent_datastorage_id = parent.get_datastorage_id()
-            parent_id = parent.get_attribute_id()
-            parent_values = self.connector.get_values_for_attribute(parent_id)
-            parent_values = set(parent_values)
-            for child in self.containerAttributes:
-                child_datastorage_id = child.get_datastorage_id()
-                child_id = child.get_attribute_id()
-                if parent_datastorage_id != child_datastorage_id:
-                    child_min = child.get_min()
-                    child_max = child.get_max()
-                    # Checks min and max
-                    check = self.connector.check_if_value_exist(child_min, parent_id)
-                    if not check: continue
-                    check = self.connector.check_if_value_exist(child_max, parent_id)
-                    if not check: continue
-                    # Check for unary INDs
-                    child_values = self.connector.get_values_for_attribute(child_id)
-                    child_values = set(child_values)
-                    check = child_values.issubset(parent_values)
-                    if check:
-                        parent.add_IND(child)
+        self._search_unary_INDs(self.containerAttributes)
 
         # Check for arrays
         for attribute in self.containerAttributes:
@@ -120,7 +173,8 @@ class INDFinder:
                     child_datastorage_id = child.get_datastorage_id()
                     child_id = child.get_attribute_id()
                     self.connector.add_maxIND(parent_server_id, parent_database_id, parent_datastorage_id, [parent_id],
-                                              child_server_id, child_database_id, child_datastorage_id, [child_id])
+                                              child_server_id, child_database_id, child_datastorage_id, [child_id],
+                                              self._get_unary_coverage(parent_id, child_id))
                     parent.remove_IND(child)
             # Check if child is array
             for child in parent.get_INDs():
@@ -130,7 +184,8 @@ class INDFinder:
                     child_datastorage_id = child.get_datastorage_id()
                     child_id = child.get_attribute_id()
                     self.connector.add_maxIND(parent_server_id, parent_database_id, parent_datastorage_id, [parent_id],
-                                                child_server_id, child_database_id, child_datastorage_id, [child_id])
+                                                child_server_id, child_database_id, child_datastorage_id, [child_id],
+                                                self._get_unary_coverage(parent_id, child_id))
                     parent.remove_IND(child)
 
         # Get datastorages
@@ -150,121 +205,156 @@ class INDFinder:
         list_nary_inds = []
         for datastorage_id in list_datastorage_ids:
             list_parent_attributes = []
-            for attribute in self.containerAttributes:
-                if datastorage_id == attribute.get_datastorage_id():
-                    if attribute.get_INDs():
-                        list_parent_attributes.append(attribute)
+            for attribute in self.containerAttributes.get_attributes_of_datastorage(datastorage_id):
+                if attribute.get_INDs():
+                    list_parent_attributes.append(attribute)
             # Check if list is empty
             if not list_parent_attributes: continue
-            # Check for n-ary INDs
-            for i in range(len(list_parent_attributes), 0, -1):
-                parent_combinations_to_test = list(itertools.combinations(list_parent_attributes, i))
-                for parent_combination in parent_combinations_to_test:
-                    # Generat candidats
-                    list_unary_INDs_ids = []
-                    list_parent_ids = []
-                    for parent_attribute in parent_combination:
-                        list_parent_ids.append(parent_attribute.get_attribute_id())
-                        unary_inds = parent_attribute.get_INDs()
-                        unary_ind_ids = []
-                        for ind in unary_inds:
-                            unary_ind_ids.append(ind.get_attribute_id())
-                        list_unary_INDs_ids.append(unary_ind_ids)
-                    combinations_to_test = self._generate_combinations(list_unary_INDs_ids)
-                    # Test candidats
-                    for combination in combinations_to_test:
-                        # Test if there is an attribute more than one time in the list
-                        check = self._has_duplicates(combination)
-                        if check: continue
-                        # Test if combination is in the same datastorage
-                        check = self._test_if_attributes_in_same_datastorage(combination)
-                        if not check: continue
-                         # Test if a part of the N-ary IND candidate has a missing value
-                        check = self.connector.check_if_attribut_has_a_appropriate_entry_no(combination)
-                        if not check: continue
-                        # Test if combination is part of an greater IND
-                        check = False
-                        if list_nary_inds:
-                            for ind in list_nary_inds:
-                                if self._is_subsequence(list_parent_ids, ind["parent"]):
-                                    if self._is_subsequence(combination, ind["child"]):
-                                        check = True
-                                        break
-                        if check: continue
-                        #Test IND
-                        check = self._fast_Nary_IND_test(list_parent_ids, combination, num_of_tests)
-                        if not check: continue
-                        if self.speed_mode == 0:
-                            check = self.connector.Nary_IND_test(list_parent_ids, combination)
-                        # Add IND
-                        if check:
-                            result = {"parent": list_parent_ids, "child": combination}
-                            list_nary_inds.append(result)
+            deadline = job_deadline
+            if self.max_ind_datastorage_time_budget > 0:
+                datastorage_deadline = time.time() + self.max_ind_datastorage_time_budget
+                deadline = datastorage_deadline if deadline is None else min(deadline, datastorage_deadline)
+            # The stored parent tuples are only needed for this datastorage
+            self.nary_verifier.clear()
+            list_max_inds, is_exhaustive = self._search_max_INDs_levelwise(list_parent_attributes, num_of_tests,
+                                                                           deadline)
+            list_nary_inds.extend(list_max_inds)
+            self.connector.set_max_ind_exhaustive(datastorage_id, is_exhaustive)
+            if not is_exhaustive:
+                self.max_ind_metrics["non_exhaustive_datastorages"].append(datastorage_id)
         # Write result
         for ind in list_nary_inds:
             parent_attribute_ids = ind["parent"]
             child_attribute_ids = ind["child"]
             # Get server_id, database_id and datastorage_id of the IND
-            for attribute in self.containerAttributes:
-                if parent_attribute_ids[0] == attribute.get_attribute_id():
-                    parent_server_id = attribute.get_server_id()
-                    parent_database_id = attribute.get_database_id()
-                    parent_datastorage_id = attribute.get_datastorage_id()
-                if child_attribute_ids[0] == attribute.get_attribute_id():
-                    child_server_id = attribute.get_server_id()
-                    child_database_id = attribute.get_database_id()
-                    child_datastorage_id = attribute.get_datastorage_id()
+            attribute = self.containerAttributes.get_attribute(parent_attribute_ids[0])
+            parent_server_id = attribute.get_server_id()
+            parent_database_id = attribute.get_database_id()
+            parent_datastorage_id = attribute.get_datastorage_id()
+            attribute = self.containerAttributes.get_attribute(child_attribute_ids[0])
+            child_server_id = attribute.get_server_id()
+            child_database_id = attribute.get_database_id()
+            child_datastorage_id = attribute.get_datastorage_id()
             self.connector.add_maxIND(parent_server_id, parent_database_id, parent_datastorage_id, parent_attribute_ids,
-                   child_server_id, child_database_id, child_datastorage_id, child_attribute_ids)
+                   child_server_id, child_database_id, child_datastorage_id, child_attribute_ids, ind["coverage"])
             
+    def _search_max_INDs_levelwise(self, list_parent_attributes, num_of_tests, deadline=None):
+        """
+        Searches the maximal INDs for the parents of one datastorage level by level (MIND algorithm). The candidates
+        with k+1 attributes are generated from two valid INDs with k attributes, that share the first k-1 attribute
+        pairs. A candidate is only tested if all its INDs with k attributes are valid (apriori pruning). An IND is
+        maximal if it isn't covered by a larger IND in the subsumption index.
+        The candidates of the largest groups are tested first, because they can be extended to the largest INDs. At
+        the deadline the search stops, the result contains the INDs, that are maximal among the INDs found so far.
+
+        Args:
+            list_parent_attributes (list[Attribute]): The parent attributes of the datastorage with unary INDs.
+            num_of_tests (int): Number of entries for the fast N-ary IND test.
+            deadline (float): Time (as returned by time.time()) to stop the search. None for no limit.
+
+        Returns:
+            tuple: List of dictionaries with the Attribute IDs of the parents and children and the coverage of the
+                   maximal INDs and a bool, that is False if the search was stopped at the deadline.
+        """
+        # An IND is a tuple of pairs (position of the parent, ID of the child), sorted by the position of the parent
+        current_level = []
+        coverages = {}
+        for position, parent_attribute in enumerate(list_parent_attributes):
+            for child in parent_attribute.get_INDs():
+                ind = ((position, child.get_attribute_id()),)
+                current_level.append(ind)
+                coverages[ind] = self._get_unary_coverage(parent_attribute.get_attribute_id(), child.get_attribute_id())
+        levels = []
+        is_exhaustive = True
+        while current_level and is_exhaustive:
+            valid_INDs = set(current_level)
+            # Group the INDs by the first k-1 pairs
+            groups = {}
+            for ind in current_level:
+                groups.setdefault(ind[:-1], []).append(ind)
+            next_level = []
+            for group in sorted(groups.values(), key=len, reverse=True):
+                if not is_exhaustive: break
+                for ind_a, ind_b in itertools.combinations(group, 2):
+                    if ind_a[-1][0] == ind_b[-1][0]: continue
+                    if ind_a[-1][0] > ind_b[-1][0]:
+                        ind_a, ind_b = ind_b, ind_a
+                    candidate = ind_a + (ind_b[-1],)
+                    list_child_ids = [child_id for _, child_id in candidate]
+                    # Test if there is an attribute more than one time in the list
+                    if self._has_duplicates(list_child_ids): continue
+                    # Test if combination is in the same datastorage
+                    check = self._test_if_attributes_in_same_datastorage([list_child_ids[0], list_child_ids[-1]])
+                    if not check: continue
+                    # Apriori pruning, every IND with one attribute less must be valid
+                    check = all(candidate[:i] + candidate[i + 1:] in valid_INDs for i in range(len(candidate) - 2))
+                    if not check: continue
+                    if deadline is not None and time.time() > deadline:
+                        is_exhaustive = False
+                        break
+                    self.max_ind_metrics["number_of_candidates"] += 1
+                    list_parent_ids = [list_parent_attributes[position].get_attribute_id() for position, _ in candidate]
+                    # Test if a part of the N-ary IND candidate has a missing value
+                    check = self.connector.check_if_attribut_has_a_appropriate_entry_no(list_child_ids)
+                    if not check: continue
+                    #Test IND
+                    coverage = self._verify_Nary_IND(list_parent_ids, list_child_ids, num_of_tests)
+                    if coverage is not None:
+                        coverages[candidate] = coverage
+                        next_level.append(candidate)
+            levels.append(current_level)
+            if next_level:
+                self.max_ind_metrics["max_level"] = max(self.max_ind_metrics["max_level"], len(next_level[0]))
+            current_level = next_level
+        if current_level:
+            # The INDs of the stopped level are valid too
+            levels.append(current_level)
+        # Largest INDs first, an IND is maximal if it isn't covered by a larger IND
+        result = []
+        for level in reversed(levels):
+            for ind in level:
+                list_parent_ids = [list_parent_attributes[position].get_attribute_id() for position, _ in ind]
+                list_child_ids = [child_id for _, child_id in ind]
+                list_pairs = list(zip(list_parent_ids, list_child_ids))
+                if self.subsumption_index.is_covered(list_pairs): continue
+                self.subsumption_index.add(list_pairs)
+                result.append({"parent": list_parent_ids, "child": list_child_ids, "coverage": coverages[ind]})
+        return result, is_exhaustive
+
     def start_search(self):
         """
         Initiates the search for Inclusion Dependencies (INDs) in the connected SQL-database.
         """
         # Check for unary Inclusiondependencies
-        for parent in self.containerPartUACs:
-            parent_datastorage_id = parent.get_datastorage_id()
-            parent_id = parent.get_attribute_id()
-            parent_values = self.connector.get_values_for_attribute(parent_id)
-            parent_values = set(parent_values)
-            for child in self.containerAttributes:
-                child_datastorage_id = child.get_datastorage_id()
-                child_id = child.get_attribute_id()
-                if parent_datastorage_id != child_datastorage_id:
-                    child_min = child.get_min()
-                    child_max = child.get_max()
-                    # Checks min and max
-                    check = self.connector.check_if_value_exist(child_min, parent_id)
-                    if not check: continue
-                    check = self.connector.check_if_value_exist(child_max, parent_id)
-                    if not check: continue
-                    # Check for unary INDs
-                    child_values = self.connector.get_values_for_attribute(child_id)
-                    child_values = set(child_values)
-                    check = child_values.issubset(parent_values)
-                    if check:
-                        parent.add_IND(child)
+        if self.find_max_ind:
+            # The maximal INDs need the unary INDs of all attributes, so they are searched only once for both
+            self._build_unary_IND_graph(self.containerAttributes)
+        self._search_unary_INDs(self.containerPartUACs)
 
-        # Check UACs
+        # Set number of test for heuristic mode
+        if self.speed_mode == 0:
+            num_of_tests = 3
+        else:
+            num_of_tests = (11 - self.speed_mode) * 3
+
+        # Check UACs, the N-ary IND candidates are collected and verified afterwards
+        list_nary_candidates = []
         for UAC in self.containerUACs:
             list_UAC_attributes = UAC.get_attributes()
             # Unary UAC, with only one attribute
             if len(list_UAC_attributes) == 1:
                 UAC_attribute_id = list_UAC_attributes[0]
                 # Search for the part of UAC with the same ID
-                for partUAC in self.containerPartUACs:
-                    if UAC_attribute_id == partUAC.get_attribute_id():
-                        list_INDs = partUAC.get_INDs()
-                        # Checks if there is no IND
-                        if not list_INDs: break
-                        UAC_id = UAC.get_UAC_id()
-                        for IND in list_INDs:
-                            IND_server_id = IND.get_server_id()
-                            IND_database_id = IND.get_database_id()
-                            IND_datastorage_id = IND.get_datastorage_id()
-                            IND_attribute_id = IND.get_attribute_id()
-                            self.connector.add_IND(UAC_id, IND_server_id, IND_database_id, IND_datastorage_id, [IND_attribute_id])
-                        break # It´s not necessary to search the other parts
+                partUAC = self.containerPartUACs.get_partUAC(UAC_attribute_id)
+                UAC_id = UAC.get_UAC_id()
+                for IND in partUAC.get_INDs():
+                    IND_server_id = IND.get_server_id()
+                    IND_database_id = IND.get_database_id()
+                    IND_datastorage_id = IND.get_datastorage_id()
+                    IND_attribute_id = IND.get_attribute_id()
+                    coverage = self._get_unary_coverage(UAC_attribute_id, IND_attribute_id)
+                    self.connector.add_IND(UAC_id, IND_server_id, IND_database_id, IND_datastorage_id, [IND_attribute_id],
+                                           coverage)
             # N-ary UAC, with more than one attribute
             else:
                 # Build list with attribut IDs of the unary INDs
@@ -272,24 +362,19 @@ class INDFinder:
                 # Itterates every attribut of the UAC
                 for single_attribut_id_from_UAC in list_UAC_attributes:
                     # Search for the part of UAC with the same ID
-                    for partUAC in self.containerPartUACs:
-                        if single_attribut_id_from_UAC == partUAC.get_attribute_id():
-                            list_attribute_id_IND_part_UAC = []
-                            list_INDs = partUAC.get_INDs()
-                            # Checks if there is no IND
-                            if not list_INDs: break
-                            # Build list with attribute IDs of the INDs for the part of the UAC
-                            for IND in list_INDs:
-                                IND_attribute_id = IND.get_attribute_id()
-                                # Check if IND contains an array
-                                is_array = IND.get_is_array()
-                                if is_array is None:
-                                    # Needs to be tested if its a array
-                                    is_array = self.connector.check_if_attribute_contains_array(IND_attribute_id)
-                                    IND.set_is_array(is_array)
-                                if not is_array:
-                                    list_attribute_id_IND_part_UAC.append(IND_attribute_id)
-                            break # It´s not necessary to search the other parts
+                    partUAC = self.containerPartUACs.get_partUAC(single_attribut_id_from_UAC)
+                    list_attribute_id_IND_part_UAC = []
+                    # Build list with attribute IDs of the INDs for the part of the UAC
+                    for IND in partUAC.get_INDs():
+                        IND_attribute_id = IND.get_attribute_id()
+                        # Check if IND contains an array
+                        is_array = IND.get_is_array()
+                        if is_array is None:
+                            # Needs to be tested if its a array
+                            is_array = self.connector.check_if_attribute_contains_array(IND_attribute_id)
+                            IND.set_is_array(is_array)
+                        if not is_array:
+                            list_attribute_id_IND_part_UAC.append(IND_attribute_id)
                     # Skip empty IND list
                     if not list_attribute_id_IND_part_UAC: break
                     list_IND_attributes.append(list_attribute_id_IND_part_UAC)
@@ -311,26 +396,353 @@ class INDFinder:
                     if not check:
                         combination_INDs_to_test.remove(list_to_check)               
                 if not combination_INDs_to_test: continue # Next UAC if list of INDs is empty
-                # Check if its a N-ary IND
+                # Candidates for N-ary INDs
+                UAC_id = UAC.get_UAC_id()
                 for combination_to_test in combination_INDs_to_test:
-                    if self.speed_mode == 0:
-                        num_of_tests = 3
-                    else:
-                        num_of_tests = (11 - self.speed_mode) * 3
-                    check = self._fast_Nary_IND_test(list_UAC_attributes, combination_to_test, num_of_tests)
-                    if not check: continue
-                    if self.speed_mode == 0:
-                        check = self.connector.Nary_IND_test(list_UAC_attributes, combination_to_test)
+                    list_nary_candidates.append((UAC_id, list_UAC_attributes, combination_to_test))
+        # Check if its a N-ary IND
+        self.nary_candidate_metrics["number_of_candidates"] = len(list_nary_candidates)
+        if self.nary_workers > 1 and len(list_nary_candidates) > 1:
+            self._verify_Nary_candidates_parallel(list_nary_candidates, num_of_tests)
+        else:
+            self.nary_candidate_metrics["number_of_tasks"] = 1 if list_nary_candidates else 0
+            self._add_Nary_INDs(self._verify_Nary_candidates(list_nary_candidates, num_of_tests))
+
+    def _verify_Nary_candidates(self, list_nary_candidates, num_of_tests):
+        """
+        Verifies N-ary IND candidates one after another.
+
+        Args:
+            list_nary_candidates (list[tuple]): UAC ID, Attribute IDs of the UAC and of the children of every
+                                                candidate.
+            num_of_tests (int): Number of entries for the fast N-ary IND test.
+
+        Returns:
+            list: UAC ID, Attribute IDs of the children and coverage of every found IND.
+        """
+        result = []
+        current_UAC_id = None
+        for UAC_id, list_UAC_attributes, combination_to_test in list_nary_candidates:
+            if UAC_id != current_UAC_id:
+                # The stored parent tuples are only needed for this UAC
+                self.nary_verifier.clear()
+                current_UAC_id = UAC_id
+            coverage = self._verify_Nary_IND(list_UAC_attributes, combination_to_test, num_of_tests)
+            if coverage is not None:
+                result.append((UAC_id, combination_to_test, coverage))
+        return result
+
+    def _verify_Nary_candidates_parallel(self, list_nary_candidates, num_of_tests, task_size=64):
+        """
+        Verifies the N-ary IND candidates in worker processes. The candidates are split into tasks, that are taken
+        from the queue of the process pool by the workers. Every worker uses its own connection to the staging
+        database and its own posting lists for all its tasks. The found INDs of a task are written together, in the
+        order of the tasks. The metrics of the workers are summed.
+
+        Args:
+            list_nary_candidates (list[tuple]): UAC ID, Attribute IDs of the UAC and of the children of every candidate.
+            num_of_tests (int): Number of entries for the fast N-ary IND test.
+            task_size (int): Maximum number of candidates per task.
+        """
+        # The candidates of a UAC are in the same tasks, so the workers can reuse the tuples of the parent
+        list_tasks = []
+        task = []
+        for candidate in list_nary_candidates:
+            if task and (len(task) >= task_size or task[-1][0] != candidate[0]):
+                list_tasks.append(task)
+                task = []
+            task.append(candidate)
+        if task:
+            list_tasks.append(task)
+        self.nary_candidate_metrics["number_of_tasks"] = len(list_tasks)
+        connection_settings = (self.connector.DBType, self.connector.host, self.connector.port, self.connector.user,
+                               self.connector.password, self.connector.database)
+        finder_settings = {
+            "speed_mode": self.speed_mode,
+            "approximate_epsilon": self.approximate_epsilon,
+            "approximate_delta": self.approximate_delta,
+            "value_cache_size": max(1, self.value_cache_size // self.nary_workers),
+            "posting_list_cache_size": max(1, self.posting_list_cache_size // self.nary_workers)
+        }
+        # Spawn instead of fork, because the parent process uses threads and open connections
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=self.nary_workers, mp_context=context, initializer=_init_Nary_worker,
+                                 initargs=(connection_settings, finder_settings)) as executor:
+            futures = [executor.submit(_verify_Nary_candidates_in_worker, task, num_of_tests) for task in list_tasks]
+            # Writes the INDs in the order of the candidates, so the IDs of the INDs are the same in every run
+            for future in futures:
+                list_nary_INDs, worker_metrics = future.result()
+                self._add_Nary_INDs(list_nary_INDs)
+                for name, metrics in worker_metrics.items():
+                    self.nary_worker_metrics[name] = self._sum_metrics(self.nary_worker_metrics[name], metrics)
+
+    def _add_Nary_INDs(self, list_nary_INDs):
+        """
+        Writes the found N-ary INDs to the database.
+
+        Args:
+            list_nary_INDs (list[tuple]): UAC ID, Attribute IDs of the children and coverage of every IND.
+        """
+        list_INDs = []
+        for UAC_id, combination_to_test, coverage in list_nary_INDs:
+            # Get server_id, database_id and datastorage_id of the IND
+            attribute = self.containerAttributes.get_attribute(combination_to_test[0])
+            list_INDs.append((UAC_id, attribute.get_server_id(), attribute.get_database_id(),
+                              attribute.get_datastorage_id(), combination_to_test, coverage))
+        self.connector.add_INDs_batch(list_INDs)
+        self.nary_candidate_metrics["number_of_INDs"] += len(list_nary_INDs)
+
+    def _get_Nary_verification_metrics(self):
+        """
+        Returns the metrics of the N-ary IND verification, that are reported by the worker processes.
+
+        Returns:
+            dict: The metrics of the tuple verifier and of the posting lists.
+        """
+        return {
+            "nary_verification_metrics": dict(self.nary_verifier.metrics),
+            "posting_list_metrics": self.posting_lists.get_metrics()
+        }
+
+    def _sum_metrics(self, metrics, other_metrics):
+        """
+        Sums two dictionaries with numeric metrics.
+
+        Args:
+            metrics (dict): The first metrics.
+            other_metrics (dict): The metrics, that are added.
+
+        Returns:
+            dict: The summed metrics, missing keys count as 0.
+        """
+        summed_metrics = dict(metrics)
+        for key, value in other_metrics.items():
+            summed_metrics[key] = summed_metrics.get(key, 0) + value
+        return summed_metrics
+
+    def _search_unary_INDs(self, parents):
+        """
+        Adds the unary INDs of the unary IND graph to the given parents. Parents, that aren't in the graph yet, are
+        searched first.
+
+        Args:
+            parents (iterable): Parents with the methods of an attribute (Attribute or SingleAttributeFromUAC).
+        """
+        self._build_unary_IND_graph(parents)
+        for parent in parents:
+            for child_id in self.unary_IND_graph[parent.get_attribute_id()]:
+                parent.add_IND(self.containerAttributes.get_attribute(child_id))
+
+    def _build_unary_IND_graph(self, parents):
+        """
+        Searches the unary INDs for the given parents and adds them to the unary IND graph. Every attribute in another
+        datastorage is a possible child. Parents, that are already in the graph, aren't searched again.
+
+        Args:
+            parents (iterable): Parents with the methods of an attribute (Attribute or SingleAttributeFromUAC).
+        """
+        reused_parents = [parent for parent in parents if parent.get_attribute_id() in self.unary_IND_graph]
+        self.unary_IND_graph_metrics["number_of_reused_parents"] += len(reused_parents)
+        parents = [parent for parent in parents if parent.get_attribute_id() not in self.unary_IND_graph]
+        if not parents:
+            return
+        for parent in parents:
+            self.unary_IND_graph[parent.get_attribute_id()] = []
+        # The engines only find exact INDs
+        if self.unary_engine in ("spider", "inverted_index", "parallel") and self.approximate_epsilon <= 0:
+            if self.unary_engine == "spider":
+                engine = SpiderEngine(self.connector)
+            elif self.unary_engine == "inverted_index":
+                engine = InvertedIndexEngine(self.connector)
+            else:
+                engine = ParallelEngine(self.connector, self.unary_workers, self.value_cache_size)
+            list_parent_ids = [parent.get_attribute_id() for parent in parents]
+            if self.unary_engine == "parallel":
+                candidate_children = self._get_candidate_children(parents)
+                result = engine.find_unary_INDs(self.containerAttributes, list_parent_ids, candidate_children)
+            else:
+                result = engine.find_unary_INDs(self.containerAttributes, list_parent_ids)
+            self.unary_engine_metrics = engine.metrics
+            for parent in parents:
+                parent_id = parent.get_attribute_id()
+                children = result[parent_id]
+                # Keeps the order of the attributes
+                for child in self.containerAttributes:
+                    if child.get_attribute_id() in children:
+                        self.unary_IND_graph[parent_id].append(child.get_attribute_id())
+            return
+        candidate_children = self._get_candidate_children(parents)
+        # The bounds of the sketches are calculated once for every attribute
+        distinct_bounds = {attribute.get_attribute_id():
+                           self.connector.get_approx_distinct_bounds(attribute.get_attribute_id())
+                           for attribute in self.containerAttributes}
+        for parent in parents:
+            parent_id = parent.get_attribute_id()
+            parent_values = self.value_cache.get_value_set(parent_id)
+            for child in self.containerAttributes:
+                child_id = child.get_attribute_id()
+                if child_id in candidate_children[parent_id]:
+                    if self.approximate_epsilon > 0:
+                        # The sketches and min/max can't be used, the violating values are allowed
+                        check = self._check_approximate_unary_IND(parent_id, child_id, parent_values)
+                        if check:
+                            self.unary_IND_graph[parent_id].append(child_id)
+                        continue
+                    check = check_unary_IND(self.connector, self.value_cache, parent_id, parent_values,
+                                            distinct_bounds.get(parent_id), child_id, child.get_min(), child.get_max(),
+                                            distinct_bounds[child_id])
                     if check:
-                        UAC_id = UAC.get_UAC_id()
-                        # Get server_id, database_id and datastorage_id of the IND
-                        for attribute in self.containerAttributes:
-                            if combination_to_test[0] == attribute.get_attribute_id():
-                                IND_server_id = attribute.get_server_id()
-                                IND_database_id = attribute.get_database_id()
-                                IND_datastorage_id = attribute.get_datastorage_id()
-                                break
-                        self.connector.add_IND(UAC_id, IND_server_id, IND_database_id, IND_datastorage_id, combination_to_test)
+                        self.unary_IND_graph[parent_id].append(child_id)
+
+    def _save_unary_IND_graph(self):
+        """
+        Saves the unary IND graph with the coverage of every IND in the database, so the later stages can use it.
+        """
+        list_unary_INDs = []
+        for parent_id, list_child_ids in self.unary_IND_graph.items():
+            for child_id in list_child_ids:
+                list_unary_INDs.append((parent_id, child_id, self._get_unary_coverage(parent_id, child_id)))
+        self.connector.save_unary_INDs(list_unary_INDs)
+        self.unary_IND_graph_metrics["number_of_parents"] = len(self.unary_IND_graph)
+        self.unary_IND_graph_metrics["number_of_INDs"] = len(list_unary_INDs)
+
+    def _get_candidate_children(self, parents):
+        """
+        Prunes the pairs of parents and children with the features of the attributes. Only the remaining pairs are
+        tested with the values. The number of eliminated pairs per rule is added to self.pruning_metrics.
+
+        Args:
+            parents (iterable): Parents with the methods of an attribute (Attribute or SingleAttributeFromUAC).
+
+        Returns:
+            dict: The IDs of the possible children (set) for every parent ID.
+        """
+        if self.candidate_pruner is None:
+            self.candidate_pruner = CandidatePruner(self.connector)
+        list_child_ids = [child.get_attribute_id() for child in self.containerAttributes]
+        list_child_datastorage_ids = [child.get_datastorage_id() for child in self.containerAttributes]
+        list_parent_ids = [parent.get_attribute_id() for parent in parents]
+        list_parent_datastorage_ids = [parent.get_datastorage_id() for parent in parents]
+        candidates = self.candidate_pruner.get_candidates(list_child_ids, list_child_datastorage_ids,
+                                                          list_parent_ids, list_parent_datastorage_ids,
+                                                          self.approximate_epsilon > 0)
+        for key, value in self.candidate_pruner.metrics.items():
+            self.pruning_metrics[key] = self.pruning_metrics.get(key, 0) + value
+        candidate_children = {}
+        for j, parent_id in enumerate(list_parent_ids):
+            candidate_children[parent_id] = {list_child_ids[i] for i in candidates[:, j].nonzero()[0]}
+        return candidate_children
+
+    def _check_approximate_unary_IND(self, parent_id, child_id, parent_values):
+        """
+        Tests for an approximate unary IND. If the child values are cached or the child has less than
+        2 * n distinct values (n = 2 * ln(1/delta) / epsilon^2), all values are checked and the share of missing values
+        is exact. Otherwise a sample of about n distinct child values is loaded, selected by a hash of the values, and the
+        IND is accepted if the upper confidence bound (Hoeffding) of the share of missing values is at most epsilon.
+        The verdict is saved in self.approximate_verdicts.
+
+        Args:
+            parent_id (int): The Attribute ID of the parent Attribute to check.
+            child_id (int): The Attribute ID of the child Attribute to check.
+            parent_values (set): The values of the parent.
+
+        Returns:
+            bool: True if its an approximate unary IND.
+        """
+        sample_size = math.ceil(2 * math.log(1 / self.approximate_delta) / self.approximate_epsilon ** 2)
+        sample = None
+        if not self.value_cache.is_cached(child_id):
+            number_of_values = self.connector.get_approx_distinct_count(child_id)
+            if number_of_values is None:
+                number_of_values = self.connector.get_number_of_valueentries(child_id)
+            number_of_partitions = int(number_of_values // sample_size)
+            if number_of_partitions > 1:
+                # Only the values of one hash partition are loaded
+                sample = set(self.connector.get_hashed_sample_of_values(child_id, number_of_partitions))
+        if sample:
+            sample_size = len(sample)
+            margin = math.sqrt(math.log(1 / self.approximate_delta) / (2 * sample_size))
+        else:
+            # Exhaustive check, the share of missing values is exact
+            sample = self.value_cache.get_value_set(child_id)
+            sample_size = len(sample)
+            margin = 0.0
+        if not sample:
+            return False
+        violations = sum(1 for value in sample if value not in parent_values)
+        missing_share = violations / sample_size
+        verdict = {
+            "sample_size": sample_size,
+            "violations": violations,
+            "estimated_coverage": 1 - missing_share,
+            "coverage_lower_bound": max(0.0, 1 - missing_share - margin),
+            "bound": missing_share + margin
+        }
+        self.approximate_verdicts[(parent_id, child_id)] = verdict
+        return verdict["bound"] <= self.approximate_epsilon
+
+    def _get_unary_coverage(self, parent_id, child_id):
+        """
+        Returns the coverage of a found unary IND. Exact INDs have a coverage of 1.
+
+        Args:
+            parent_id (int): The Attribute ID of the parent Attribute.
+            child_id (int): The Attribute ID of the child Attribute.
+
+        Returns:
+            float: The estimated share of child values, that are included in the parent.
+        """
+        verdict = self.approximate_verdicts.get((parent_id, child_id))
+        if verdict is None:
+            return 1.0
+        return verdict["estimated_coverage"]
+
+    def _verify_Nary_IND(self, list_parent_ids, list_child_ids, num_of_tests):
+        """
+        Tests a N-ary IND candidate. Exact INDs are tested with the fast test and, if speed_mode is 0, with all
+        tuples. Approximate INDs are tested with all tuples and accepted if the coverage is at least 1 - epsilon.
+
+        Args:
+            list_parent_ids (list): The Attribute IDs of the parent Attributes to check.
+            list_child_ids (list): The Attribute IDs of the child Attributes to check.
+            num_of_tests (int): Number of entries for the fast N-ary IND test.
+
+        Returns:
+            float: The coverage of the IND, None if it isn't an IND.
+        """
+        if self.approximate_epsilon > 0:
+            coverage = self.nary_verifier.get_coverage(list_parent_ids, list_child_ids)
+            if coverage >= 1 - self.approximate_epsilon:
+                return coverage
+            return None
+        check = self._fast_Nary_IND_test(list_parent_ids, list_child_ids, num_of_tests)
+        if not check:
+            return None
+        if self.speed_mode == 0:
+            check = self.nary_verifier.check(list_parent_ids, list_child_ids)
+        if check:
+            return 1.0
+        return None
+
+    def _get_approximate_metrics(self):
+        """
+        Summarizes the verdicts of the approximate unary IND tests.
+
+        Returns:
+            dict: Epsilon, delta, number of tests, accepted INDs, sampled values and the verdicts of the INDs with
+                  violations.
+        """
+        accepted = {key: verdict for key, verdict in self.approximate_verdicts.items()
+                    if verdict["bound"] <= self.approximate_epsilon}
+        return {
+            "epsilon": self.approximate_epsilon,
+            "delta": self.approximate_delta,
+            "number_of_tests": len(self.approximate_verdicts),
+            "number_of_accepted": len(accepted),
+            "number_of_sampled_values": sum(verdict["sample_size"] for verdict in self.approximate_verdicts.values()),
+            "partial_INDs": [dict(verdict, parent_id=key[0], child_id=key[1])
+                             for key, verdict in accepted.items() if verdict["violations"] > 0]
+        }
 
     def _test_if_attributes_in_same_datastorage(self, list_attribute_ids):
         """
@@ -344,11 +756,8 @@ class INDFinder:
         """
         list_datasotrage_ids = []
         for attribute_id in list_attribute_ids:
-            for attribute in self.containerAttributes:                
-                if attribute_id == attribute.get_attribute_id():
-                    datastorage_id = attribute.get_datastorage_id()
-                    list_datasotrage_ids.append(datastorage_id)
-                    break
+            attribute = self.containerAttributes.get_attribute(attribute_id)
+            list_datasotrage_ids.append(attribute.get_datastorage_id())
         return all(element == list_datasotrage_ids[0] for element in list_datasotrage_ids)
 
     def _generate_combinations(self, input_list):
@@ -365,21 +774,6 @@ class INDFinder:
         unique_combinations = [list(combination) for combination in result if len(set(combination)) == len(combination)]
         return unique_combinations
 
-    def _is_subsequence(self, sub_list, main_list):
-        """
-        Check if all elements of sub_list are contained in main_list in the same order,
-        allowing for elements in between.
-
-        Args:
-            sub_list (list): The list of elements to check for as a subsequence.
-            main_list (list): The list in which to check for the subsequence.
-
-        Returns:
-            bool: True if sub_list is a subsequence of main_list, False otherwise.
-        """
-        it = iter(main_list)
-        return all(any(x == y for y in it) for x in sub_list)
-
     def _has_duplicates(self, lst):
         """
         Check if a list contains any duplicate values.
@@ -437,11 +831,8 @@ class INDFinder:
         Returns:
             boolean: True if its a unary IND.        
         """
-        parent_values = self.connector.get_values_for_attribute(parent_id)
-        child_values = self.connector.get_values_for_attribute(child_id)
-        # Cast values to set
-        parent_values = set(parent_values)
-        child_values = set(child_values)
+        parent_values = self.value_cache.get_value_set(parent_id)
+        child_values = self.value_cache.get_value_set(child_id)
         if child_values.issubset(parent_values):
             return True
         else:
@@ -449,36 +840,122 @@ class INDFinder:
         
     def _fast_Nary_IND_test(self, list_UAC_attributes, combination_to_test, num_of_tests):
         """
-        Fast check for inclusions dependencis. It only checks some of the entries.
+        Fast check for inclusions dependencis. It only checks some of the entries. The parent entries, that contain
+        the values of a sampled child entry, are found with the posting lists of the parents. If an attribute doesn't
+        fit in the memory budget of the posting lists, the values are loaded from the database.
 
         Args:
             list_UAC_attributes (list): The Attribute IDs of the parent Attributes to check. 
             combination_to_test (list): The Attribute IDs of the child Attributes to check. 
+            num_of_tests (int): Number of entries to check.
 
         Returns:
             boolean: True if it may be a N-ary IND.   
         """
-        def common_integer_exists(list_of_lists):
-            # Initialize a set with the elements of the first list
-            common_elements = set(list_of_lists[0])            
-            # Iterate over the remaining lists and update the set to keep only common elements
-            for lst in list_of_lists[1:]:
-                common_elements.intersection_update(lst)                
-            # Check if the set contains at least one element
-            return len(common_elements) > 0
+        child_indexes = []
+        parent_indexes = []
+        for child_id, parent_id in zip(combination_to_test, list_UAC_attributes):
+            child_index = self.posting_lists.get_attribute_index(child_id)
+            parent_index = self.posting_lists.get_attribute_index(parent_id)
+            if child_index is None or parent_index is None:
+                return self._fast_Nary_IND_test_sql(list_UAC_attributes, combination_to_test, num_of_tests)
+            child_indexes.append(child_index)
+            parent_indexes.append(parent_index)
+        entry_nos_to_test = child_indexes[0]["entry_nos"]
+        if len(entry_nos_to_test) < num_of_tests:
+            num_of_tests = len(entry_nos_to_test)
+        entry_nos_to_test = random.sample(entry_nos_to_test, num_of_tests)
+        for entry_no in entry_nos_to_test:
+            common_entry_nos = None
+            # Intersects the posting lists of the child values of the entry
+            for child_index, parent_index in zip(child_indexes, parent_indexes):
+                entry_nos = set()
+                for value in child_index["values"].get(entry_no, ()):
+                    entry_nos.update(parent_index["postings"].get(value, ()))
+                if common_entry_nos is None:
+                    common_entry_nos = entry_nos
+                else:
+                    common_entry_nos &= entry_nos
+                if not common_entry_nos:
+                    return False
+        return True
+
+    def _fast_Nary_IND_test_sql(self, list_UAC_attributes, combination_to_test, num_of_tests):
+        """
+        Fast check for inclusions dependencis. It only checks some of the entries. The values of the sampled child
+        entries and the matching parent entries are loaded with two queries.
 
+        Args:
+            list_UAC_attributes (list): The Attribute IDs of the parent Attributes to check. 
+            combination_to_test (list): The Attribute IDs of the child Attributes to check. 
+
+        Returns:
+            boolean: True if it may be a N-ary IND.   
+        """
         count_attributes = len(list_UAC_attributes)
         entry_nos_to_test = self.connector.get_list_of_entry_nos_for_attribute(combination_to_test[0])
         if len(entry_nos_to_test) < num_of_tests:
             num_of_tests = len(entry_nos_to_test)
         entry_nos_to_test = random.sample(entry_nos_to_test, num_of_tests)
+        # Load the values of the sampled child entries
+        child_values = {}
+        for entry_no, attribute_id, value in self.connector.get_values_for_entry_nos(combination_to_test,
+                                                                                     entry_nos_to_test):
+            child_values.setdefault((entry_no, attribute_id), []).append(value)
+        # Load the parent entries, that contain one of the child values
+        list_values = list({value for values in child_values.values() for value in values})
+        parent_entry_nos = {}
+        for attribute_id, value, entry_no in self.connector.get_entry_nos_for_values(list_UAC_attributes, list_values):
+            parent_entry_nos.setdefault((attribute_id, value), set()).add(entry_no)
         for entry_no in entry_nos_to_test:
-            result_list = []
-            # Selects the child values for the given entry_no and returns the entry_nos where the value is in the parent attribute
+            common_entry_nos = None
+            # Selects the child values for the given entry_no and the entry_nos where the value is in the parent attribute
             for i in range(count_attributes):
-                result = self.connector.get_related_entry_numbers(list_UAC_attributes[i], combination_to_test[i], entry_no)
-                result_list.append(result) # Builds a list of lists with the entry_nos
-            check = common_integer_exists(result_list)
-            if not check:
-                return False
-        return True
\ No newline at end of file
+                entry_nos = set()
+                for value in child_values.get((entry_no, combination_to_test[i]), []):
+                    entry_nos.update(parent_entry_nos.get((list_UAC_attributes[i], value), ()))
+                if common_entry_nos is None:
+                    common_entry_nos = entry_nos
+                else:
+                    common_entry_nos &= entry_nos
+                if not common_entry_nos:
+                    return False
+        return True
+
+# INDFinder of a worker process, created once per worker by _init_Nary_worker
+_worker_ind_finder = None
+
+def _init_Nary_worker(connection_settings, finder_settings):
+    """
+    Creates the connection to the staging database and the INDFinder of a worker process.
+
+    Args:
+        connection_settings (tuple): DBType, host, port, user, password and database of the staging database.
+        finder_settings (dict): Keyword arguments for the INDFinder of the worker.
+    """
+    # Imported here, so the INDFinder can be used without the database drivers
+    from services.DBConnector import DBConnector
+    global _worker_ind_finder
+    connector = DBConnector(*connection_settings)
+    connector.connect()
+    _worker_ind_finder = INDFinder(connector, False, **finder_settings)
+
+def _verify_Nary_candidates_in_worker(list_nary_candidates, num_of_tests):
+    """
+    Verifies a task of N-ary IND candidates. Runs in a worker process. The metrics of the worker are returned as
+    the difference to the previous task, so the main process can sum the metrics of all tasks.
+
+    Args:
+        list_nary_candidates (list[tuple]): UAC ID, Attribute IDs of the UAC and of the children of every candidate.
+        num_of_tests (int): Number of entries for the fast N-ary IND test.
+
+    Returns:
+        tuple: UAC ID, Attribute IDs of the children and coverage of every found IND (list) and the metrics of the
+               task (dict).
+    """
+    metrics_before = _worker_ind_finder._get_Nary_verification_metrics()
+    result = _worker_ind_finder._verify_Nary_candidates(list_nary_candidates, num_of_tests)
+    metrics = {}
+    for name, metrics_after in _worker_ind_finder._get_Nary_verification_metrics().items():
+        metrics[name] = {key: value - metrics_before[name][key] for key, value in metrics_after.items()}
+    return result, metrics
@@ -0,0 +1,146 @@
+from collections import OrderedDict
+from itertools import product
+import sys
+
+class TupleHashVerifier:
+    """
+    Verifies N-ary Inclusion Dependencies (INDs) in memory. The projected value tuples of the parent attributes are
+    stored in a hash set and the tuples of the child attributes are checked against it. The sets of the parents are
+    cached with a memory budget, the least recently used sets are evicted.
+    """
+
+    def __init__(self, connector, memory_budget=256):
+        """
+        Initializes the verifier.
+
+        Args:
+            connector (DBConnector): An instance of DBConnector used for database connections.
+            memory_budget (int): Maximum memory of the cached parent tuple sets in MB. 0 disables the cache.
+        """
+        self.connector = connector
+        self.memory_budget = memory_budget * 1024 * 1024
+        self.parent_tuples = OrderedDict()
+        self.sizes = {}
+        self.bytes_held = 0
+        self.metrics = {
+            "number_of_tests": 0,
+            "number_of_parent_tuple_sets": 0,
+            "number_of_checked_child_tuples": 0,
+            "number_of_evictions": 0
+        }
+
+    def check(self, list_parent_ids, list_child_ids):
+        """
+        Checks for N-ary INDs. The i-th child attribute must be included in the i-th parent attribute for every entry.
+        The test stops at the first child tuple, that isn't in the parent.
+
+        Args:
+            list_parent_ids (list): The Attribute IDs of the parent Attributes to check.
+            list_child_ids (list): The Attribute IDs of the child Attributes to check.
+
+        Returns:
+            bool: True if its a N-ary IND.
+        """
+        self.metrics["number_of_tests"] += 1
+        parent_tuples = self._get_parent_tuples(list_parent_ids)
+        for child_tuple in self._get_tuples(list_child_ids):
+            self.metrics["number_of_checked_child_tuples"] += 1
+            if child_tuple not in parent_tuples:
+                return False
+        return True
+
+    def get_coverage(self, list_parent_ids, list_child_ids):
+        """
+        Calculates the share of the distinct child tuples, that are included in the parent. Used for approximate
+        INDs, so all child tuples are checked. Like the coverage of the unary INDs, every distinct tuple is counted
+        once.
+
+        Args:
+            list_parent_ids (list): The Attribute IDs of the parent Attributes to check.
+            list_child_ids (list): The Attribute IDs of the child Attributes to check.
+
+        Returns:
+            float: The coverage between 0 and 1. 1 if the child has no tuples.
+        """
+        self.metrics["number_of_tests"] += 1
+        parent_tuples = self._get_parent_tuples(list_parent_ids)
+        child_tuples = set(self._get_tuples(list_child_ids))
+        self.metrics["number_of_checked_child_tuples"] += len(child_tuples)
+        if not child_tuples:
+            return 1.0
+        count_included = sum(1 for child_tuple in child_tuples if child_tuple in parent_tuples)
+        return count_included / len(child_tuples)
+
+    def clear(self):
+        """
+        Deletes the stored tuples of the parents. Should be called if the next tests use other parents.
+        """
+        self.parent_tuples = OrderedDict()
+        self.sizes = {}
+        self.bytes_held = 0
+
+    def _get_parent_tuples(self, list_parent_ids):
+        """
+        Returns the set of value tuples of the parent attributes. The set is only build again, if it was evicted.
+
+        Args:
+            list_parent_ids (list): The Attribute IDs of the parent Attributes.
+
+        Returns:
+            set: The value tuples.
+        """
+        key = tuple(list_parent_ids)
+        parent_tuples = self.parent_tuples.get(key)
+        if parent_tuples is not None:
+            self.parent_tuples.move_to_end(key)
+            return parent_tuples
+        parent_tuples = set(self._get_tuples(list_parent_ids))
+        self.metrics["number_of_parent_tuple_sets"] += 1
+        self._add_parent_tuples(key, parent_tuples)
+        return parent_tuples
+
+    def _add_parent_tuples(self, key, parent_tuples):
+        """
+        Adds a set of parent tuples to the cache and evicts the least recently used sets until the budget is kept.
+        Sets, that are bigger than the whole budget, aren't cached.
+
+        Args:
+            key (tuple): The Attribute IDs of the parent Attributes.
+            parent_tuples (set): The value tuples.
+        """
+        size = sys.getsizeof(parent_tuples)
+        for parent_tuple in parent_tuples:
+            size += sys.getsizeof(parent_tuple) + sum(sys.getsizeof(value) for value in parent_tuple)
+        if size > self.memory_budget:
+            return
+        while self.bytes_held + size > self.memory_budget:
+            evicted_key, _ = self.parent_tuples.popitem(last=False)
+            self.bytes_held -= self.sizes.pop(evicted_key)
+            self.metrics["number_of_evictions"] += 1
+        self.parent_tuples[key] = parent_tuples
+        self.sizes[key] = size
+        self.bytes_held += size
+
+    def _get_tuples(self, list_attribute_ids):
+        """
+        Streams the value tuples of the attributes entry by entry. Entries with a missing value are skipped. An
+        attribute with several values in one entry (array) results in one tuple for every combination.
+
+        Args:
+            list_attribute_ids (list): The Attribute IDs of the Attributes.
+
+        Yields:
+            tuple: The values of the attributes in the order of the list.
+        """
+        positions = {attribute_id: i for i, attribute_id in enumerate(list_attribute_ids)}
+        current_entry_no = None
+        entry_values = None
+        for entry_no, attribute_id, value in self.connector.get_values_ordered_by_entry_no(list_attribute_ids):
+            if entry_no != current_entry_no:
+                if entry_values is not None and all(entry_values):
+                    yield from product(*entry_values)
+                current_entry_no = entry_no
+                entry_values = [[] for _ in list_attribute_ids]
+            entry_values[positions[attribute_id]].append(value)
+        if entry_values is not None and all(entry_values):
+            yield from product(*entry_values)
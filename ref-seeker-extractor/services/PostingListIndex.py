@@ -0,0 +1,108 @@
+from collections import OrderedDict
+import sys
+
+class PostingListIndex:
+    """
+    Index of the values of attributes for the sampled N-ary IND tests. For every attribute the sorted entry numbers
+    of every value (posting lists) and the values of every entry are stored. The attributes are loaded on the first
+    use and the least recently used attributes are evicted, if the memory budget is exceeded.
+    """
+
+    def __init__(self, connector, memory_budget=256):
+        """
+        Initializes an empty index.
+
+        Args:
+            connector (DBConnector): An instance of DBConnector used for database connections.
+            memory_budget (int): Maximum memory of the index in MB. 0 disables the index.
+        """
+        self.connector = connector
+        self.memory_budget = memory_budget * 1024 * 1024
+        self.attribute_indexes = OrderedDict()
+        self.sizes = {}
+        # Attributes, that are bigger than the whole budget
+        self.too_large = set()
+        self.bytes_held = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_attribute_index(self, attribute_id):
+        """
+        Returns the index of the attribute. The index is build if it isn't stored.
+
+        Args:
+            attribute_id (int): The Attribute ID of the Attribute.
+
+        Returns:
+            dict: The sorted entry numbers ("entry_nos"), the values of every entry number ("values") and the sorted
+                  entry numbers of every value ("postings"). None if the attribute doesn't fit in the budget.
+        """
+        attribute_index = self.attribute_indexes.get(attribute_id)
+        if attribute_index is not None:
+            self.hits += 1
+            self.attribute_indexes.move_to_end(attribute_id)
+            return attribute_index
+        if self.memory_budget == 0 or attribute_id in self.too_large:
+            return None
+        self.misses += 1
+        attribute_index = self._build_attribute_index(attribute_id)
+        if attribute_index is None:
+            self.too_large.add(attribute_id)
+        return attribute_index
+
+    def _build_attribute_index(self, attribute_id):
+        """
+        Builds the index of an attribute and adds it to the stored indexes. The values are streamed ordered by the
+        entry number, so the posting lists are sorted. The build is stopped, if the index exceeds the whole budget.
+
+        Args:
+            attribute_id (int): The Attribute ID of the Attribute.
+
+        Returns:
+            dict: The index of the attribute, None if it is too large.
+        """
+        values = {}
+        postings = {}
+        size = 0
+        for entry_no, _, value in self.connector.get_values_ordered_by_entry_no([attribute_id]):
+            entry_values = values.get(entry_no)
+            if entry_values is None:
+                entry_values = []
+                values[entry_no] = entry_values
+                size += 64
+            entry_values.append(value)
+            posting_list = postings.get(value)
+            if posting_list is None:
+                posting_list = []
+                postings[value] = posting_list
+                size += sys.getsizeof(value) + 64
+            if not posting_list or posting_list[-1] != entry_no:
+                posting_list.append(entry_no)
+            size += 16
+            if size > self.memory_budget:
+                return None
+        attribute_index = {"entry_nos": tuple(values), "values": values, "postings": postings}
+        while self.bytes_held + size > self.memory_budget:
+            evicted_id, _ = self.attribute_indexes.popitem(last=False)
+            self.bytes_held -= self.sizes.pop(evicted_id)
+            self.evictions += 1
+        self.attribute_indexes[attribute_id] = attribute_index
+        self.sizes[attribute_id] = size
+        self.bytes_held += size
+        return attribute_index
+
+    def get_metrics(self):
+        """
+        Returns the metrics of the index.
+
+        Returns:
+            dict: Hits, misses, evictions, the number of too large attributes and the bytes held by the index.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "number_of_too_large_attributes": len(self.too_large),
+            "bytes_held": self.bytes_held
+        }
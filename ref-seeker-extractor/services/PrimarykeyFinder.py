@@ -1,5 +1,6 @@
 from services.Containers import ContainerUACs
 from scipy import stats
+import numpy as np
 
 
 class PrimarykeyFinder:
@@ -26,107 +27,151 @@ class PrimarykeyFinder:
 
     def start_calculating(self):
         """
-        
+        Calculates the primarykey scores for all UACs. The features of the attributes are loaded with one query
+        and the scores are calculated for all UACs at once.
         """
-        for UAC in self.containerUACs:
-            UAC_id = UAC.get_UAC_id()
-            list_attribute_ids = UAC.get_attributes()
-            # Cardinality
-            cardinality = 1 / len(list_attribute_ids)
-            # Value length
-            sum = 0  
-            for attribute_id in list_attribute_ids:
-                length = self.connector.get_max_value_length_of_attribute(attribute_id)
-                sum += length
-            average = sum / len(list_attribute_ids)
-            average -= self.max_value_length
-            maximum = max(1, average)
-            value_length = 1 / maximum
-            # Position
-            list_positions = []
-            for attribut_id in list_attribute_ids:
-                actual_postion = self.connector.get_attribute_position(attribut_id)
-                list_positions.append(actual_postion)
-            first_position = min (list_positions)
-            last_position = max(list_positions)
-            no_attributes_between = last_position - first_position - (len(list_attribute_ids) - 1)
-            # no_attributes_between can be less then 0 if there are arrays involved
-            if no_attributes_between < 0:
-                no_attributes_between = 0
-            position = ((1 / first_position) + (1 / (no_attributes_between + 1))) / 2
-            # Name suffix
-            count_suffixes = 0
-            for attribute_id in list_attribute_ids:
-                name = self.connector.get_attribute_name(attribute_id)
-                name =  name.lower()
-                for suffix in self.name_suffix:
-                    check = name.endswith(suffix)
-                    if check:
-                        count_suffixes += 1
-                        break
-            name_suffix = count_suffixes / len(list_attribute_ids)
-            # Datatype
-            datatype = 0
-            for attribute_id in list_attribute_ids:
-                data_types = self.connector.get_attribute_types(attribute_id)
-                if all(item in ("int") for item in data_types):
-                    # Contains only integer
-                    datatype = 1
-                elif all(item in ("str") for item in data_types):
-                    # Contains only string
-                    datatype = 1
-                elif all(item in ("elementId") for item in data_types):
-                    # Contains only elementId
-                    datatype = 1
-                    value_length = 1
-                elif all(item in ("DBRef") for item in data_types):
-                    # Contains only DBRef
-                    datatype = 1
-                    value_length = 1
-                elif all(item in ("ObjectId") for item in data_types):
-                    # Contains only ObjectId
-                    datatype = 1
-                    value_length = 1
-                else:
-                    # One attribute in the list contains a type other than string or integer
-                    datatype = 0
-                    break
-            # Write result to UAC
-            self.connector.add_UAC_PKscores(UAC_id, cardinality, value_length, position, name_suffix, datatype)
+        if len(self.containerUACs) == 0: return
+        # Load features of the attributes
+        features = self.connector.get_attribute_features()
+        attribute_indices = {feature["attribute_id"]: i for i, feature in enumerate(features)}
+        max_value_lengths = np.array([feature["max_value_length"] for feature in features], dtype=float)
+        positions = np.array([feature["average_position"] for feature in features], dtype=float)
+        name_suffixes = tuple(self.name_suffix)
+        has_suffix = np.array([feature["attribute_name"].lower().endswith(name_suffixes) for feature in features])
+        datatype_categories = np.array([self._get_datatype_category(feature["attribute_types"]) for feature in features])
+        # Build matrix with the attribute indices of the UACs, shorter UACs are filled with -1
+        list_UAC_ids = [UAC.get_UAC_id() for UAC in self.containerUACs]
+        max_attributes = max(len(UAC.get_attributes()) for UAC in self.containerUACs)
+        indices = np.full((len(list_UAC_ids), max_attributes), -1, dtype=int)
+        for row, UAC in enumerate(self.containerUACs):
+            for column, attribute_id in enumerate(UAC.get_attributes()):
+                indices[row, column] = attribute_indices[attribute_id]
+        mask = indices >= 0
+        safe_indices = np.where(mask, indices, 0)
+        count_attributes = mask.sum(axis=1)
+        # Cardinality
+        cardinality = 1 / count_attributes
+        # Value length
+        average = np.where(mask, max_value_lengths[safe_indices], 0).sum(axis=1) / count_attributes
+        average -= self.max_value_length
+        value_length = 1 / np.maximum(1, average)
+        # Position
+        first_position = np.where(mask, positions[safe_indices], np.inf).min(axis=1)
+        last_position = np.where(mask, positions[safe_indices], -np.inf).max(axis=1)
+        no_attributes_between = last_position - first_position - (count_attributes - 1)
+        # no_attributes_between can be less then 0 if there are arrays involved
+        no_attributes_between = np.maximum(no_attributes_between, 0)
+        position = ((1 / first_position) + (1 / (no_attributes_between + 1))) / 2
+        # Name suffix
+        name_suffix = np.where(mask, has_suffix[safe_indices], False).sum(axis=1) / count_attributes
+        # Datatype
+        categories = np.where(mask, datatype_categories[safe_indices], 1) # Filled entries don't change the result
+        is_other_type = categories == 0
+        datatype = (~is_other_type.any(axis=1)).astype(float)
+        # An attribute with an ID type sets the value length to 1, if there is no other type before it
+        first_other_type = np.where(is_other_type.any(axis=1), is_other_type.argmax(axis=1), max_attributes)
+        columns = np.arange(max_attributes)
+        is_id_type = (categories == 2) & (columns[np.newaxis, :] < first_other_type[:, np.newaxis])
+        value_length = np.where(is_id_type.any(axis=1), 1.0, value_length)
+        # Write result to UACs
+        list_scores = []
+        for row, UAC_id in enumerate(list_UAC_ids):
+            list_scores.append((UAC_id, float(cardinality[row]), float(value_length[row]), float(position[row]),
+                                float(name_suffix[row]), float(datatype[row])))
+        self.connector.add_UAC_PKscores_batch(list_scores)
+
+    def _get_datatype_category(self, data_types):
+        """
+        Categorizes the datatypes of an attribute for the datatype score.
+
+        Args:
+            data_types (list[str]): The types of the attribute.
+
+        Returns:
+            int: 1 for only integer or only string, 2 for only elementId, DBRef or ObjectId and 0 for other types.
+        """
+        if all(item in ("int") for item in data_types):
+            # Contains only integer
+            return 1
+        elif all(item in ("str") for item in data_types):
+            # Contains only string
+            return 1
+        elif all(item in ("elementId") for item in data_types):
+            # Contains only elementId
+            return 2
+        elif all(item in ("DBRef") for item in data_types):
+            # Contains only DBRef
+            return 2
+        elif all(item in ("ObjectId") for item in data_types):
+            # Contains only ObjectId
+            return 2
+        else:
+            # Contains a type other than string or integer
+            return 0
 
     def possibility_calculation(self):
         """
         Calculates the primarykey possibility for all UACs. Uses the HopF- and IRIS-DS-Calculation.
+        The thresholds are calculated once for every datastorage and metric.
         """
         PK_metrics_hopf = ["score_cardinality", "score_valuelenght", "score_position", "score_namesuffix"]
         PK_metrics_iris = ["score_cardinality", "score_valuelenght", "score_position", "score_namesuffix", "score_datatype"]
+        self.PKscore_thresholds = {}
+        PK_scores_hopf = self._load_PKscores("hopf", PK_metrics_hopf)
+        PK_scores_iris = self._load_PKscores("iris", PK_metrics_iris)
+        list_possibilities = []
         for UAC in self.containerUACs:
             UAC_id = UAC.get_UAC_id()
             UAC_datastorage_id = UAC.get_datastorage_id()
             # IRIS-Score
-            UAC_PK_score_iris = self.connector.calculate_PKscore_for_id(UAC_id, PK_metrics_iris)
-            PK_scores_iris = self.connector.calculate_PKscores_for_datastorage(UAC_datastorage_id, PK_metrics_iris)
-            PK_scores_max_iris = max(PK_scores_iris)
-            plateau_iris = self._detect_first_plateau(PK_scores_iris)
-            if UAC_PK_score_iris == PK_scores_max_iris:
-                iris_score = 2
-            elif UAC_PK_score_iris >= plateau_iris:
-                iris_score = 1
-            else:
-                iris_score = 0
+            iris_score = self._classify_PKscore(PK_scores_iris[UAC_id], UAC_datastorage_id, "iris")
             # HoPF-Score
-            UAC_PK_score_hopf = self.connector.calculate_PKscore_for_id(UAC_id, PK_metrics_hopf)
-            PK_scores_hopf = self.connector.calculate_PKscores_for_datastorage(UAC_datastorage_id, PK_metrics_hopf)
-            PK_scores_max_hopf = max(PK_scores_hopf)
-            plateau_hopf = self._detect_first_plateau(PK_scores_hopf)
-            if UAC_PK_score_hopf == PK_scores_max_hopf:
-                hopf_score = 2
-            elif UAC_PK_score_hopf >= plateau_hopf:
-                hopf_score = 1
-            else:
-                hopf_score = 0
-            # Write result to UAC
-            self.connector.add_UAC_possibility(UAC_id, hopf_score, iris_score)
+            hopf_score = self._classify_PKscore(PK_scores_hopf[UAC_id], UAC_datastorage_id, "hopf")
+            list_possibilities.append((UAC_id, hopf_score, iris_score))
+        # Write results to UACs
+        self.connector.add_UAC_possibilities_batch(list_possibilities)
+
+    def _load_PKscores(self, metric_name, PK_metrics):
+        """
+        Loads the PK scores of all UACs and calculates the thresholds for every datastorage.
+
+        Args:
+            metric_name (str): Name of the metric, used as key for the thresholds.
+            PK_metrics (list[str]): The name of the metrics for the PKscore.
+
+        Returns:
+            dict: The PK scores with the UAC ID as key.
+        """
+        PK_scores = {}
+        PK_scores_datastorages = {}
+        for UAC_id, datastorage_id, PK_score in self.connector.calculate_PKscores_for_all_UACs(PK_metrics):
+            PK_scores[UAC_id] = PK_score
+            PK_scores_datastorages.setdefault(datastorage_id, []).append(PK_score)
+        for datastorage_id, values in PK_scores_datastorages.items():
+            PK_score_max = max(values)
+            plateau = self._detect_first_plateau(values)
+            self.PKscore_thresholds[(datastorage_id, metric_name)] = (PK_score_max, plateau)
+        return PK_scores
+
+    def _classify_PKscore(self, PK_score, datastorage_id, metric_name):
+        """
+        Classifies the PK score of a UAC with the thresholds of its datastorage.
+
+        Args:
+            PK_score (float): The PK score of the UAC.
+            datastorage_id (int): The ID of the datastorage.
+            metric_name (str): Name of the metric.
+
+        Returns:
+            int: 2 if its the maximum of the datastorage, 1 if its on the plateau, else 0.
+        """
+        PK_score_max, plateau = self.PKscore_thresholds[(datastorage_id, metric_name)]
+        if PK_score == PK_score_max:
+            return 2
+        elif PK_score >= plateau:
+            return 1
+        else:
+            return 0
 
     def _detect_first_plateau(self, values):
         """
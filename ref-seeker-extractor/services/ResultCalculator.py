@@ -72,14 +72,12 @@ class ResultCalculator:
             if probability >= target_probability:
                 UAC_id = IND.get_UAC_id()
                 IND_id = IND.get_IND_id()
-                for UAC in self.containerUACs:
-                    # Select pk score
-                    if UAC_id == UAC.get_UAC_id():
-                        if self.pk_metric == "pk_score_hopf":
-                            pk_score = UAC.get_hopf_score()
-                        elif self.pk_metric == "pk_score_iris":
-                            pk_score = UAC.get_iris_score()
-                        break
+                UAC = self.containerUACs.get_UAC(UAC_id)
+                # Select pk score
+                if self.pk_metric == "pk_score_hopf":
+                    pk_score = UAC.get_hopf_score()
+                elif self.pk_metric == "pk_score_iris":
+                    pk_score = UAC.get_iris_score()
                 # Add reference to database
                 if pk_score >= 1:
                     self.connector.add_explicit_reference(UAC_id, IND_id)
@@ -42,4 +42,23 @@ class SettingsLoader:
             else:
                 return None  # Maybe use a default value
 
-        return current_level
\ No newline at end of file
+        return current_level
+
+    def get_arguments(self, key_chains):
+        """
+        Retrieves the values of several key chains as keyword arguments. Missing values are left out, so the default
+        values of the called function are used.
+
+        Args:
+            key_chains (dict): The names of the arguments with the key chains of their values.
+
+        Returns:
+            dict: The names of the arguments with the retrieved values.
+        """
+        arguments = {}
+        for name, key_chain in key_chains.items():
+            value = self.get_value(key_chain)
+            if value is not None:
+                arguments[name] = value
+
+        return arguments
@@ -0,0 +1,205 @@
+import os
+import sqlite3
+import time
+
+class SimilarityCache:
+    """
+    Persistent cache of the similarities of token pairs, shared by all jobs. The similarities are stored in a SQLite
+    file with the metric and the token pair as key. The first WordNet synset of every token is stored too, so tokens,
+    that are not in WordNet, are skipped without a lookup. If a table exceeds the maximum size, the least recently
+    used entries are evicted.
+    """
+
+    def __init__(self, file_path, max_entries=1000000):
+        """
+        Opens the cache file, the file and its directory are created if they don't exist.
+
+        Args:
+            file_path (str): Path of the SQLite file.
+            max_entries (int): Maximum number of stored similarities and of stored synsets.
+        """
+        self.file_path = file_path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.synset_hits = 0
+        self.synset_misses = 0
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Several jobs can use the file at the same time, so a writer waits for the lock
+        self.connection = sqlite3.connect(file_path, timeout=30)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS similarities (
+                metric TEXT NOT NULL,
+                token_1 TEXT NOT NULL,
+                token_2 TEXT NOT NULL,
+                similarity REAL NOT NULL,
+                last_used INTEGER NOT NULL,
+                PRIMARY KEY (metric, token_1, token_2)
+            ) WITHOUT ROWID;
+        """)
+        self.connection.execute("CREATE INDEX IF NOT EXISTS similarities_last_used ON similarities (last_used);")
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS synsets (
+                token TEXT NOT NULL,
+                synset TEXT,
+                last_used INTEGER NOT NULL,
+                PRIMARY KEY (token)
+            ) WITHOUT ROWID;
+        """)
+        self.connection.execute("CREATE INDEX IF NOT EXISTS synsets_last_used ON synsets (last_used);")
+        self.connection.commit()
+
+    def get_similarities(self, metric, list_pairs, batch_size=500):
+        """
+        Loads the stored similarities of the given token pairs. The found entries are marked as used. The stored
+        similarities are loaded by the first token, so a few queries are enough for all pairs of a vocabulary.
+
+        Args:
+            metric (str): Name of the metric.
+            list_pairs (list[tuple]): The token pairs (token_1, token_2).
+            batch_size (int): Maximum number of tokens per query.
+
+        Returns:
+            dict: The similarity for every found token pair (token_1, token_2).
+        """
+        set_pairs = set(list_pairs)
+        tokens = sorted({token_1 for token_1, _ in set_pairs})
+        similarities = {}
+        for start in range(0, len(tokens), batch_size):
+            batch = tokens[start:start + batch_size]
+            placeholders = ", ".join("?" for _ in batch)
+            query = f"""
+                SELECT token_1, token_2, similarity FROM similarities
+                WHERE metric = ? AND token_1 IN ({placeholders});
+            """
+            for token_1, token_2, similarity in self.connection.execute(query, [metric, *batch]):
+                if (token_1, token_2) in set_pairs:
+                    similarities[(token_1, token_2)] = similarity
+        self.hits += len(similarities)
+        self.misses += len(set_pairs) - len(similarities)
+        if similarities:
+            last_used = time.time_ns()
+            self.connection.executemany("""
+                UPDATE similarities SET last_used = ? WHERE metric = ? AND token_1 = ? AND token_2 = ?;
+            """, [(last_used, metric, token_1, token_2) for token_1, token_2 in similarities])
+            self.connection.commit()
+        return similarities
+
+    def add_similarities(self, metric, similarities):
+        """
+        Stores similarities and evicts the least recently used entries, if the cache is too large.
+
+        Args:
+            metric (str): Name of the metric.
+            similarities (dict): The similarity for every token pair (token_1, token_2).
+        """
+        if not similarities:
+            return
+        last_used = time.time_ns()
+        self.connection.executemany("""
+            INSERT OR REPLACE INTO similarities (metric, token_1, token_2, similarity, last_used)
+            VALUES (?, ?, ?, ?, ?);
+        """, [(metric, token_1, token_2, similarity, last_used)
+              for (token_1, token_2), similarity in similarities.items()])
+        self._evict_least_recently_used("similarities", "metric, token_1, token_2")
+        self.connection.commit()
+
+    def get_synsets(self, list_tokens, batch_size=500):
+        """
+        Loads the stored first synsets of the given tokens. The found entries are marked as used.
+
+        Args:
+            list_tokens (list[str]): The tokens.
+            batch_size (int): Maximum number of tokens per query.
+
+        Returns:
+            dict: The name of the first synset for every found token, None if the token is not in WordNet.
+        """
+        tokens = sorted(set(list_tokens))
+        synsets = {}
+        for start in range(0, len(tokens), batch_size):
+            batch = tokens[start:start + batch_size]
+            placeholders = ", ".join("?" for _ in batch)
+            query = f"SELECT token, synset FROM synsets WHERE token IN ({placeholders});"
+            for token, synset in self.connection.execute(query, batch):
+                synsets[token] = synset
+        self.synset_hits += len(synsets)
+        self.synset_misses += len(tokens) - len(synsets)
+        if synsets:
+            last_used = time.time_ns()
+            self.connection.executemany("UPDATE synsets SET last_used = ? WHERE token = ?;",
+                                        [(last_used, token) for token in synsets])
+            self.connection.commit()
+        return synsets
+
+    def add_synsets(self, synsets):
+        """
+        Stores the first synsets of tokens and evicts the least recently used entries, if the cache is too large.
+
+        Args:
+            synsets (dict): The name of the first synset for every token, None if the token is not in WordNet.
+        """
+        if not synsets:
+            return
+        last_used = time.time_ns()
+        self.connection.executemany("""
+            INSERT OR REPLACE INTO synsets (token, synset, last_used) VALUES (?, ?, ?);
+        """, [(token, synset, last_used) for token, synset in synsets.items()])
+        self._evict_least_recently_used("synsets", "token")
+        self.connection.commit()
+
+    def _evict_least_recently_used(self, table_name, key_columns):
+        """
+        Evicts the least recently used entries of a table, until the table has at most max_entries entries.
+
+        Args:
+            table_name (str): Name of the table.
+            key_columns (str): The columns of the primary key, separated by commas.
+        """
+        number_of_entries = self.connection.execute(f"SELECT COUNT(*) FROM {table_name};").fetchone()[0]
+        if number_of_entries > self.max_entries:
+            number_to_evict = number_of_entries - self.max_entries
+            self.connection.execute(f"""
+                DELETE FROM {table_name} WHERE ({key_columns}) IN (
+                    SELECT {key_columns} FROM {table_name} ORDER BY last_used LIMIT ?
+                );
+            """, (number_to_evict,))
+            self.evictions += number_to_evict
+
+    def get_number_of_entries(self):
+        """
+        Returns the number of stored similarities.
+
+        Returns:
+            int: The number of entries.
+        """
+        return self.connection.execute("SELECT COUNT(*) FROM similarities;").fetchone()[0]
+
+    def get_metrics(self):
+        """
+        Returns the metrics of the cache.
+
+        Returns:
+            dict: Hits, misses, hit rate, evictions, the number of stored similarities and the hits, misses and number
+                  of the stored synsets.
+        """
+        number_of_lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / number_of_lookups if number_of_lookups else 0.0,
+            "evictions": self.evictions,
+            "number_of_entries": self.get_number_of_entries(),
+            "synset_hits": self.synset_hits,
+            "synset_misses": self.synset_misses,
+            "number_of_synsets": self.connection.execute("SELECT COUNT(*) FROM synsets;").fetchone()[0]
+        }
+
+    def close(self):
+        """
+        Closes the cache file.
+        """
+        self.connection.close()
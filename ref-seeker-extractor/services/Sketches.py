@@ -0,0 +1,149 @@
+import hashlib
+import math
+
+class HyperLogLog:
+    """
+    Probabilistic sketch to estimate the number of distinct values of an attribute.
+    """
+
+    def __init__(self, precision=12):
+        """
+        Initializes an empty sketch.
+
+        Args:
+            precision (int): Number of bits used for the register index. The sketch uses 2^precision registers
+                             (one byte each), the default needs 4 KB per attribute.
+        """
+        self.precision = precision
+        self.number_of_registers = 1 << precision
+        self.registers = bytearray(self.number_of_registers)
+        # Bias correction constant (see Flajolet et al.)
+        self.alpha = 0.7213 / (1 + 1.079 / self.number_of_registers)
+
+    def add(self, value):
+        """
+        Adds a value to the sketch.
+
+        Args:
+            value (str): The value to add.
+        """
+        hash_value = int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+        index = hash_value >> (64 - self.precision)
+        remaining_bits = hash_value & ((1 << (64 - self.precision)) - 1)
+        # Position of the first 1-bit in the remaining bits
+        rank = (64 - self.precision) - remaining_bits.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def count(self):
+        """
+        Estimates the number of distinct values added to the sketch.
+
+        Returns:
+            float: The estimated number of distinct values.
+        """
+        m = self.number_of_registers
+        estimate = self.alpha * m * m / sum(2.0 ** -register for register in self.registers)
+        empty_registers = self.registers.count(0)
+        if estimate <= 2.5 * m and empty_registers > 0:
+            # Linear counting for small cardinalities
+            estimate = m * math.log(m / empty_registers)
+        return estimate
+
+    def get_relative_error(self):
+        """
+        Returns the standard error of the estimation relative to the number of distinct values.
+
+        Returns:
+            float: The relative standard error.
+        """
+        return 1.04 / math.sqrt(self.number_of_registers)
+
+    def get_bounds(self, num_std_errors=3):
+        """
+        Returns a lower and an upper bound for the number of distinct values. The absolute slack of 3 values covers
+        hash collisions, which dominate the error for very small cardinalities.
+
+        Args:
+            num_std_errors (int): Width of the interval in standard errors.
+
+        Returns:
+            tuple: Lower and upper bound (float, float).
+        """
+        estimate = self.count()
+        margin = num_std_errors * self.get_relative_error() * estimate + 3
+        return max(0.0, estimate - margin), estimate + margin
+
+class BloomFilter:
+    """
+    Probabilistic set of the distinct values of an attribute. A value that is not in the filter is definitely not in
+    the attribute. All filters use the same size and number of hash functions, so two filters can be compared bitwise.
+    """
+
+    def __init__(self, number_of_bits=65536, number_of_hashes=4, bit_array=None):
+        """
+        Initializes an empty filter or a filter from a stored bit array.
+
+        Args:
+            number_of_bits (int): Size of the filter in bits. The default needs 8 KB per attribute.
+            number_of_hashes (int): Number of hash functions per value.
+            bit_array (bytes): Stored bit array of a filter with the same parameters.
+        """
+        self.number_of_bits = number_of_bits
+        self.number_of_hashes = number_of_hashes
+        if bit_array is None:
+            self.bit_array = bytearray((number_of_bits + 7) // 8)
+        else:
+            self.bit_array = bytearray(bit_array)
+
+    def _get_positions(self, value):
+        """
+        Calculates the bit positions of a value with double hashing.
+
+        Args:
+            value (str): The value.
+
+        Returns:
+            list: The bit positions.
+        """
+        digest = hashlib.blake2b(value.encode("utf-8"), digest_size=16).digest()
+        hash_1 = int.from_bytes(digest[:8], "big")
+        hash_2 = int.from_bytes(digest[8:], "big") | 1
+        return [(hash_1 + i * hash_2) % self.number_of_bits for i in range(self.number_of_hashes)]
+
+    def add(self, value):
+        """
+        Adds a value to the filter.
+
+        Args:
+            value (str): The value to add.
+        """
+        for position in self._get_positions(value):
+            self.bit_array[position >> 3] |= 1 << (position & 7)
+
+    def might_be_subset_of(self, other):
+        """
+        Checks if all values of this filter may be in the other filter. Every bit of a value in this filter is also set
+        in the other filter if the value is included, so one missing bit is a definite miss for at least one value.
+
+        Args:
+            other (BloomFilter): The filter with the same parameters to compare with.
+
+        Returns:
+            bool: False if at least one value is definitely not in the other filter.
+        """
+        if other.number_of_bits != self.number_of_bits or other.number_of_hashes != self.number_of_hashes:
+            # Not comparable
+            return True
+        own_bits = int.from_bytes(self.bit_array, "big")
+        other_bits = int.from_bytes(other.bit_array, "big")
+        return own_bits & ~other_bits == 0
+
+    def to_bytes(self):
+        """
+        Returns the bit array to store the filter.
+
+        Returns:
+            bytes: The bit array.
+        """
+        return bytes(self.bit_array)
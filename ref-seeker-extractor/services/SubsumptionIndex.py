@@ -0,0 +1,85 @@
+class SubsumptionIndex:
+    """
+    Set-trie of the found Inclusion Dependencies (INDs). An IND is stored as sorted set of (parent ID, child ID)
+    pairs. The index answers, if a candidate is covered by a stored IND, without scanning all stored INDs.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty index.
+        """
+        self.root = {}
+        self.number_of_nodes = 0
+        self.number_of_INDs = 0
+        self.number_of_lookups = 0
+        self.number_of_visited_nodes = 0
+
+    def add(self, list_pairs):
+        """
+        Adds an IND to the index.
+
+        Args:
+            list_pairs (list[tuple]): The (parent ID, child ID) pairs of the IND.
+        """
+        node = self.root
+        for pair in sorted(list_pairs):
+            child_node = node.get(pair)
+            if child_node is None:
+                child_node = {}
+                node[pair] = child_node
+                self.number_of_nodes += 1
+            node = child_node
+        self.number_of_INDs += 1
+
+    def is_covered(self, list_pairs):
+        """
+        Checks if a stored IND contains all pairs of the given IND.
+
+        Args:
+            list_pairs (list[tuple]): The (parent ID, child ID) pairs of the IND.
+
+        Returns:
+            bool: True if the IND is covered by a stored IND.
+        """
+        self.number_of_lookups += 1
+        return self._search_superset(self.root, sorted(list_pairs), 0)
+
+    def _search_superset(self, node, list_pairs, index):
+        """
+        Searches a path in the trie, that contains the remaining pairs. Every node is part of a stored IND, so a
+        path is found if all pairs are matched.
+
+        Args:
+            node (dict): The current node.
+            list_pairs (list[tuple]): The sorted pairs of the IND.
+            index (int): Index of the next pair to match.
+
+        Returns:
+            bool: True if a superset was found.
+        """
+        if index == len(list_pairs):
+            return True
+        self.number_of_visited_nodes += 1
+        for pair, child_node in node.items():
+            if pair < list_pairs[index]:
+                # The pair isn't part of the IND, the stored IND can contain more pairs
+                if self._search_superset(child_node, list_pairs, index):
+                    return True
+            elif pair == list_pairs[index]:
+                if self._search_superset(child_node, list_pairs, index + 1):
+                    return True
+        return False
+
+    def get_metrics(self):
+        """
+        Returns the metrics of the index.
+
+        Returns:
+            dict: Number of nodes, stored INDs, lookups and visited nodes.
+        """
+        return {
+            "number_of_nodes": self.number_of_nodes,
+            "number_of_INDs": self.number_of_INDs,
+            "number_of_lookups": self.number_of_lookups,
+            "number_of_visited_nodes": self.number_of_visited_nodes
+        }
@@ -0,0 +1,186 @@
+import os
+import numpy as np
+from rapidfuzz import process, fuzz
+import nltk
+# Set path for nltk corpus
+path = os.path.join(".", "nltk_data")
+nltk.data.path.append(path)
+from nltk.corpus import wordnet # Need to install cospus: https://www.nltk.org/data.html
+
+class TokenSimilarity:
+    """
+    Vocabulary of the tokens of the schema names with the precomputed similarities of all token pairs. The syntactic
+    similarity (fuzz.ratio) is computed once for the whole vocabulary. The semantic similarity (Wu-Palmer similarity
+    of the first WordNet synsets) is only computed for the token pairs, that are compared. The first synsets and the
+    semantic similarities can be loaded from a persistent cache.
+    """
+
+    SEMANTIC_METRIC = "wup_similarity"
+
+    def __init__(self, tokens, similarity_cache=None):
+        """
+        Builds the vocabulary and computes the syntactic similarity matrix. The semantic similarities are computed
+        by calculate_semantic_similarities.
+
+        Args:
+            tokens (iterable[str]): The tokens of the names, duplicates are allowed.
+            similarity_cache (SimilarityCache): Persistent cache for the semantic similarities. None for no cache.
+        """
+        self.similarity_cache = similarity_cache
+        self.tokens = sorted(set(tokens))
+        self.positions = {token: i for i, token in enumerate(self.tokens)}
+        self.syntactic_matrix = self._calculate_syntactic_matrix()
+        self.semantic_matrix = None
+
+    def calculate_semantic_similarities(self, semantic_pairs):
+        """
+        Computes the semantic similarity matrix for the given token pairs.
+
+        Args:
+            semantic_pairs (iterable[tuple]): The token pairs (token_1, token_2), that need the semantic similarity,
+                                              with token_1 <= token_2. If empty, WordNet isn't used.
+        """
+        self.semantic_matrix = self._calculate_semantic_matrix(semantic_pairs)
+
+    def _calculate_syntactic_matrix(self):
+        """
+        Calculates the syntactic similarity of all token pairs.
+
+        Returns:
+            numpy.ndarray: Matrix with the similarities between 0 and 1.
+        """
+        if not self.tokens:
+            return np.zeros((0, 0))
+        matrix = process.cdist(self.tokens, self.tokens, scorer=fuzz.ratio, dtype=np.float64)
+        return matrix / 100 # Result is in perecentage
+
+    def _calculate_semantic_matrix(self, semantic_pairs):
+        """
+        Calculates the semantic similarity of the given token pairs, the other pairs have a similarity of 0. The
+        Wu-Palmer similarity is symmetric, so every pair is calculated once. Pairs with a token, that is not in
+        WordNet, have a similarity of 0 and aren't stored in the cache. Pairs, that are in the cache, aren't
+        calculated again.
+
+        Args:
+            semantic_pairs (iterable[tuple]): The token pairs (token_1, token_2) with token_1 <= token_2.
+
+        Returns:
+            numpy.ndarray: Matrix with the similarities.
+        """
+        semantic_pairs = list(semantic_pairs)
+        if not semantic_pairs:
+            return np.zeros((len(self.tokens), len(self.tokens)))
+        synset_names = self._get_first_synset_names({token for pair in semantic_pairs for token in pair})
+        list_pairs = [(token_1, token_2) for token_1, token_2 in semantic_pairs
+                      if synset_names[token_1] is not None and synset_names[token_2] is not None]
+        store_pairs = self.similarity_cache is not None
+        if store_pairs and len(list_pairs) > self.similarity_cache.max_entries:
+            # The pairs would evict each other
+            print(f"Warning: {len(list_pairs)} token pairs exceed the similarity cache "
+                  f"({self.similarity_cache.max_entries} entries), the pairs aren't cached.")
+            store_pairs = False
+        if store_pairs:
+            similarities = self.similarity_cache.get_similarities(self.SEMANTIC_METRIC, list_pairs)
+        else:
+            similarities = {}
+        # Calculate the missing pairs, every synset is loaded only once
+        synsets = {}
+        new_similarities = {}
+        for token_1, token_2 in list_pairs:
+            if (token_1, token_2) in similarities: continue
+            for token in (token_1, token_2):
+                if token not in synsets:
+                    synsets[token] = wordnet.synset(synset_names[token])
+            result = synsets[token_1].wup_similarity(synsets[token_2])
+            if result is None:
+                result = 0.0
+            else:
+                result /= 100 # Result is in perecentage
+            new_similarities[(token_1, token_2)] = result
+        if store_pairs:
+            self.similarity_cache.add_similarities(self.SEMANTIC_METRIC, new_similarities)
+        similarities.update(new_similarities)
+        matrix = np.zeros((len(self.tokens), len(self.tokens)))
+        for (token_1, token_2), result in similarities.items():
+            i = self.positions[token_1]
+            j = self.positions[token_2]
+            matrix[i, j] = result
+            matrix[j, i] = result
+        return matrix
+
+    def _get_first_synset_names(self, tokens):
+        """
+        Returns the name of the first WordNet synset of every token. The names are loaded from the cache, only the
+        missing tokens are looked up in WordNet.
+
+        Args:
+            tokens (iterable[str]): The tokens.
+
+        Returns:
+            dict: The name of the first synset for every token, None if the token is not in WordNet.
+        """
+        tokens = list(tokens)
+        if self.similarity_cache is not None:
+            synset_names = self.similarity_cache.get_synsets(tokens)
+        else:
+            synset_names = {}
+        new_synset_names = {}
+        for token in tokens:
+            if token in synset_names: continue
+            synsets = wordnet.synsets(token)
+            new_synset_names[token] = synsets[0].name() if synsets else None
+        if self.similarity_cache is not None:
+            self.similarity_cache.add_synsets(new_synset_names)
+        synset_names.update(new_synset_names)
+        return synset_names
+
+    def get_best_syntactic_match(self, token, list_tokens):
+        """
+        Returns the most similar token of the list. If several tokens have the same similarity, the first is used.
+
+        Args:
+            token (str): The token to compare.
+            list_tokens (list[str]): The tokens to compare with, must not be empty.
+
+        Returns:
+            tuple: The most similar token and its similarity.
+        """
+        similarities = self.syntactic_matrix[self.positions[token], [self.positions[item] for item in list_tokens]]
+        index = int(np.argmax(similarities))
+        return list_tokens[index], float(similarities[index])
+
+    def get_maximum_syntactic_similarity(self, token, list_tokens):
+        """
+        Returns the highest syntactic similarity of the token to the tokens of the list.
+
+        Args:
+            token (str): The token to compare.
+            list_tokens (list[str]): The tokens to compare with.
+
+        Returns:
+            float: The highest syntactic similarity, 0 if the list is empty.
+        """
+        if not list_tokens:
+            return 0.0
+        columns = [self.positions[item] for item in list_tokens]
+        return float(self.syntactic_matrix[self.positions[token], columns].max())
+
+    def get_maximum_similarities(self, token, list_tokens):
+        """
+        Returns the highest syntactic and semantic similarity of the token to the tokens of the list. Needs the
+        semantic similarities.
+
+        Args:
+            token (str): The token to compare.
+            list_tokens (list[str]): The tokens to compare with.
+
+        Returns:
+            tuple: The highest syntactic and the highest semantic similarity, 0 if the list is empty.
+        """
+        if not list_tokens:
+            return 0.0, 0.0
+        row = self.positions[token]
+        columns = [self.positions[item] for item in list_tokens]
+        maximum_syn = float(self.syntactic_matrix[row, columns].max())
+        maximum_sem = float(self.semantic_matrix[row, columns].max())
+        return maximum_syn, maximum_sem
@@ -0,0 +1,424 @@
+from concurrent.futures import ProcessPoolExecutor
+import heapq
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+from services.ValueSetCache import ValueSetCache
+
+class SortedValueReader:
+    """
+    Reads the sorted values of one attribute from a file. Only a small block of values is held in memory and the
+    file is closed between two blocks, so thousands of attributes can be merged without running out of file handles.
+    """
+
+    def __init__(self, file_path, block_size=1000):
+        """
+        Initializes the reader.
+
+        Args:
+            file_path (str): Path to the file with one JSON encoded value per line.
+            block_size (int): Number of values read at once.
+        """
+        self.file_path = file_path
+        self.block_size = block_size
+        self.offset = 0
+        self.finished = False
+
+    def __iter__(self):
+        """
+        Yields the values of the file in sorted order.
+
+        Yields:
+            str: The next value.
+        """
+        while not self.finished:
+            block = self._read_block()
+            for value in block:
+                yield value
+
+    def _read_block(self):
+        """
+        Reads the next block of values from the file.
+
+        Returns:
+            list: The values of the block.
+        """
+        block = []
+        with open(self.file_path, "rb") as f:
+            f.seek(self.offset)
+            for _ in range(self.block_size):
+                line = f.readline()
+                if not line:
+                    self.finished = True
+                    break
+                block.append(json.loads(line))
+            self.offset = f.tell()
+        return block
+
+class UnaryINDEngine:
+    """
+    Base class for the engines, that find all unary Inclusion Dependencies (INDs) at once. The candidate parents of
+    every attribute are stored as bitset and every value removes the parents, that don't contain the value.
+    """
+
+    def __init__(self, connector):
+        """
+        Initializes the engine.
+
+        Args:
+            connector (DBConnector): An instance of DBConnector used for database connections.
+        """
+        self.connector = connector
+        self.metrics = {}
+
+    def _init_candidates(self, attributes, list_parent_ids):
+        """
+        Initializes the candidate bitsets. Parents in the same datastorage are excluded.
+
+        Args:
+            attributes (list[Attribute]): All attributes, every attribute is a possible child.
+            list_parent_ids (list[int]): The IDs of the possible parent attributes.
+        """
+        # Every parent gets a bit in the candidate bitsets
+        self.parent_bits = {parent_id: 1 << i for i, parent_id in enumerate(list_parent_ids)}
+        all_parents = (1 << len(list_parent_ids)) - 1
+        datastorage_bits = {}
+        for attribute in attributes:
+            bit = self.parent_bits.get(attribute.get_attribute_id(), 0)
+            datastorage_id = attribute.get_datastorage_id()
+            datastorage_bits[datastorage_id] = datastorage_bits.get(datastorage_id, 0) | bit
+        self.candidates = {}
+        for attribute in attributes:
+            self.candidates[attribute.get_attribute_id()] = all_parents & ~datastorage_bits[attribute.get_datastorage_id()]
+        # An attribute without values is not a child
+        self.attributes_with_values = set()
+
+    def _refine_candidates(self, list_attribute_ids):
+        """
+        Removes all parents from the candidates of the given attributes, that don't contain the current value.
+
+        Args:
+            list_attribute_ids (iterable[int]): The IDs of the attributes, that contain the current value.
+        """
+        value_bits = 0
+        for attribute_id in list_attribute_ids:
+            value_bits |= self.parent_bits.get(attribute_id, 0)
+        for attribute_id in list_attribute_ids:
+            self.candidates[attribute_id] &= value_bits
+            self.attributes_with_values.add(attribute_id)
+
+    def _build_result(self, list_parent_ids):
+        """
+        Builds the result from the candidate bitsets.
+
+        Args:
+            list_parent_ids (list[int]): The IDs of the possible parent attributes.
+
+        Returns:
+            dict: The IDs of the children (set) for every parent ID.
+        """
+        result = {parent_id: set() for parent_id in list_parent_ids}
+        for child_id, bits in self.candidates.items():
+            if not bits or child_id not in self.attributes_with_values: continue
+            for parent_id, bit in self.parent_bits.items():
+                if bits & bit:
+                    result[parent_id].add(child_id)
+        return result
+
+class SpiderEngine(UnaryINDEngine):
+    """
+    Finds all unary Inclusion Dependencies (INDs) with one sort-merge pass over all attributes (SPIDER algorithm).
+    """
+
+    def __init__(self, connector, block_size=1000):
+        """
+        Initializes the engine.
+
+        Args:
+            connector (DBConnector): An instance of DBConnector used for database connections.
+            block_size (int): Number of values per attribute, that are held in memory during the merge.
+        """
+        super().__init__(connector)
+        self.block_size = block_size
+
+    def find_unary_INDs(self, containerAttributes, list_parent_ids):
+        """
+        Searches the unary INDs between the given parents and all attributes. The values of every attribute are
+        streamed in binary order from the database, the duplicates are adjacent and are skipped. The distinct values
+        are written to a file. The files are merged and every value refines the candidates of the attributes, that
+        contain the value.
+
+        Args:
+            containerAttributes (ContainerAttributes): All attributes, every attribute is a possible child.
+            list_parent_ids (list[int]): The IDs of the possible parent attributes.
+
+        Returns:
+            dict: The IDs of the children (set) for every parent ID.
+        """
+        attributes = list(containerAttributes)
+        self._init_candidates(attributes, list_parent_ids)
+        count_values = 0
+        with tempfile.TemporaryDirectory() as directory:
+            # Write sorted values to files
+            readers = []
+            for attribute in attributes:
+                attribute_id = attribute.get_attribute_id()
+                file_path = os.path.join(directory, f"{attribute_id}.jsonl")
+                count_attribute_values = 0
+                with open(file_path, "wb") as f:
+                    previous_value = None
+                    for value in self.connector.get_sorted_values_for_attribute(attribute_id):
+                        if count_attribute_values and value == previous_value: continue
+                        f.write(json.dumps(value).encode("ascii") + b"\n")
+                        previous_value = value
+                        count_attribute_values += 1
+                if not count_attribute_values: continue
+                reader = SortedValueReader(file_path, self.block_size)
+                readers.append(self._tag_values(reader, attribute_id))
+            # Merge the sorted values of all attributes
+            current_value = None
+            current_attribute_ids = []
+            for value, attribute_id in heapq.merge(*readers):
+                if current_attribute_ids and value != current_value:
+                    self._refine_candidates(current_attribute_ids)
+                    count_values += 1
+                    current_attribute_ids = []
+                current_value = value
+                current_attribute_ids.append(attribute_id)
+            if current_attribute_ids:
+                self._refine_candidates(current_attribute_ids)
+                count_values += 1
+        self.metrics = {
+            "engine": "spider",
+            "number_of_attributes": len(attributes),
+            "number_of_parents": len(list_parent_ids),
+            "number_of_distinct_values": count_values
+        }
+        return self._build_result(list_parent_ids)
+
+    def _tag_values(self, reader, attribute_id):
+        """
+        Adds the attribute ID to the values of a reader.
+
+        Args:
+            reader (SortedValueReader): The reader with the sorted values.
+            attribute_id (int): The ID of the attribute.
+
+        Yields:
+            tuple: The value and the attribute ID.
+        """
+        for value in reader:
+            yield value, attribute_id
+
+class InvertedIndexEngine(UnaryINDEngine):
+    """
+    Finds all unary Inclusion Dependencies (INDs) with an inverted index from every value to the attributes, that
+    contain the value (De Marchi et al.). The index is held in memory, so the data must fit in RAM.
+    """
+
+    def find_unary_INDs(self, containerAttributes, list_parent_ids):
+        """
+        Searches the unary INDs between the given parents and all attributes. The index is built with one pass over
+        the values. The parents of a child are the intersection of the attribute sets of all its values.
+
+        Args:
+            containerAttributes (ContainerAttributes): All attributes, every attribute is a possible child.
+            list_parent_ids (list[int]): The IDs of the possible parent attributes.
+
+        Returns:
+            dict: The IDs of the children (set) for every parent ID.
+        """
+        attributes = list(containerAttributes)
+        self._init_candidates(attributes, list_parent_ids)
+        # Build inverted index, the sets remove the duplicates
+        index = {}
+        for attribute_id, value in self.connector.get_attribute_values():
+            attribute_ids = index.get(value)
+            if attribute_ids is None:
+                index[value] = attribute_ids = set()
+            attribute_ids.add(attribute_id)
+        # Intersect the attribute sets
+        for attribute_ids in index.values():
+            self._refine_candidates(attribute_ids)
+        self.metrics = {
+            "engine": "inverted_index",
+            "number_of_attributes": len(attributes),
+            "number_of_parents": len(list_parent_ids),
+            "number_of_distinct_values": len(index),
+            "index_size_bytes": self._get_index_size(index)
+        }
+        return self._build_result(list_parent_ids)
+
+    def _get_index_size(self, index):
+        """
+        Estimates the memory footprint of the inverted index.
+
+        Args:
+            index (dict): The inverted index.
+
+        Returns:
+            int: The size in bytes.
+        """
+        size = sys.getsizeof(index)
+        for value, attribute_ids in index.items():
+            size += sys.getsizeof(value) + sys.getsizeof(attribute_ids)
+        return size
+
+class ParallelEngine(UnaryINDEngine):
+    """
+    Finds all unary Inclusion Dependencies (INDs) with the pairwise tests. The parents are split into shards, that
+    are checked in worker processes. Every worker uses its own connection to the staging database and its own value
+    cache for all its shards.
+    """
+
+    def __init__(self, connector, number_of_workers=0, value_cache_size=256):
+        """
+        Initializes the engine.
+
+        Args:
+            connector (DBConnector): An instance of DBConnector used for database connections.
+            number_of_workers (int): Number of worker processes. 0 uses one worker per CPU core.
+            value_cache_size (int): Memory budget in MB for the cached value sets, shared by all workers.
+        """
+        super().__init__(connector)
+        if number_of_workers <= 0:
+            number_of_workers = os.cpu_count() or 1
+        self.number_of_workers = number_of_workers
+        self.value_cache_size = value_cache_size
+
+    def find_unary_INDs(self, containerAttributes, list_parent_ids, candidate_children=None):
+        """
+        Searches the unary INDs between the given parents and all attributes.
+
+        Args:
+            containerAttributes (ContainerAttributes): All attributes, every attribute is a possible child.
+            list_parent_ids (list[int]): The IDs of the possible parent attributes.
+            candidate_children (dict): The IDs of the possible children (set) for every parent ID. If None, all
+                                       attributes in other datastorages are tested.
+
+        Returns:
+            dict: The IDs of the children (set) for every parent ID.
+        """
+        list_children = []
+        datastorage_ids = {}
+        for attribute in containerAttributes:
+            attribute_id = attribute.get_attribute_id()
+            datastorage_ids[attribute_id] = attribute.get_datastorage_id()
+            list_children.append((attribute_id, attribute.get_datastorage_id(), attribute.get_min(), attribute.get_max(),
+                                  self.connector.get_approx_distinct_bounds(attribute_id)))
+        if candidate_children is None:
+            candidate_children = {}
+        # The sketches are only in the memory of this process, so their bounds are sent to the workers
+        list_parents = [(parent_id, datastorage_ids[parent_id], candidate_children.get(parent_id),
+                         self.connector.get_approx_distinct_bounds(parent_id))
+                        for parent_id in list_parent_ids]
+        # Several small shards per worker, so a worker with large parents doesn't slow down the others
+        number_of_shards = min(len(list_parents), self.number_of_workers * 4)
+        shards = [list_parents[i::number_of_shards] for i in range(number_of_shards)]
+        connection_settings = (self.connector.DBType, self.connector.host, self.connector.port, self.connector.user,
+                               self.connector.password, self.connector.database)
+        worker_cache_size = max(1, self.value_cache_size // self.number_of_workers)
+        result = {parent_id: set() for parent_id in list_parent_ids}
+        if shards:
+            # Spawn instead of fork, because the parent process uses threads and open connections
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=self.number_of_workers, mp_context=context,
+                                     initializer=_init_unary_worker,
+                                     initargs=(connection_settings, list_children, worker_cache_size)) as executor:
+                futures = [executor.submit(_check_parents, shard) for shard in shards]
+                for future in futures:
+                    for parent_id, children in future.result().items():
+                        result[parent_id].update(children)
+        self.metrics = {
+            "engine": "parallel",
+            "number_of_attributes": len(list_children),
+            "number_of_parents": len(list_parent_ids),
+            "number_of_workers": self.number_of_workers,
+            "number_of_shards": len(shards)
+        }
+        return result
+
+def check_unary_IND(connector, value_cache, parent_id, parent_values, parent_bounds, child_id, child_min, child_max,
+                    child_bounds):
+    """
+    Tests a unary IND candidate with the pairwise checks. The cheap checks run first: the estimated number of
+    distinct values, the Bloom filters and the min and max of the child. The value sets are only compared, if all
+    checks pass.
+
+    Args:
+        connector (DBConnector): An instance of DBConnector used for database connections.
+        value_cache (ValueSetCache): The cache of the value sets.
+        parent_id (int): The Attribute ID of the parent.
+        parent_values (set): The values of the parent.
+        parent_bounds (tuple): Lower and upper bound of the number of distinct values of the parent, None if unknown.
+        child_id (int): The Attribute ID of the child.
+        child_min (str): The minimum value of the child.
+        child_max (str): The maximum value of the child.
+        child_bounds (tuple): Lower and upper bound of the number of distinct values of the child, None if unknown.
+
+    Returns:
+        bool: True if its a unary IND.
+    """
+    # Checks the estimated number of distinct values
+    if parent_bounds is not None and child_bounds is not None:
+        if child_bounds[0] > parent_bounds[1]: return False
+    # Checks the values with the Bloom filters, a bit of the child filter, that is not set in the parent filter, is a
+    # definite miss
+    parent_filter = connector.get_bloom_filter(parent_id)
+    child_filter = connector.get_bloom_filter(child_id)
+    if parent_filter is not None and child_filter is not None:
+        if not child_filter.might_be_subset_of(parent_filter): return False
+    # Checks min and max
+    if not connector.check_if_value_exist(child_min, parent_id): return False
+    if not connector.check_if_value_exist(child_max, parent_id): return False
+    # Check for unary INDs
+    return value_cache.get_value_set(child_id).issubset(parent_values)
+
+# Connection, possible children and value cache of a worker process, created once per worker by _init_unary_worker
+_worker_connector = None
+_worker_children = None
+_worker_value_cache = None
+
+def _init_unary_worker(connection_settings, list_children, value_cache_size):
+    """
+    Creates the connection to the staging database and the value cache of a worker process of the ParallelEngine.
+
+    Args:
+        connection_settings (tuple): DBType, host, port, user, password and database of the staging database.
+        list_children (list[tuple]): Attribute ID, datastorage ID, min, max and bounds of the number of distinct
+                                     values of every possible child.
+        value_cache_size (int): Memory budget in MB for the cached value sets.
+    """
+    # Imported here, so the engines can be used without the database drivers
+    from services.DBConnector import DBConnector
+    global _worker_connector, _worker_children, _worker_value_cache
+    _worker_connector = DBConnector(*connection_settings)
+    _worker_connector.connect()
+    _worker_children = list_children
+    _worker_value_cache = ValueSetCache(_worker_connector, value_cache_size)
+
+def _check_parents(list_parents):
+    """
+    Checks the unary INDs for a shard of parents. Runs in a worker process of the ParallelEngine.
+
+    Args:
+        list_parents (list[tuple]): Attribute ID, datastorage ID, possible children (set or None) and bounds of the
+                                    number of distinct values of every parent.
+
+    Returns:
+        dict: The IDs of the children (list) for every parent ID.
+    """
+    result = {}
+    for parent_id, parent_datastorage_id, parent_candidates, parent_bounds in list_parents:
+        parent_values = _worker_value_cache.get_value_set(parent_id)
+        children = []
+        for child_id, child_datastorage_id, child_min, child_max, child_bounds in _worker_children:
+            if parent_datastorage_id == child_datastorage_id: continue
+            if parent_candidates is not None and child_id not in parent_candidates: continue
+            if check_unary_IND(_worker_connector, _worker_value_cache, parent_id, parent_values, parent_bounds,
+                               child_id, child_min, child_max, child_bounds):
+                children.append(child_id)
+        result[parent_id] = children
+    return result
@@ -55,7 +55,7 @@ class UACFinder:
 
         # Check for empty entries
         for attribute in attributes:
-            entries = self.connector.get_number_of_entries(attribute)
+            entries = self.connector.get_number_of_entry_nos(attribute)
             if entries < number_of_entries:
                 attributes_to_remove.append(attribute)
         # Remove attributes from list
@@ -68,6 +68,11 @@ class UACFinder:
         while combination_size <= len(attributes):
             attribut_combinations = itertools.combinations(attributes, combination_size)
             for combination in attribut_combinations:
+                if combination_size == 1:
+                    # Skip attributes, whose estimated number of distinct values is far below the number of entries.
+                    # A skipped key would be lost, so the interval is 10 standard errors wide (about 16 %)
+                    bounds = self.connector.get_approx_distinct_bounds(combination[0], num_std_errors=10)
+                    if bounds is not None and bounds[1] < number_of_entries: continue
                 number_of_unique_entries = self.connector.get_number_of_unique_entries_for_attributes(combination)
                 if number_of_entries == number_of_unique_entries:
                     #print(f"UAC found, attribute: {combination_string}")
@@ -0,0 +1,103 @@
+from collections import OrderedDict
+import sys
+
+class ValueSetCache:
+    """
+    Caches the value sets of attributes with a memory budget. If the budget is exceeded, the least recently used
+    value sets are evicted.
+    """
+
+    def __init__(self, connector, memory_budget=256):
+        """
+        Initializes an empty cache.
+
+        Args:
+            connector (DBConnector): An instance of DBConnector used for database connections.
+            memory_budget (int): Maximum memory of the cached value sets in MB. 0 disables the cache.
+        """
+        self.connector = connector
+        self.memory_budget = memory_budget * 1024 * 1024
+        self.value_sets = OrderedDict()
+        self.sizes = {}
+        self.bytes_held = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_value_set(self, attribute_id):
+        """
+        Returns the set of values of the attribute. The values are loaded from the database if they aren't cached.
+
+        Args:
+            attribute_id (int): The Attribute ID of the Attribute.
+
+        Returns:
+            set: The values of the attribute.
+        """
+        value_set = self.value_sets.get(attribute_id)
+        if value_set is not None:
+            self.hits += 1
+            self.value_sets.move_to_end(attribute_id)
+            return value_set
+        self.misses += 1
+        value_set = set(self.connector.get_values_for_attribute(attribute_id))
+        self._add_value_set(attribute_id, value_set)
+        return value_set
+
+    def is_cached(self, attribute_id):
+        """
+        Checks if the value set of the attribute is cached, without loading it.
+
+        Args:
+            attribute_id (int): The Attribute ID of the Attribute.
+
+        Returns:
+            bool: True if the value set is cached.
+        """
+        return attribute_id in self.value_sets
+
+    def _add_value_set(self, attribute_id, value_set):
+        """
+        Adds a value set to the cache and evicts the least recently used value sets until the budget is kept.
+        Value sets, that are bigger than the whole budget, aren't cached.
+
+        Args:
+            attribute_id (int): The Attribute ID of the Attribute.
+            value_set (set): The values of the attribute.
+        """
+        size = self._get_size(value_set)
+        if size > self.memory_budget:
+            return
+        while self.bytes_held + size > self.memory_budget:
+            evicted_id, _ = self.value_sets.popitem(last=False)
+            self.bytes_held -= self.sizes.pop(evicted_id)
+            self.evictions += 1
+        self.value_sets[attribute_id] = value_set
+        self.sizes[attribute_id] = size
+        self.bytes_held += size
+
+    def _get_size(self, value_set):
+        """
+        Estimates the memory of a value set.
+
+        Args:
+            value_set (set): The value set.
+
+        Returns:
+            int: The size in bytes.
+        """
+        return sys.getsizeof(value_set) + sum(sys.getsizeof(value) for value in value_set)
+
+    def get_metrics(self):
+        """
+        Returns the metrics of the cache.
+
+        Returns:
+            dict: Hits, misses, evictions and the bytes held by the cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "bytes_held": self.bytes_held
+        }
@@ -0,0 +1,60 @@
+import os
+import random
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from services.EntryBitmaps import EntryBitmap
+
+class TestEntryBitmap(unittest.TestCase):
+    """
+    Tests the entry bitmaps against sets of entry numbers, with sparse (tuple) and dense (bitset) chunks.
+    """
+
+    def generate_entry_nos(self, rng):
+        kind = rng.random()
+        if kind < 0.3:
+            # Sparse
+            return {rng.randint(1, 200000) for _ in range(rng.randint(0, 3000))}
+        if kind < 0.6:
+            # Dense without gaps
+            return set(range(1, rng.randint(1, 150000)))
+        # Dense with gaps
+        return {entry_no for entry_no in range(1, rng.randint(1, 140000)) if rng.random() < 0.9}
+
+    def test_against_sets(self):
+        rng = random.Random(1)
+        for _ in range(100):
+            entry_nos = self.generate_entry_nos(rng)
+            other_entry_nos = set(entry_nos) if rng.random() < 0.3 else self.generate_entry_nos(rng)
+            bitmap = EntryBitmap.from_entry_nos(sorted(entry_nos))
+            other_bitmap = EntryBitmap.from_entry_nos(other_entry_nos)
+            self.assertEqual(len(bitmap), len(entry_nos))
+            self.assertEqual(bitmap.get_max(), max(entry_nos) if entry_nos else None)
+            self.assertEqual(bitmap == other_bitmap, entry_nos == other_entry_nos)
+
+    def test_duplicates_and_order(self):
+        bitmap = EntryBitmap.from_entry_nos([5, 3, 5, 70000, 3])
+        self.assertEqual(bitmap, EntryBitmap.from_entry_nos([3, 5, 70000]))
+        self.assertEqual(len(bitmap), 3)
+        self.assertEqual(bitmap.get_max(), 70000)
+
+    def test_dense_and_sparse_chunks(self):
+        # A chunk with one missing entry is a bitset, the same entries in another chunk differ
+        entry_nos = [entry_no for entry_no in range(EntryBitmap.CHUNK_SIZE) if entry_no != 100]
+        bitmap = EntryBitmap.from_entry_nos(entry_nos)
+        self.assertIsInstance(bitmap.containers[0], int)
+        self.assertEqual(bitmap.get_max(), EntryBitmap.CHUNK_SIZE - 1)
+        self.assertNotEqual(bitmap, EntryBitmap.from_entry_nos(entry_nos + [100]))
+        shifted = EntryBitmap.from_entry_nos(entry_no + EntryBitmap.CHUNK_SIZE for entry_no in entry_nos)
+        self.assertNotEqual(bitmap, shifted)
+        self.assertEqual(shifted.get_max(), 2 * EntryBitmap.CHUNK_SIZE - 1)
+
+    def test_empty_bitmap(self):
+        bitmap = EntryBitmap.from_entry_nos([])
+        self.assertEqual(len(bitmap), 0)
+        self.assertIsNone(bitmap.get_max())
+        self.assertEqual(bitmap, EntryBitmap())
+        self.assertNotEqual(bitmap, EntryBitmap.from_entry_nos([0]))
+
+if __name__ == "__main__":
+    unittest.main()
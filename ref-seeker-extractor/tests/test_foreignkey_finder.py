@@ -0,0 +1,123 @@
+import os
+import random
+import sys
+import unittest
+import numpy as np
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from services.ForeignkeyFinder import ForeignkeyFinder
+
+class FakeConnector:
+    """
+    Returns the values of the attributes as strings, like the staging database.
+    """
+
+    def __init__(self, values):
+        self.values = values
+
+    def get_values_for_attribute(self, attribute_id):
+        return [str(value) for value in self.values[attribute_id]]
+
+def calculate_buckets_for_number(value_set, minimum, maximum, num_buckets):
+    """
+    Calculates the buckets of numbers like the former counting loop over the value set.
+    """
+    steps = (maximum - minimum) / num_buckets
+    count_smaller_or_equal = []
+    threshold = minimum
+    for _ in range(1, num_buckets):
+        threshold += steps
+        count_smaller_or_equal.append(sum(1 for entry in value_set if entry <= threshold))
+    count_smaller_or_equal.append(len(value_set))
+    return [(count - previous) / len(value_set)
+            for previous, count in zip([0] + count_smaller_or_equal, count_smaller_or_equal)]
+
+def calculate_buckets_for_string(parent_values, values, num_buckets):
+    """
+    Calculates the buckets of strings like the former queries, the bounds are the parent values at the quantiles.
+    """
+    sorted_parent_values = sorted(parent_values)
+    steps = len(parent_values) / num_buckets
+    count_smaller_or_equal = []
+    for i in range(1, num_buckets):
+        offset = min(round(steps * i), len(parent_values) - 1)
+        bound = sorted_parent_values[offset]
+        count_smaller_or_equal.append(sum(1 for value in values if value <= bound))
+    count_smaller_or_equal.append(len(values))
+    return [(count - previous) / len(values)
+            for previous, count in zip([0] + count_smaller_or_equal, count_smaller_or_equal)]
+
+class TestForeignkeyFinderBuckets(unittest.TestCase):
+    """
+    Tests the buckets of the bhattacharyya coefficient against the former calculation.
+    """
+
+    def setUp(self):
+        # Only the bucket methods are tested, so the calculation of the constructor is skipped
+        self.finder = ForeignkeyFinder.__new__(ForeignkeyFinder)
+        self.finder.histograms = {}
+        self.rng = random.Random(1)
+
+    def assert_buckets(self, buckets, expected):
+        self.assertEqual(len(buckets), len(expected))
+        for bucket, expected_bucket in zip(buckets, expected):
+            self.assertAlmostEqual(float(bucket), expected_bucket, places=12)
+
+    def assert_number_buckets(self, parent_values, child_values, number_type, num_buckets=20):
+        self.finder.connector = FakeConnector({1: parent_values, 2: child_values})
+        self.finder.histograms = {}
+        parent_buckets, child_buckets = self.finder._get_number_buckets(1, 2, number_type, num_buckets)
+        parent_set = set(parent_values)
+        child_set = set(child_values)
+        minimum = min(parent_set)
+        maximum = max(parent_set)
+        self.assert_buckets(parent_buckets, calculate_buckets_for_number(parent_set, minimum, maximum, num_buckets))
+        self.assert_buckets(child_buckets, calculate_buckets_for_number(child_set, minimum, maximum, num_buckets))
+
+    def test_integer_buckets(self):
+        for _ in range(100):
+            parent_values = [self.rng.randint(-50, 500) for _ in range(self.rng.randint(1, 200))]
+            child_values = [self.rng.randint(-50, 500) for _ in range(self.rng.randint(1, 200))]
+            self.assert_number_buckets(parent_values, child_values, "int")
+
+    def test_float_buckets(self):
+        for _ in range(100):
+            parent_values = [round(self.rng.uniform(-5, 50), self.rng.randint(0, 3))
+                             for _ in range(self.rng.randint(1, 200))]
+            child_values = [round(self.rng.uniform(-5, 50), self.rng.randint(0, 3))
+                            for _ in range(self.rng.randint(1, 200))]
+            self.assert_number_buckets(parent_values, child_values, "float")
+
+    def test_large_integer_buckets(self):
+        for base, span in ((2 ** 62, 2 ** 40), (-2 ** 63, 2 ** 64 - 1), (2 ** 70, 2 ** 64), (0, 10 ** 3)):
+            parent_values = [base + self.rng.randint(0, span) for _ in range(50)]
+            # Values next to the thresholds, where a rounded threshold would count them in the wrong bucket
+            steps = (max(parent_values) - min(parent_values)) / 20
+            threshold = min(parent_values)
+            for _ in range(1, 20):
+                threshold += steps
+                parent_values.extend(int(threshold) + offset for offset in (-1, 0, 1))
+            child_values = [value + self.rng.choice([-1, 0, 1]) for value in parent_values]
+            self.assert_number_buckets(parent_values, child_values, "int")
+
+    def test_calculate_buckets_for_number(self):
+        values = [1, 2, 4, 8, 9, 10]
+        buckets = self.finder._calculate_buckets_for_number(np.array(values), 1, 10, 3)
+        self.assert_buckets(buckets, calculate_buckets_for_number(set(values), 1, 10, 3))
+
+    def test_string_buckets(self):
+        for _ in range(100):
+            values = {attribute_id: ["".join(self.rng.choice("abcXY'") for _ in range(self.rng.randint(1, 4)))
+                                     for _ in range(self.rng.randint(1, 150))]
+                      for attribute_id in (1, 2)}
+            self.finder.connector = FakeConnector(values)
+            self.finder.histograms = {}
+            parent_buckets, child_buckets = self.finder._get_string_buckets(1, 2, 20)
+            self.assert_buckets(parent_buckets, calculate_buckets_for_string(values[1], values[1], 20))
+            self.assert_buckets(child_buckets, calculate_buckets_for_string(values[1], values[2], 20))
+
+    def test_calculate_buckets_for_string(self):
+        buckets = self.finder._calculate_buckets_for_string(["a", "b", "b", "c", "d"], ["b", "c"])
+        self.assert_buckets(buckets, [0.6, 0.2, 0.2])
+
+if __name__ == "__main__":
+    unittest.main()
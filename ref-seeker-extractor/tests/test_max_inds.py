@@ -0,0 +1,110 @@
+import itertools
+import os
+import random
+import sys
+import time
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from services.Containers import ContainerAttributes
+from services.InclusionDependencies import INDFinder
+
+class FakeConnector:
+    """
+    Returns the values of the attributes as rows of (entry number, attribute ID, value).
+    """
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def get_values_ordered_by_entry_no(self, list_attribute_ids):
+        return iter(sorted(row for row in self.rows if row[1] in list_attribute_ids))
+
+    def check_if_attribut_has_a_appropriate_entry_no(self, list_attribute_ids):
+        attributes_by_entry_no = {}
+        for entry_no, attribute_id, _ in self.rows:
+            if attribute_id in list_attribute_ids:
+                attributes_by_entry_no.setdefault(entry_no, set()).add(attribute_id)
+        return all(len(attribute_ids) == len(list_attribute_ids) for attribute_ids in attributes_by_entry_no.values())
+
+def get_tuples(rows, list_attribute_ids):
+    """
+    Returns the value tuples of the entries, that have a value for all attributes.
+    """
+    values_by_entry_no = {}
+    for entry_no, attribute_id, value in rows:
+        if attribute_id in list_attribute_ids:
+            values_by_entry_no.setdefault(entry_no, {})[attribute_id] = value
+    return {tuple(values[attribute_id] for attribute_id in list_attribute_ids)
+            for values in values_by_entry_no.values() if len(values) == len(list_attribute_ids)}
+
+def find_max_INDs(rows, parent_ids, child_ids):
+    """
+    Finds the maximal INDs by testing all combinations of parents and children.
+    """
+    valid_INDs = set()
+    for size in range(1, len(parent_ids) + 1):
+        for list_parent_ids in itertools.combinations(parent_ids, size):
+            for list_child_ids in itertools.permutations(child_ids, size):
+                child_tuples = get_tuples(rows, list(list_child_ids))
+                if child_tuples and child_tuples <= get_tuples(rows, list(list_parent_ids)):
+                    valid_INDs.add(frozenset(zip(list_parent_ids, list_child_ids)))
+    return {ind for ind in valid_INDs if not any(ind < other_ind for other_ind in valid_INDs)}
+
+class TestMaxINDSearch(unittest.TestCase):
+    """
+    Tests the level-wise search of the maximal INDs against a test of all combinations.
+    """
+
+    def create_finder(self, rng, num_parents=5, num_children=5, num_entries=12, domain=3):
+        parent_ids = list(range(1, num_parents + 1))
+        child_ids = list(range(num_parents + 1, num_parents + num_children + 1))
+        parent_entries = [[str(rng.randint(0, domain)) for _ in parent_ids] for _ in range(num_entries)]
+        rows = []
+        for entry_no, values in enumerate(parent_entries, 1):
+            rows.extend((entry_no, attribute_id, value) for attribute_id, value in zip(parent_ids, values))
+        # Most child values are copied from a parent entry, so there are N-ary INDs
+        for entry_no in range(1, num_entries // 2 + 1):
+            values = rng.choice(parent_entries)
+            for i, attribute_id in enumerate(child_ids):
+                value = values[i % num_parents] if rng.random() < 0.85 else str(rng.randint(0, domain))
+                rows.append((entry_no, attribute_id, value))
+        finder = INDFinder(FakeConnector(rows), True)
+        finder.containerAttributes = ContainerAttributes()
+        for attribute_id in parent_ids:
+            finder.containerAttributes.add_attribute(1, 1, 1, attribute_id)
+        for attribute_id in child_ids:
+            finder.containerAttributes.add_attribute(1, 1, 2, attribute_id)
+        parents = []
+        for parent_id in parent_ids:
+            parent = finder.containerAttributes.get_attribute(parent_id)
+            for child_id in child_ids:
+                if get_tuples(rows, [child_id]) <= get_tuples(rows, [parent_id]):
+                    parent.add_IND(finder.containerAttributes.get_attribute(child_id))
+            if parent.get_INDs():
+                parents.append(parent)
+        return finder, rows, parent_ids, child_ids, parents
+
+    def test_against_all_combinations(self):
+        rng = random.Random(1)
+        for _ in range(30):
+            finder, rows, parent_ids, child_ids, parents = self.create_finder(rng)
+            result, is_exhaustive = finder._search_max_INDs_levelwise(parents, 3)
+            self.assertTrue(is_exhaustive)
+            found_INDs = {frozenset(zip(ind["parent"], ind["child"])) for ind in result}
+            self.assertEqual(len(found_INDs), len(result))
+            self.assertEqual(found_INDs, find_max_INDs(rows, parent_ids, child_ids))
+            self.assertTrue(all(ind["coverage"] == 1.0 for ind in result))
+
+    def test_deadline(self):
+        finder, _, _, _, parents = self.create_finder(random.Random(2))
+        result, is_exhaustive = finder._search_max_INDs_levelwise(parents, 3, time.time() - 1)
+        # Only the unary INDs are found, if the deadline is passed
+        unary_INDs = {(parent.get_attribute_id(), child.get_attribute_id())
+                      for parent in parents for child in parent.get_INDs()}
+        self.assertTrue(all(len(ind["parent"]) == 1 for ind in result))
+        self.assertEqual({(ind["parent"][0], ind["child"][0]) for ind in result}, unary_INDs)
+        self.assertFalse(is_exhaustive)
+        self.assertEqual(finder.max_ind_metrics["number_of_candidates"], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import random
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from services.PrimarykeyFinder import PrimarykeyFinder
+
+SCORE_NAMES = ["score_cardinality", "score_valuelenght", "score_position", "score_namesuffix", "score_datatype"]
+
+class FakeConnector:
+    """
+    Returns the features of the attributes and stores the scores of the UACs in memory.
+    """
+
+    def __init__(self, attributes, UACs):
+        self.attributes = attributes
+        self.UACs = UACs
+        self.scores = {}
+        self.possibilities = {}
+
+    def get_UACs(self):
+        return [{"UAC_id": UAC_id, "server_id": 1, "database_id": 1, "datastorage_id": datastorage_id,
+                 "attributes": list_attribute_ids}
+                for UAC_id, (datastorage_id, list_attribute_ids) in self.UACs.items()]
+
+    def get_attribute_features(self):
+        return [{"attribute_id": attribute_id, "attribute_name": name, "max_value_length": max_value_length,
+                 "average_position": average_position, "attribute_types": attribute_types}
+                for attribute_id, (name, max_value_length, average_position, attribute_types)
+                in self.attributes.items()]
+
+    def add_UAC_PKscores_batch(self, list_scores):
+        for UAC_id, *scores in list_scores:
+            self.scores[UAC_id] = tuple(scores)
+
+    def calculate_PKscores_for_all_UACs(self, PKmetrics):
+        positions = [SCORE_NAMES.index(metric) for metric in PKmetrics]
+        return [(UAC_id, datastorage_id, sum(self.scores[UAC_id][i] for i in positions))
+                for UAC_id, (datastorage_id, _) in self.UACs.items()]
+
+    def add_UAC_possibilities_batch(self, list_possibilities):
+        for UAC_id, hopf_score, iris_score in list_possibilities:
+            self.possibilities[UAC_id] = (hopf_score, iris_score)
+
+def calculate_scores_per_UAC(attributes, list_attribute_ids, max_value_length, name_suffix):
+    """
+    Calculates the PK scores of one UAC like the former loop over the UACs.
+    """
+    cardinality = 1 / len(list_attribute_ids)
+    average = sum(attributes[attribute_id][1] for attribute_id in list_attribute_ids) / len(list_attribute_ids)
+    value_length = 1 / max(1, average - max_value_length)
+    list_positions = [attributes[attribute_id][2] for attribute_id in list_attribute_ids]
+    no_attributes_between = max(0, max(list_positions) - min(list_positions) - (len(list_attribute_ids) - 1))
+    position = ((1 / min(list_positions)) + (1 / (no_attributes_between + 1))) / 2
+    count_suffixes = sum(1 for attribute_id in list_attribute_ids
+                         if attributes[attribute_id][0].lower().endswith(tuple(name_suffix)))
+    name_suffix_score = count_suffixes / len(list_attribute_ids)
+    datatype = 0
+    for attribute_id in list_attribute_ids:
+        data_types = attributes[attribute_id][3]
+        if all(item in ("int") for item in data_types) or all(item in ("str") for item in data_types):
+            datatype = 1
+        elif (all(item in ("elementId") for item in data_types) or all(item in ("DBRef") for item in data_types)
+              or all(item in ("ObjectId") for item in data_types)):
+            datatype = 1
+            value_length = 1
+        else:
+            datatype = 0
+            break
+    return cardinality, value_length, position, name_suffix_score, datatype
+
+class TestPrimarykeyFinder(unittest.TestCase):
+    """
+    Tests the vectorized PK scores against the calculation per UAC.
+    """
+
+    def assert_scores(self, attributes, UACs, max_value_length=16, name_suffix=("id", "key", "no")):
+        connector = FakeConnector(attributes, UACs)
+        PrimarykeyFinder(connector, max_value_length, list(name_suffix))
+        for UAC_id, (_, list_attribute_ids) in UACs.items():
+            expected = calculate_scores_per_UAC(attributes, list_attribute_ids, max_value_length, name_suffix)
+            for score_name, score, expected_score in zip(SCORE_NAMES, connector.scores[UAC_id], expected):
+                self.assertAlmostEqual(score, expected_score, msg=f"UAC {UAC_id}: {score_name}")
+        return connector
+
+    def test_random_UACs(self):
+        rng = random.Random(1)
+        types = [["int"], ["str"], ["elementId"], ["DBRef"], ["ObjectId"], ["float"], ["int", "str"]]
+        attributes = {}
+        for attribute_id in range(1, 40):
+            attributes[attribute_id] = (rng.choice(["custId", "name", "order_no", "x", "KEY"]), rng.randint(1, 40),
+                                        rng.randint(1, 8) + rng.random(), rng.choice(types))
+        UACs = {UAC_id: (rng.randint(1, 5), rng.sample(list(attributes), rng.randint(1, 4)))
+                for UAC_id in range(1, 60)}
+        connector = self.assert_scores(attributes, UACs)
+        self.assertEqual(set(connector.possibilities), set(UACs))
+
+    def test_id_type_sets_value_length(self):
+        attributes = {
+            1: ("_id", 24, 1.0, ["ObjectId"]),
+            2: ("price", 40, 2.0, ["float"]),
+            3: ("ref", 40, 3.0, ["DBRef"]),
+            4: ("name", 40, 4.0, ["str"])
+        }
+        UACs = {
+            1: (1, [1, 2]), # ID type before another type
+            2: (1, [2, 1]), # Another type before the ID type
+            3: (1, [4, 3]), # ID type after a string
+            4: (1, [4])
+        }
+        connector = self.assert_scores(attributes, UACs)
+        self.assertEqual(connector.scores[1][1], 1.0)
+        self.assertLess(connector.scores[2][1], 1.0)
+        self.assertEqual(connector.scores[3][1], 1.0)
+        self.assertEqual(connector.scores[3][4], 1.0)
+
+if __name__ == "__main__":
+    unittest.main()
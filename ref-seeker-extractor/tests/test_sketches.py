@@ -0,0 +1,88 @@
+import os
+import random
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from services.Sketches import BloomFilter
+from services.Sketches import HyperLogLog
+
+class TestHyperLogLog(unittest.TestCase):
+    """
+    Tests the estimated number of distinct values and its bounds against the exact number.
+    """
+
+    def test_count(self):
+        rng = random.Random(1)
+        for number_of_values in (0, 1, 10, 100, 1000, 10000, 50000):
+            sketch = HyperLogLog()
+            values = {str(rng.random()) for _ in range(number_of_values)}
+            for value in values:
+                # Duplicates don't change the sketch
+                sketch.add(value)
+                sketch.add(value)
+            self.assertAlmostEqual(sketch.count(), len(values), delta=4 * sketch.get_relative_error() * len(values) + 1)
+
+    def test_bounds(self):
+        rng = random.Random(2)
+        for _ in range(50):
+            sketch = HyperLogLog()
+            values = {str(rng.randint(0, 10 ** 9)) for _ in range(rng.choice([1, 5, 50, 500, 5000]))}
+            for value in values:
+                sketch.add(value)
+            lower_bound, upper_bound = sketch.get_bounds()
+            self.assertLessEqual(lower_bound, len(values))
+            self.assertGreaterEqual(upper_bound, len(values))
+            wide_lower_bound, wide_upper_bound = sketch.get_bounds(num_std_errors=10)
+            self.assertLessEqual(wide_lower_bound, lower_bound)
+            self.assertGreaterEqual(wide_upper_bound, upper_bound)
+
+    def test_empty_sketch(self):
+        sketch = HyperLogLog()
+        self.assertEqual(sketch.count(), 0)
+        self.assertEqual(sketch.get_bounds()[0], 0)
+
+class TestBloomFilter(unittest.TestCase):
+    """
+    Tests the subset check of the Bloom filters, a filter of a subset must never be rejected.
+    """
+
+    def create_filter(self, values, **parameters):
+        bloom_filter = BloomFilter(**parameters)
+        for value in values:
+            bloom_filter.add(value)
+        return bloom_filter
+
+    def test_subsets(self):
+        rng = random.Random(1)
+        for _ in range(50):
+            parent_values = {str(rng.randint(0, 10 ** 6)) for _ in range(rng.randint(0, 2000))}
+            child_values = rng.sample(sorted(parent_values), rng.randint(0, len(parent_values)))
+            parent_filter = self.create_filter(parent_values)
+            self.assertTrue(self.create_filter(child_values).might_be_subset_of(parent_filter))
+            self.assertTrue(self.create_filter([]).might_be_subset_of(parent_filter))
+
+    def test_missing_values(self):
+        parent_filter = self.create_filter(str(value) for value in range(1000))
+        # With 1000 values, 4 hashes and 65536 bits a missing value has a false positive rate of about 0.0003
+        count_detected = sum(1 for value in range(1000, 1100)
+                             if not self.create_filter([str(value)]).might_be_subset_of(parent_filter))
+        self.assertGreaterEqual(count_detected, 95)
+        self.assertFalse(self.create_filter(["1", "x"]).might_be_subset_of(parent_filter))
+
+    def test_stored_bit_array(self):
+        bloom_filter = self.create_filter(["a", "b", "c"])
+        stored_filter = BloomFilter(bit_array=bloom_filter.to_bytes())
+        self.assertEqual(stored_filter.to_bytes(), bloom_filter.to_bytes())
+        self.assertTrue(bloom_filter.might_be_subset_of(stored_filter))
+        self.assertTrue(stored_filter.might_be_subset_of(bloom_filter))
+        stored_filter.add("d")
+        self.assertFalse(stored_filter.might_be_subset_of(bloom_filter))
+
+    def test_other_parameters(self):
+        # Filters with other parameters aren't comparable, the check never rejects
+        bloom_filter = self.create_filter(["a"])
+        self.assertTrue(bloom_filter.might_be_subset_of(self.create_filter(["b"], number_of_bits=1024)))
+        self.assertTrue(bloom_filter.might_be_subset_of(self.create_filter(["b"], number_of_hashes=2)))
+
+if __name__ == "__main__":
+    unittest.main()
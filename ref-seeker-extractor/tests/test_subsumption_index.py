@@ -0,0 +1,48 @@
+import os
+import random
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from services.SubsumptionIndex import SubsumptionIndex
+
+class TestSubsumptionIndex(unittest.TestCase):
+    """
+    Tests the subsumption index against a scan over all stored INDs.
+    """
+
+    def test_against_scan(self):
+        rng = random.Random(1)
+        pairs = [(parent_id, child_id) for parent_id in range(1, 6) for child_id in range(6, 11)]
+        for _ in range(50):
+            index = SubsumptionIndex()
+            stored_INDs = [set(rng.sample(pairs, rng.randint(1, 6))) for _ in range(rng.randint(0, 15))]
+            for ind in stored_INDs:
+                index.add(list(ind))
+            for _ in range(50):
+                candidate = set(rng.sample(pairs, rng.randint(1, 4)))
+                expected = any(candidate <= ind for ind in stored_INDs)
+                self.assertEqual(index.is_covered(list(candidate)), expected)
+
+    def test_order_of_pairs(self):
+        index = SubsumptionIndex()
+        index.add([(3, 13), (1, 11), (2, 12)])
+        self.assertTrue(index.is_covered([(2, 12), (1, 11)]))
+        self.assertTrue(index.is_covered([(3, 13), (1, 11)]))
+        self.assertTrue(index.is_covered([(3, 13), (2, 12), (1, 11)]))
+        # Same attributes in other pairs
+        self.assertFalse(index.is_covered([(1, 12), (2, 11)]))
+        self.assertFalse(index.is_covered([(1, 11), (4, 14)]))
+
+    def test_shared_prefix_and_metrics(self):
+        index = SubsumptionIndex()
+        index.add([(1, 11), (2, 12)])
+        index.add([(1, 11), (3, 13)])
+        self.assertFalse(index.is_covered([(2, 12), (3, 13)]))
+        self.assertTrue(index.is_covered([]))
+        metrics = index.get_metrics()
+        self.assertEqual(metrics["number_of_nodes"], 3)
+        self.assertEqual(metrics["number_of_INDs"], 2)
+        self.assertEqual(metrics["number_of_lookups"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
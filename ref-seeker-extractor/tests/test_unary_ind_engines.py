@@ -0,0 +1,55 @@
+import os
+import sys
+import unittest
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from services.Containers import ContainerAttributes
+from services.UnaryINDEngines import SpiderEngine
+from services.UnaryINDEngines import InvertedIndexEngine
+
+class FakeConnector:
+    """
+    Returns the raw values of the attributes, like the staging database without a collation.
+    """
+
+    def __init__(self, values):
+        self.values = values
+
+    def get_sorted_values_for_attribute(self, attribute_id):
+        return iter(sorted(self.values[attribute_id]))
+
+    def get_attribute_values(self):
+        for attribute_id, values in self.values.items():
+            for value in values:
+                yield attribute_id, value
+
+class TestUnaryINDEngines(unittest.TestCase):
+    """
+    Tests the unary IND engines with values, that differ only in case or trailing spaces.
+    """
+
+    def setUp(self):
+        # Attribute ID: (datastorage ID, values)
+        attributes = {
+            1: (1, ["a", "b"]), # Parent
+            2: (2, ["A", "b"]), # Differs in case
+            3: (3, ["a ", "b"]), # Differs in trailing spaces
+            4: (4, ["a", "b", "a"]), # IND
+            5: (5, ["a", "A"]), # Parent with both variants
+            6: (6, ["A"]) # IND of 5 only
+        }
+        self.containerAttributes = ContainerAttributes()
+        for attribute_id, (datastorage_id, _) in attributes.items():
+            self.containerAttributes.add_attribute(1, 1, datastorage_id, attribute_id)
+        self.connector = FakeConnector({attribute_id: values for attribute_id, (_, values) in attributes.items()})
+        self.expected = {1: {4}, 5: {6}}
+
+    def test_spider_engine(self):
+        result = SpiderEngine(self.connector).find_unary_INDs(self.containerAttributes, [1, 5])
+        self.assertEqual(result, self.expected)
+
+    def test_inverted_index_engine(self):
+        result = InvertedIndexEngine(self.connector).find_unary_INDs(self.containerAttributes, [1, 5])
+        self.assertEqual(result, self.expected)
+
+if __name__ == "__main__":
+    unittest.main()